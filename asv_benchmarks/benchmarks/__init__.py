@@ -0,0 +1,3 @@
+"""
+Benchmark suite for mathematica, run with asv from the asv_benchmarks directory
+"""
@@ -0,0 +1,103 @@
+"""
+Memory Usage Benchmarks
+(Peak memory per element of data loading, fitting and batch evaluation)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import os
+import tempfile
+import numpy as np
+from mathematica import Gaussian
+from mathematica.memoryAccounting import track_memory
+
+SIZE = 1000000
+
+#Largest accepted peak bytes per element, a track above its budget fails the benchmark
+BUDGETS = {
+	"read_data_file": 24,
+	"read_data_file_counted": 96,
+	"read_data_file_float32": 12,
+	"fit": 8,
+	"pdf": 16,
+}
+
+def _check(name,report):
+	"""
+	Function to compare a memory report with its budget
+
+	Args:
+		name(string): Key of BUDGETS
+		report(MemoryReport): Report of the measured region
+
+	Returns:
+		bytesPerElement(float): Peak bytes per element of the region
+
+	Raises:
+		AssertionError(string): Raised when the region needs more memory per element than its budget
+	"""
+	if report.bytesPerElement > BUDGETS[name]:
+		raise AssertionError("{} needs {:.1f} bytes per element, the budget is {}".format(name,report.bytesPerElement,BUDGETS[name]))
+	return report.bytesPerElement
+
+class MemorySuite:
+	"""
+	Benchmarks of the peak memory of loading a text file of SIZE values, fitting from it and
+	evaluating the pdf on it, as seen by asv (peakmem_) and by tracemalloc (track_)
+	"""
+	timeout = 300
+
+	def setup_cache(self):
+		directory = tempfile.mkdtemp()
+		path = os.path.join(directory,"data.txt")
+		np.savetxt(path,np.random.default_rng(0).normal(size=SIZE),fmt="%.10g")
+		binary = os.path.join(directory,"data.f32")
+		np.random.default_rng(0).normal(size=SIZE).astype(np.float32).tofile(binary)
+		return path, binary
+
+	def setup(self,paths):
+		self.x = np.linspace(-4,4,SIZE)
+
+	def peakmem_read_data_file(self,paths):
+		Gaussian().read_data_file(paths[0])
+
+	def peakmem_pdf(self,paths):
+		Gaussian().pdf(self.x)
+
+	def track_read_data_file(self,paths):
+		distribution = Gaussian()
+		with track_memory("read_data_file",instance=distribution) as report:
+			distribution.read_data_file(paths[0])
+		return _check("read_data_file",report)
+
+	def track_read_data_file_counted(self,paths):
+		distribution = Gaussian()
+		with track_memory("read_data_file_counted",instance=distribution) as report:
+			distribution.read_data_file(paths[0],counted=True)
+		return _check("read_data_file_counted",report)
+
+	def track_read_data_file_float32(self,paths):
+		distribution = Gaussian()
+		with track_memory("read_data_file_float32",instance=distribution,snapshots=False) as report:
+			distribution.read_data_file(paths[1],dtype=np.float32)
+		#A memory mapped file has no traced buffer, so the sampled copy is what counts
+		return _check("read_data_file_float32",report)
+
+	def track_fit(self,paths):
+		distribution = Gaussian()
+		distribution.read_data_file(paths[0])
+		with track_memory("fit",elements=SIZE) as report:
+			distribution.calculate_mean()
+			distribution.calculate_stdev()
+		return _check("fit",report)
+
+	def track_pdf(self,paths):
+		with track_memory("pdf",elements=SIZE) as report:
+			Gaussian().pdf(self.x)
+		return _check("pdf",report)
+
+	track_read_data_file.unit = "bytes per element"
+	track_read_data_file_counted.unit = "bytes per element"
+	track_read_data_file_float32.unit = "bytes per element"
+	track_fit.unit = "bytes per element"
+	track_pdf.unit = "bytes per element"
@@ -0,0 +1,51 @@
+"""
+Moving Statistics Benchmarks
+(Speed and accuracy of the sliding window estimators on drifting data)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from mathematica import MovingStatistics
+
+SIZE = 10000000
+#Largest accepted relative error of the window variance, a track above it fails the benchmark
+VARIANCE_BUDGET = 1e-8
+
+def _drifting():
+	"""
+	Function to draw data with a linear drift, x(t) = 0.01 t + N(0,1)
+
+	Args:
+		none
+
+	Returns:
+		data(ndarray): Benchmark data
+	"""
+	return 0.01 * np.arange(SIZE) + np.random.default_rng(0).normal(size=SIZE)
+
+class MovingStatisticsSuite:
+	"""
+	Benchmarks of one large chunk through the sliding window, and the variance error on drifting data
+	"""
+	params = ([100,10000],)
+	param_names = ["window"]
+	timeout = 300
+
+	def setup(self,window):
+		self.data = _drifting()
+
+	def time_rolling(self,window):
+		MovingStatistics(window).rolling(self.data)
+
+	def track_variance_error(self,window):
+		variance = MovingStatistics(window).rolling(self.data)["variance"]
+		#Exact window variances at a few thousand positions spread over the chunk
+		positions = np.linspace(window,SIZE - 1,2000).astype(np.int64)
+		exact = np.array([np.var(self.data[position - window + 1:position + 1],ddof=1) for position in positions])
+		error = float(np.max(np.abs(variance[positions] - exact) / exact))
+		if error > VARIANCE_BUDGET:
+			raise AssertionError("window variance has relative error {:.3g}, the budget is {}".format(error,VARIANCE_BUDGET))
+		return error
+
+	track_variance_error.unit = "relative error"
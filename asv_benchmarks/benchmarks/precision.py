@@ -0,0 +1,97 @@
+"""
+Precision Benchmarks
+(Speed of the single precision kernels and their errors against the documented bounds)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from mathematica import Arcsine, BoundedArcsine, Bradford, Burr, Exponential, F, Gaussian, InverseGaussian, Laplace, Levy, LogLogistic, Reciprocal, Trapezoidal, Uniform
+from mathematica import use_precision
+from mathematica.precision import ERROR_BOUNDS, measure_error
+
+SIZE = 1000000
+ACCURACY_SIZE = 200001
+PROBABILITIES = np.linspace(0.001,0.999,ACCURACY_SIZE)
+
+#Instances and ranges at which ERROR_BOUNDS are measured
+CASES = {
+	"Uniform": (lambda: Uniform(1,3),1,3),
+	"Trapezoidal": (lambda: Trapezoidal(1,2,3,4),1,4),
+	"Arcsine": (lambda: Arcsine(),0.001,0.999),
+	"BoundedArcsine": (lambda: BoundedArcsine(-1,3),-0.99,2.99),
+	"Reciprocal": (lambda: Reciprocal(1,10),1,10),
+	"Bradford": (lambda: Bradford(2,1,5),1,5),
+	"Burr": (lambda: Burr(1,2,3),0.01,5),
+	"LogLogistic": (lambda: LogLogistic(1,3),0.01,8),
+	"InverseGaussian": (lambda: InverseGaussian(1,2),0.05,6),
+	"Levy": (lambda: Levy(1,0),0.05,50),
+	"F": (lambda: F(4,9),0.01,10),
+	"Gaussian": (lambda: Gaussian(1,2),-5,7),
+	"Exponential": (lambda: Exponential(2),0,5),
+	"Laplace": (lambda: Laplace(0,1),-8,8),
+}
+
+class PrecisionSuite:
+	"""
+	Benchmarks of the pdf and cdf kernels and of sampling in double and single precision
+	"""
+	params = (["Laplace","Exponential","BoundedArcsine","Reciprocal"],["double","single"])
+	param_names = ["distribution","precision"]
+
+	def setup(self,distribution,precision):
+		factory, lo, hi = CASES[distribution]
+		self.distribution = factory()
+		self.x = np.linspace(lo,hi,SIZE).astype(np.float64 if precision == "double" else np.float32)
+
+	def time_pdf(self,distribution,precision):
+		with use_precision(precision):
+			self.distribution.pdf(self.x)
+
+	def time_cdf(self,distribution,precision):
+		with use_precision(precision):
+			self.distribution.cdf(self.x)
+
+	def time_sample(self,distribution,precision):
+		with use_precision(precision):
+			self.distribution.sample(SIZE,seed=0)
+
+class DensitySuite:
+	"""
+	Benchmarks of the pdf kernels of distributions without a cdf or sampler of their own
+	"""
+	params = (["Gaussian","Burr","InverseGaussian","F"],["double","single"])
+	param_names = ["distribution","precision"]
+
+	def setup(self,distribution,precision):
+		factory, lo, hi = CASES[distribution]
+		self.distribution = factory()
+		self.x = np.linspace(lo,hi,SIZE).astype(np.float64 if precision == "double" else np.float32)
+
+	def time_pdf(self,distribution,precision):
+		with use_precision(precision):
+			self.distribution.pdf(self.x)
+
+	def time_logpdf(self,distribution,precision):
+		with use_precision(precision):
+			self.distribution.logpdf(self.x)
+
+class AccuracySuite:
+	"""
+	Largest error of every single precision kernel as a fraction of its bound in ERROR_BOUNDS,
+	a value above 1 breaks the documented bound
+	"""
+	params = ([(name,method) for name in CASES for method in ERROR_BOUNDS[name]],)
+	param_names = ["kernel"]
+
+	def setup(self,kernel):
+		name, method = kernel
+		factory, lo, hi = CASES[name]
+		self.distribution = factory()
+		self.x = PROBABILITIES if method == "ppf" else np.linspace(lo,hi,ACCURACY_SIZE)
+
+	def track_error_ratio(self,kernel):
+		name, method = kernel
+		return measure_error(self.distribution,method,self.x) / ERROR_BOUNDS[name][method]
+
+	track_error_ratio.unit = "fraction of bound"
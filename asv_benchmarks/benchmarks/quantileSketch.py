@@ -0,0 +1,95 @@
+"""
+Quantile Sketch Benchmarks
+(Speed, memory and accuracy of the KLL sketch)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from mathematica import KLLSketch
+
+SIZE = 1000000
+CHUNKS = 100
+PROBABILITIES = np.linspace(0.001,0.999,999)
+#Offset of the data of the standard deviation check, large enough for Σx² - n·mean² to cancel
+OFFSET = 1e9
+#Largest accepted relative error of the standard deviation, a track above it fails the benchmark
+STDEV_BUDGET = 1e-6
+
+def _data(distribution):
+	"""
+	Function to draw the benchmark data
+
+	Args:
+		distribution(string): "normal", "lognormal" or "sorted"
+
+	Returns:
+		data(ndarray): Benchmark data
+	"""
+	rng = np.random.default_rng(0)
+	if distribution == "normal":
+		return rng.normal(size=SIZE)
+	if distribution == "lognormal":
+		return rng.lognormal(size=SIZE)
+	#Sorted input is the adversarial order for compactors
+	return np.sort(rng.normal(size=SIZE))
+
+class KLLSketchSuite:
+	"""
+	Benchmarks of updates, merges and queries, plus the observed and bounded rank errors
+	"""
+	params = ([100,200,400],["normal","lognormal","sorted"])
+	param_names = ["k","distribution"]
+
+	def setup(self,k,distribution):
+		self.data = _data(distribution)
+		self.sorted = np.sort(self.data)
+		self.sketch = KLLSketch(k,seed=0)
+		for chunk in np.array_split(self.data,CHUNKS):
+			self.sketch.update(chunk)
+
+	def time_update(self,k,distribution):
+		sketch = KLLSketch(k,seed=0)
+		for chunk in np.array_split(self.data,CHUNKS):
+			sketch.update(chunk)
+
+	def time_merge(self,k,distribution):
+		left = KLLSketch(k,seed=1)
+		left.update(self.data[:SIZE // 2])
+		right = KLLSketch(k,seed=2)
+		right.update(self.data[SIZE // 2:])
+		left.merge(right)
+
+	def time_ppf(self,k,distribution):
+		self.sketch._sorted = None
+		self.sketch.ppf(PROBABILITIES)
+
+	def peakmem_update(self,k,distribution):
+		sketch = KLLSketch(k,seed=0)
+		for chunk in np.array_split(self.data,CHUNKS):
+			sketch.update(chunk)
+
+	def track_retained(self,k,distribution):
+		return len(self.sketch)
+
+	def track_rank_error(self,k,distribution):
+		estimate = self.sketch.ppf(PROBABILITIES)
+		rank = np.searchsorted(self.sorted,estimate,side="right") / SIZE
+		return float(np.abs(rank - PROBABILITIES).max())
+
+	def track_rank_error_bound(self,k,distribution):
+		return self.sketch.rank_error(0.01)
+
+	def track_stdev_error(self,k,distribution):
+		sketch = KLLSketch(k,seed=0)
+		for chunk in np.array_split(self.data + OFFSET,CHUNKS):
+			sketch.update(chunk)
+		exact = float(np.std(self.data,ddof=1))
+		error = abs(sketch.calculate_stdev() - exact) / exact
+		if error > STDEV_BUDGET:
+			raise AssertionError("standard deviation has relative error {:.3g}, the budget is {}".format(error,STDEV_BUDGET))
+		return error
+
+	track_rank_error.unit = "normalized rank"
+	track_rank_error_bound.unit = "normalized rank"
+	track_stdev_error.unit = "relative error"
@@ -1,40 +1,70 @@
 from .arcsineDistribution import Arcsine
 from .arcsineDistribution import BoundedArcsine
+from .chebyshevApproximation import ApproximatedDistribution
+from .hypothesisTesting import AnovaTest
 
 from .batesDistribution import Bates
+from .bayesianTesting import BayesianABTest
 from .bernoulliDistribution import Bernoulli
 from .betaDistribution import Beta
+from .conjugateUpdaters import BetaGeometricUpdater
 from .binomialDistribution import Binomial
 from .bradfordDistribution import Bradford
 from .burrDistribution import Burr
 
 from .cauchyDistribution import Cauchy
+from .chebyshevApproximation import ChebyshevApproximant
+from .columnarReader import ColumnarReader
+
+from .dataCache import DataCache
+from .dispatch import Dispatcher
 
 from .erlangDistribution import Erlang
+from .empiricalDistribution import Empirical
+from .queueingTheory import ErlangQueue
 from .exponentialDistribution import Exponential
+from .movingStatistics import ExponentialMovingStatistics
 
 from .fDistribution import F
 
 from .gaussianDistribution import Gaussian
+from .conjugateUpdaters import GammaExponentialUpdater
+from .conjugateUpdaters import GammaPoissonUpdater
+from .differentialPrivacy import GaussianMechanism
 from .geometricDistribution import Geometric
+from .precision import get_precision
 
 from .inverseGaussianDistribution import InverseGaussian
 
+from .quantileSketch import KLLSketch
+
 from .laplaceDistribution import Laplace
+from .differentialPrivacy import LaplaceMechanism
 from .levyDistribution import Levy
 from .logLogisticDistribution import LogLogistic
 
+from .sequentialTesting import MixtureSPRT
+from .movingStatistics import MovingStatistics
+
 from .poissonDistribution import Poisson
+from .differentialPrivacy import PrivacyAccountant
+
+from .queueSimulator import QueueSimulator
 
 from .rayleighDistribution import Rayleigh
 from .reciprocalDistribution import Reciprocal
 
+from .sequentialTesting import SPRT
+from .precision import set_precision
+
 from .tDistribution import T
 from .trapezoidalDistribution import Trapezoidal
 
 from .weibullDistribution import Weibull
+from .hypothesisTesting import WelchTest
 
 from .uniformDistribution import Uniform
+from .precision import use_precision
 
 from .yuleSimonDistribution import YuleSimon
 
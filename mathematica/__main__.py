@@ -0,0 +1,345 @@
+"""
+Command Line Interface
+(Streaming batch evaluation, fitting and sampling: python -m mathematica)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import os
+import sys
+import inspect
+import argparse
+import numpy as np
+import mathematica
+from .columnarReader import _adapter	#Import columnarReader.py module
+from .dispatch import Dispatcher	#Import dispatch.py module
+from .generalDistribution import Distribution, _open	#Import generalDistribution.py module
+from .precision import set_precision	#Import precision.py module
+
+#Bytes read per chunk of input
+CHUNK_SIZE = 1 << 24
+#Values drawn per chunk of samples
+SAMPLE_BLOCK = 1 << 20
+#Binary formats and their dtypes
+FORMATS = {"f64": np.float64,"f32": np.float32}
+#Most significant digits formatted with numpy, beyond them ties are too frequent to pay off
+FAST_DIGITS = 12
+
+def _distributions():
+	"""
+	Function to list the distributions exported by the package
+
+	Args:
+		none
+
+	Returns:
+		distributions(dict): Maps lower case class names to classes
+	"""
+	return {name.lower(): cls for name,cls in vars(mathematica).items() if inspect.isclass(cls) and issubclass(cls,Distribution)}
+
+def _number(text):
+	"""
+	Function to parse a parameter, keeping integers integral
+
+	Args:
+		text(string): Parameter from the command line
+
+	Returns:
+		number(int/float): Parsed parameter
+	"""
+	try:
+		return int(text)
+	except ValueError:
+		return float(text)
+
+def _instance(parser,name,parameters):
+	"""
+	Function to build a distribution from its name and constructor parameters
+
+	Args:
+		parser(ArgumentParser): Parser reporting the errors
+		name(string): Class name, in any case
+		parameters(list): Positional constructor parameters as strings
+
+	Returns:
+		distribution(object): Distribution instance
+	"""
+	distributions = _distributions()
+	cls = distributions.get(name.lower())
+	if cls is None:
+		parser.error("unknown distribution {!r}, choose from {}".format(name,", ".join(sorted(distributions))))
+	try:
+		return cls(*[_number(parameter) for parameter in parameters])
+	except (TypeError,ValueError,ZeroDivisionError) as error:
+		parser.error("{}({}): {}".format(cls.__name__,", ".join(parameters),error))
+
+def _chunks(sources,inputFormat,chunkSize):
+	"""
+	Function to read numbers from files or stdin chunk by chunk
+
+	Args:
+		sources(list): File names, stdin when empty or "-"
+		inputFormat(string): "text" (whitespace separated), "f64" or "f32" (raw native endian)
+		chunkSize(int): Number of bytes read per chunk
+
+	Returns:
+		chunks(generator): Yields arrays, float64 for text input, the binary dtype otherwise
+	"""
+	reader = Distribution()
+	for source in sources or ["-"]:
+		source = sys.stdin.buffer if source == "-" else source
+		if inputFormat == "text":
+			yield from reader.read_data_chunks(source,chunkSize)
+			continue
+
+		dtype = np.dtype(FORMATS[inputFormat])
+		file, owned = _open(source,chunkSize)
+		try:
+			remainder = b""
+			while True:
+				block = file.read(chunkSize)
+				if not block:
+					break
+				#A value cut at the end of the block is completed by the next block
+				block = remainder + block
+				cut = len(block) - len(block) % dtype.itemsize
+				remainder = block[cut:]
+				if cut:
+					yield np.frombuffer(block,dtype=dtype,count=cut // dtype.itemsize)
+			if remainder:
+				raise ValueError("{} bytes at the end of the input do not make a whole {} value".format(len(remainder),inputFormat))
+		finally:
+			if owned:
+				file.close()
+
+def _format_scientific(values,digits):
+	"""
+	Function to format floats in scientific notation with numpy, rounding like "{:.(digits-1)e}"
+
+	Args:
+		values(ndarray): Values
+		digits(int): Significant digits, 1 to 17
+
+	Returns:
+		text(bytes): One value per line
+	"""
+	values = np.asarray(values,dtype=np.float64).ravel()
+	a = np.abs(values)
+	finite = np.isfinite(values)
+	nonzero = finite & (a > 0)
+	safe = np.where(nonzero,a,1.0)
+
+	def scaled(exponent):
+		#The power is split in two so that neither factor overflows for subnormal values
+		k = digits - 1 - exponent
+		return safe * np.power(10.0,k // 2) * np.power(10.0,k - k // 2)
+
+	exponent = np.floor(np.log10(safe)).astype(np.int64)
+	exact = scaled(exponent)
+	mantissa = np.rint(exact)
+	"""
+	Scaling rounds a few times, so values within that error of a rounding tie are
+	formatted by Python instead. So are those where log10 landed one decade off or
+	rounding carried into the next decade, whose tie would have to be tested again
+	"""
+	shift = (mantissa >= 10.0 ** digits) | (mantissa < 10.0 ** (digits - 1))
+	tie = nonzero & ((np.abs(exact % 1.0 - 0.5) < 16 * 10.0 ** digits * 2.0 ** -53) | shift)
+	mantissa = np.where(nonzero,mantissa,0).astype(np.int64)
+	exponent = np.where(nonzero,exponent,0)
+
+	#One row of bytes per value, zero bytes are dropped at the end
+	width = 2 + (digits > 1) + (digits - 1) + 5 + 1
+	rows = np.zeros((values.size,width),dtype=np.uint8)
+	rows[:,0] = np.where(np.signbit(values),ord("-"),0)
+	column = 1
+	for digit in range(digits):
+		rows[:,column] = (mantissa // 10 ** (digits - 1 - digit)) % 10 + ord("0")
+		column += 1
+		if digit == 0 and digits > 1:
+			rows[:,column] = ord(".")
+			column += 1
+	magnitude = np.abs(exponent)
+	rows[:,column] = ord("e")
+	rows[:,column + 1] = np.where(exponent < 0,ord("-"),ord("+"))
+	rows[:,column + 2] = np.where(magnitude >= 100,magnitude // 100 + ord("0"),0)
+	rows[:,column + 3] = (magnitude // 10) % 10 + ord("0")
+	rows[:,column + 4] = magnitude % 10 + ord("0")
+	rows[:,-1] = ord("\n")
+
+	for index in np.flatnonzero(tie | ~finite):
+		text = ("{:." + str(digits - 1) + "e}").format(values[index]).encode()
+		rows[index] = 0
+		rows[index,:len(text)] = np.frombuffer(text,dtype=np.uint8)
+		rows[index,-1] = ord("\n")
+	flat = rows.ravel()
+	return flat[flat != 0].tobytes()
+
+def _write(output,values,outputFormat,precision):
+	"""
+	Function to write values to a binary stream
+
+	Args:
+		output(file): Binary output stream
+		values(ndarray): Values to write
+		outputFormat(string): "text" (one value per line), "f64" or "f32"
+		precision(int): Significant digits of text output in scientific notation, None for the shortest exact form
+
+	Returns:
+		No return value
+	"""
+	if outputFormat != "text":
+		output.write(np.ascontiguousarray(values,dtype=FORMATS[outputFormat]).tobytes())
+		return
+	if not values.size:
+		return
+	if precision is not None and precision <= FAST_DIGITS:
+		output.write(_format_scientific(values,precision))
+		return
+	if precision is None:
+		text = "\n".join(map(repr,values.tolist()))
+	else:
+		text = "\n".join(map(("{:." + str(precision - 1) + "e}").format,values.tolist()))
+	output.write(text.encode() + b"\n")
+
+def _evaluate(arguments,parser):
+	"""
+	Function behind the eval subcommand
+
+	Args:
+		arguments(Namespace): Parsed arguments
+		parser(ArgumentParser): Parser reporting the errors
+
+	Returns:
+		No return value
+	"""
+	distribution = _instance(parser,arguments.distribution,arguments.parameters)
+	if not hasattr(distribution,arguments.method):
+		parser.error("{} has no {}".format(type(distribution).__name__,arguments.method))
+
+	#Every chunk takes the fastest route, methods without array support run element by element
+	dispatcher = Dispatcher()
+	output = sys.stdout.buffer
+	for chunk in _chunks(arguments.files,arguments.input_format,arguments.chunk_size):
+		_write(output,dispatcher.evaluate(distribution,arguments.method,chunk),arguments.output_format,arguments.digits)
+	output.flush()
+	dispatcher.close()
+
+def _fit(arguments,parser):
+	"""
+	Function behind the fit subcommand
+
+	Args:
+		arguments(Namespace): Parsed arguments
+		parser(ArgumentParser): Parser reporting the errors
+
+	Returns:
+		No return value
+	"""
+	distribution = _instance(parser,arguments.distribution,[])
+	try:
+		#Moments or counts are accumulated chunk by chunk, the data is never held whole
+		adapter = _adapter(distribution)
+	except TypeError:
+		parser.error("{} can not be fitted from a stream, fitting supports Gaussian, Laplace, Exponential and the discrete distributions".format(type(distribution).__name__))
+	count = 0
+	for chunk in _chunks(arguments.files,arguments.input_format,arguments.chunk_size):
+		adapter.update(np.asarray(chunk,dtype=np.float64))
+		count += chunk.size
+	if count == 0:
+		raise ValueError("no input values to fit")
+	adapter.finish()
+	print(distribution)
+
+def _sample(arguments,parser):
+	"""
+	Function behind the sample subcommand
+
+	Args:
+		arguments(Namespace): Parsed arguments
+		parser(ArgumentParser): Parser reporting the errors
+
+	Returns:
+		No return value
+	"""
+	distribution = _instance(parser,arguments.distribution,arguments.parameters)
+	if not hasattr(distribution,"ppf") and type(distribution).sample is Distribution.sample:
+		parser.error("{} has no sampler".format(type(distribution).__name__))
+
+	rng = np.random.default_rng(arguments.seed)
+	output = sys.stdout.buffer
+	for start in range(0,arguments.size,SAMPLE_BLOCK):
+		values = distribution.sample(min(SAMPLE_BLOCK,arguments.size - start),seed=rng)
+		_write(output,np.asarray(values),arguments.output_format,arguments.digits)
+	output.flush()
+
+def _parser():
+	"""
+	Function to build the argument parser
+
+	Args:
+		none
+
+	Returns:
+		parser(ArgumentParser): Parser of the three subcommands
+	"""
+	parser = argparse.ArgumentParser(prog="python -m mathematica",description="Stream numbers through the distributions of mathematica.")
+	subparsers = parser.add_subparsers(dest="command")
+	subparsers.required = True
+
+	shared = argparse.ArgumentParser(add_help=False)
+	shared.add_argument("--single",action="store_true",help="evaluate with the float32 kernels")
+	shared.add_argument("--output-format",choices=["text","f64","f32"],default="text",help="text lines or raw native endian floats (default: text)")
+	shared.add_argument("--digits",type=int,default=None,help="significant digits of text output in scientific notation, 12 or fewer are formatted fastest (default: shortest exact)")
+
+	reading = argparse.ArgumentParser(add_help=False)
+	reading.add_argument("--input-format",choices=["text","f64","f32"],default="text",help="whitespace separated text or raw native endian floats (default: text)")
+	reading.add_argument("--chunk-size",type=int,default=CHUNK_SIZE,help="bytes read per chunk (default: 16 MiB)")
+	reading.add_argument("--files",nargs="*",default=[],help="input files, gzip/bz2/xz/zstd are detected (default: stdin)")
+
+	evaluate = subparsers.add_parser("eval",parents=[shared,reading],help="evaluate pdf, logpdf, cdf or ppf on every input value")
+	evaluate.add_argument("method",choices=["pdf","logpdf","cdf","ppf"])
+	evaluate.add_argument("distribution",help="distribution name, eg. gaussian")
+	evaluate.add_argument("parameters",nargs="*",help="constructor parameters, in order")
+	evaluate.set_defaults(function=_evaluate)
+
+	fit = subparsers.add_parser("fit",parents=[reading],help="fit a distribution to the input values")
+	fit.add_argument("distribution",help="gaussian, laplace, exponential or a discrete distribution")
+	fit.set_defaults(function=_fit)
+
+	sample = subparsers.add_parser("sample",parents=[shared],help="draw random variates")
+	sample.add_argument("distribution",help="distribution name, eg. gaussian")
+	sample.add_argument("parameters",nargs="*",help="constructor parameters, in order")
+	sample.add_argument("--size",type=int,required=True,help="number of variates")
+	sample.add_argument("--seed",type=int,default=None,help="seed for reproducible draws")
+	sample.set_defaults(function=_sample)
+	return parser
+
+def main(argv=None):
+	"""
+	Function to run the command line interface
+
+	Args:
+		argv(list): Arguments, sys.argv[1:] for None
+
+	Returns:
+		status(int): Exit status
+	"""
+	parser = _parser()
+	arguments = parser.parse_args(argv)
+	if getattr(arguments,"digits",None) is not None and not 1 <= arguments.digits <= 17:
+		parser.error("--digits must be between 1 and 17")
+	if getattr(arguments,"single",False):
+		set_precision("single")
+	try:
+		arguments.function(arguments,parser)
+	except BrokenPipeError:
+		#The reader went away (eg. head), further writes to stdout are dropped
+		devnull = os.open(os.devnull,os.O_WRONLY)
+		os.dup2(devnull,sys.stdout.fileno())
+		return 1
+	except ValueError as error:
+		parser.exit(2,"{}: error: {}\n".format(parser.prog,error))
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -8,7 +8,8 @@ Arbitrary Bounded Support
 
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
 
 class Arcsine(Distribution):
 	"""
@@ -63,31 +64,62 @@ class Arcsine(Distribution):
 		Method to calculate probability density function for arcsine distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for arcsine distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when negative number passed for square root
+			pdf(float/ndarray): Probability density function for arcsine distribution, 0 outside [0,1]
 		"""
-		try:
-			part = math.sqrt(x * (1 - x))
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not 0 <= x <= 1:
+				return 0.0
+			product = x * (1 - x)
+			return 1 / (math.pi * math.sqrt(product)) if product > 0 else math.inf
+		def kernel(x):
 			"""
 				     1
 			f(x) = -------------
 				π √(x(1-x))
 			"""
-			return 1 / (math.pi * part)
+			with np.errstate(divide="ignore",invalid="ignore"):
+				pdf = 1 / (math.pi * np.sqrt(x * (1 - x)))
+			return np.where((x >= 0) & (x <= 1),pdf,0.0)
+		return _blockwise(kernel,x)
 
-		#If divided by zero, raise an error
-		except ZeroDivisionError as error:
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for arcsine distribution
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for arcsine distribution
+		"""
+		if isinstance(x,(int,float)):
+			return 2 / math.pi * math.asin(math.sqrt(min(max(x,0.0),1.0)))
+		def kernel(x):
+			#F(x) = 2/π arcsin(√x), x clipped to [0,1]
+			x = np.clip(x,0,1)
+			return 2 / math.pi * np.arcsin(np.sqrt(x))
+		return _blockwise(kernel,x)
 
-		#If negative number passed for square root, raise an error
-		except ValueError as error:
-			raise
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for arcsine distribution
+        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			return math.sin(math.pi * q / 2) ** 2 if 0 <= q <= 1 else math.nan
+		def kernel(q):
+			#Q(q) = sin²(πq/2)
+			return np.where((q >= 0) & (q <= 1),np.sin(math.pi * q / 2) ** 2,np.nan)
+		return _blockwise(kernel,q)
 
 	def __repr__(self):
 		"""
@@ -165,31 +197,63 @@ class BoundedArcsine(Distribution):
 		Method to calculate probability density function for arcsine distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for arcsine distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when negative number passed for square root
+			pdf(float/ndarray): Probability density function for arcsine distribution, 0 outside [a,b]
 		"""
-		try:
-			part = math.sqrt((x - self.a) * (self.b - x))
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not self.a <= x <= self.b:
+				return 0.0
+			product = (x - self.a) * (self.b - x)
+			return 1 / (math.pi * math.sqrt(product)) if product > 0 else math.inf
+		def kernel(x):
 			"""
 					  1
 			f(x;a,b) = ---------------, a ≤ x ≤ b
 				    π √(x-a)(b-x)
 			"""
-			return 1 / (math.pi * part)
+			with np.errstate(divide="ignore",invalid="ignore"):
+				pdf = 1 / (math.pi * np.sqrt((x - self.a) * (self.b - x)))
+			return np.where((x >= self.a) & (x <= self.b),pdf,0.0)
+		return _blockwise(kernel,x)
 
-		#If divided by zero, raise an error
-		except ZeroDivisionError as error:
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for arcsine distribution
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for arcsine distribution
+		"""
+		if isinstance(x,(int,float)):
+			x = min(max(x,self.a),self.b)
+			return 2 / math.pi * math.asin(math.sqrt((x - self.a) / (self.b - self.a)))
+		def kernel(x):
+			#F(x) = 2/π arcsin(√((x-a)/(b-a))), x clipped to [a,b]
+			x = np.clip(x,self.a,self.b)
+			return 2 / math.pi * np.arcsin(np.sqrt((x - self.a) / (self.b - self.a)))
+		return _blockwise(kernel,x)
 
-		#If negative number passed for square root, raise an error
-		except ValueError as error:
-			raise
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for arcsine distribution
+        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			return self.a + (self.b - self.a) * math.sin(math.pi * q / 2) ** 2 if 0 <= q <= 1 else math.nan
+		def kernel(q):
+			#Q(q) = a + (b-a) sin²(πq/2)
+			return np.where((q >= 0) & (q <= 1),self.a + (self.b - self.a) * np.sin(math.pi * q / 2) ** 2,np.nan)
+		return _blockwise(kernel,q)
 
 	def __repr__(self):
 		"""
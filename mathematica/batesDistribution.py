@@ -6,7 +6,158 @@ Bates Distribution
 # License: GNU General Public License v3.0
 
 import math
+import functools
+from fractions import Fraction
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .specialFunctions import erfc	#Import specialFunctions.py module
+
+#Sample size above which the Edgeworth expansion replaces the exact polynomials
+EXACT_LIMIT = 100
+#Dekker's splitting factor 2^27 + 1 for exact products
+SPLITTER = 134217729.0
+#Number of points evaluated together, bounds the temporaries
+BLOCK = 1 << 20
+#Standardized point beyond which the normal distribution function underflows
+NORMAL_LIMIT = 40.0
+
+def _split_coefficients(rows):
+	"""
+	Function to round exact coefficients to pairs of floats
+
+	Args:
+		rows(list): Exact coefficients of every piece, lowest degree first
+
+	Returns:
+		high(list): Nearest floats of every piece
+		low(list): Rounded remainders of every piece, so high + low carries about 106 bits
+	"""
+	high = [[float(c) for c in row] for row in rows]
+	low = [[float(c - Fraction(h)) for c,h in zip(row,highRow)] for row,highRow in zip(rows,high)]
+	return high, low
+
+@functools.lru_cache(maxsize=64)
+def _irwin_hall_pieces(n):
+	"""
+	Function to build the piecewise polynomials of the Irwin–Hall density and distribution function,
+	the sum S of n uniforms on [0,1], on the pieces [j,j+1] of the lower half of the support
+
+	Args:
+		n(int): Number of uniforms
+
+	Returns:
+		density(tuple): High and low parts of the coefficients of f(j+t) in t ∈ [0,1], one list per piece
+		distribution(tuple): High and low parts of the coefficients of F(j+t) in t ∈ [0,1], one list per piece
+	"""
+	factorial = math.factorial(n - 1)
+	density, distribution = [], []
+	knot = Fraction(0)
+	for j in range((n + 1) // 2):
+		"""
+		f(j+t) = 1/(n-1)! Σ[k=0..j] (-1)^k nCk (t+j-k)^(n-1), expanded exactly in powers of t
+		"""
+		coefficients = [0] * n
+		for k in range(j + 1):
+			sign = (-1) ** k * math.comb(n,k)
+			for m in range(n):
+				coefficients[m] += sign * math.comb(n - 1,m) * (j - k) ** (n - 1 - m)
+		density.append([Fraction(c,factorial) for c in coefficients])
+
+		#F(j+t) = F(j) + Σ c(m) t^(m+1) / (m+1)
+		integral = [knot] + [c / (m + 1) for m,c in enumerate(density[-1])]
+		distribution.append(integral)
+		knot += sum(integral[1:])
+	return _split_coefficients(density), _split_coefficients(distribution)
+
+def _horner(high,low,t,compensated):
+	"""
+	Function to evaluate one piece's polynomial with Horner's rule
+
+	Args:
+		high(list): Nearest floats of the coefficients, lowest degree first
+		low(list): Rounded remainders of the coefficients
+		t(ndarray): Positions inside the piece
+		compensated(bool): Whether to carry the rounding errors (compensated Horner, Graillat et al.)
+
+	Returns:
+		values(ndarray): Polynomial values
+	"""
+	result = np.full_like(t,high[-1])
+	if not compensated:
+		for coefficient in high[-2::-1]:
+			result *= t
+			result += coefficient
+		return result
+
+	#Error free transformations, t is split once
+	scaled = SPLITTER * t
+	tHigh = scaled - (scaled - t)
+	tLow = t - tHigh
+	error = np.full_like(t,low[-1])
+	for m in range(len(high) - 2,-1,-1):
+		product = result * t
+		scaled = SPLITTER * result
+		resultHigh = scaled - (scaled - result)
+		resultLow = result - resultHigh
+		productError = ((resultHigh * tHigh - product) + resultHigh * tLow + resultLow * tHigh) + resultLow * tLow
+		result = product + high[m]
+		virtual = result - product
+		sumError = (product - (result - virtual)) + (high[m] - virtual)
+		error = error * t + (productError + sumError + low[m])
+	return result + error
+
+def _edgeworth_terms(z,n):
+	"""
+	Function to evaluate the corrections of the Edgeworth expansion of the sum of n uniforms
+
+	Args:
+		z(ndarray): Standardized points
+		n(int): Sample size
+
+	Returns:
+		density(ndarray): p(z), with f(z) = φ(z) p(z)
+		distribution(ndarray): q(z), with F(z) = Φ(z) - φ(z) q(z)
+	"""
+	"""
+	Standardized cumulants of the sum: λ4 = -6/(5n), λ6 = 48/(7n²)
+
+	f(z) = φ(z) [1 + λ4/24 He4 + λ6/720 He6 + λ4²/1152 He8]
+	F(z) = Φ(z) - φ(z) [λ4/24 He3 + λ6/720 He5 + λ4²/1152 He7]
+	"""
+	lambda4 = -6 / (5 * n)
+	lambda6 = 48 / (7 * n * n)
+	#Probabilists' Hermite polynomials, He(k+1) = z He(k) - k He(k-1)
+	hermite = [np.ones_like(z),z]
+	for k in range(1,8):
+		hermite.append(z * hermite[k] - k * hermite[k - 1])
+
+	density = 1 + lambda4 / 24 * hermite[4] + lambda6 / 720 * hermite[6] + lambda4 * lambda4 / 1152 * hermite[8]
+	distribution = lambda4 / 24 * hermite[3] + lambda6 / 720 * hermite[5] + lambda4 * lambda4 / 1152 * hermite[7]
+	return density, distribution
+
+@functools.lru_cache(maxsize=64)
+def _edgeworth_tail(n):
+	"""
+	Function to find where the lower tail of the Edgeworth expansion stops being a distribution function
+
+	Args:
+		n(int): Sample size
+
+	Returns:
+		cutoff(float): Most negative z down to which the expansion is used
+		ratio(float): F(cutoff) / Φ(cutoff), the scale of the normal tail used below the cutoff
+	"""
+	"""
+	Walking outwards from the mean, the expansion is kept while its density stays nonnegative
+	(F is then monotone) and its correction takes at most half of Φ (F keeps its relative accuracy)
+	"""
+	z = -np.arange(0.0,NORMAL_LIMIT,1e-3)
+	density, distribution = _edgeworth_terms(z,n)
+	tail = 0.5 * np.asarray(erfc(-z / math.sqrt(2)))
+	normal = np.exp(-z * z / 2) / math.sqrt(2 * math.pi)
+	valid = (density >= 0) & (normal * distribution <= 0.5 * tail)
+	last = int(np.argmin(valid)) - 1 if not valid.all() else z.size - 1
+	return float(z[last]), float(1 - normal[last] * distribution[last] / tail[last])
 
 class Bates(Distribution):
 	"""
@@ -20,20 +171,30 @@ class Bates(Distribution):
 		1. n (sample size, k>0)
 		2. a (lower bound, a>0)
 		3. b (upper bound, b>0)
+		4. exactLimit (largest n evaluated with the exact polynomials)
 
 	Parameters:
 		-∞ < a < b < +∞
 
 	Support:
 		x ∈ [a,b]
+
+	Notes:
+		Up to exactLimit the density and distribution function are the Irwin–Hall polynomials,
+		built once per n from exact rationals and evaluated on the lower half of the support
+		(f is symmetric), where every piece's expansion has nonnegative terms. Above it they
+		are the Edgeworth expansion to order 1/n², which is not exact in the far tails: where
+		it would turn negative or non-monotone, a normal tail scaled to meet it takes over.
 	"""	
-	def __init__(self,sampleSize=12,lowerBound=0,upperBound=1):
+	def __init__(self,sampleSize=12,lowerBound=0,upperBound=1,exactLimit=EXACT_LIMIT):
 		#Default value of n = 12
 		self.n = sampleSize
 		#Default value of a = 0
 		self.a = lowerBound
 		#Default value of b = 1
 		self.b = upperBound
+		#Default value of exactLimit = 100
+		self.exactLimit = exactLimit
 
 		Distribution.__init__(self,self.calculate_mean(),self.calculate_stdev())
 
@@ -79,49 +240,147 @@ class Bates(Distribution):
 		except ZeroDivisionError as error:	
 			raise
 
-	def pdf(self,x):
+	def _standardize(self,x):
+		"""
+		Method to map points to the scale of the sum of n uniforms on [0,1]
+
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			s(ndarray): n(x-a)/(b-a)
+			n(int): Sample size
+
+		Raises:
+			ValueError(string): Raised when n is not a positive integer
+		"""
+		if not float(self.n).is_integer() or self.n < 1:
+			raise ValueError("sample size must be a positive integer")
+		n = int(self.n)
+		return n * (np.asarray(x,dtype=np.float64) - self.a) / (self.b - self.a), n
+
+	def _edgeworth(self,s,n):
+		"""
+		Method to approximate the density and distribution function of the sum with the Edgeworth expansion
+
+		Args:
+			s(ndarray): Points on the scale of the sum
+			n(int): Sample size
+
+		Returns:
+			density(ndarray): Approximate density of the sum
+			distribution(ndarray): Approximate distribution function of the sum
+		"""
+		scale = math.sqrt(n / 12)
+		z = (s - n / 2) / scale
+		#Only the lower half is evaluated, f(-z) = f(z) and F(-z) = 1 - F(z)
+		lower = -np.abs(z)
+		density, distribution = _edgeworth_terms(lower,n)
+		normal = np.exp(-lower * lower / 2) / math.sqrt(2 * math.pi)
+		#erfc keeps Φ accurate in the tail, where 1 + erf would round to 0
+		tail = 0.5 * np.asarray(erfc(-lower / math.sqrt(2)))
+
+		#Beyond the cutoff the expansion turns negative or non-monotone, the normal tail scaled to meet it is used
+		cutoff, ratio = _edgeworth_tail(n)
+		beyond = lower < cutoff
+		density = np.where(beyond,ratio * normal,normal * density) / scale
+		distribution = np.where(beyond,ratio * tail,tail - normal * distribution)
+		return density, np.where(z <= 0,distribution,1 - distribution)
+
+	def _irwin_hall(self,s,n,cumulative,compensated):
+		"""
+		Method to evaluate the exact density or distribution function of the sum in blocks
+
+		Args:
+			s(ndarray): Points on the scale of the sum
+			n(int): Sample size
+			cumulative(bool): Whether to evaluate the distribution function instead of the density
+			compensated(bool): Whether to use compensated Horner evaluation
+
+		Returns:
+			values(ndarray): f(s) or F(s), for points inside [0,n]
+		"""
+		density, distribution = _irwin_hall_pieces(n)
+		high, low = distribution if cumulative else density
+		pieces = len(high)
+
+		s = s.ravel()
+		values = np.empty_like(s)
+		for start in range(0,s.size,BLOCK):
+			block = s[start:start + BLOCK]
+			#f(s) = f(n-s) and F(s) = 1 - F(n-s), so only the lower half is stored
+			folded = np.clip(np.minimum(block,n - block),0,n / 2)
+			piece = np.minimum(folded.astype(np.intp),pieces - 1)
+
+			#Points are grouped by piece (radix sort of small integers), so every Horner step
+			#multiplies by a scalar coefficient instead of gathering one per point
+			order = np.argsort(piece.astype(np.uint8 if pieces < 256 else np.uint16),kind="stable")
+			t = (folded - piece)[order]
+			bounds = np.searchsorted(piece[order],np.arange(pieces + 1))
+			result = np.empty_like(t)
+			for j in range(pieces):
+				if bounds[j] < bounds[j + 1]:
+					result[bounds[j]:bounds[j + 1]] = _horner(high[j],low[j],t[bounds[j]:bounds[j + 1]],compensated)
+
+			unsorted = np.empty_like(result)
+			unsorted[order] = result
+			if cumulative:
+				unsorted = np.where(block > n / 2,1 - unsorted,unsorted)
+			values[start:start + BLOCK] = unsorted
+		return values
+
+	def pdf(self,x,compensated=False):
 		"""
 		Method to calculate probability density function for bates distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
+			compensated(bool): Whether to use compensated Horner evaluation with the rounded
+				remainders of the coefficients, to about one ulp but about 8 times slower
 
 		Returns:
-			pdf(float): Probability density function for bates distribution
+			pdf(float/ndarray): Probability density function for bates distribution
 
 		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			ValueError(string): Raised when n is not a positive integer
 		"""
-		try:
-			#r = n[(x-a)/(b-a)]
-			r = self.n * ((x - self.a) / (self.b - self.a))
-			#i = greatest integer ≤ r
-			i = math.ceil(r)
-			#nCk = binomial coefficient
-			nCk = math.factorial(int(self.n)) / (math.factorial(int(r)) * math.factorial(int(self.n - r)))
-
-			partA = self.n / ((self.b - self.a) * math.factorial(int(self.n - 1)))
-			partB = 0	#Lower bound value of partB
+		s, n = self._standardize(x)
+		"""
+		f(x;a,b,n) = n/(b-a) g(n(x-a)/(b-a)), g = Irwin–Hall density
 
-			#Value of Σ[(-1)^k·nCk·(r-k)^(n-1)]
-			for k in range(0,i):
-				partB += ((-1)**k) * nCk * ((r-k)**(self.n-1))
+		g(s) = 1/(n-1)! Σ[k=0..⌊s⌋] (-1)^k·nCk·(s-k)^(n-1)
+		"""
+		if n > self.exactLimit:
+			density = self._edgeworth(s,n)[0]
+		else:
+			density = self._irwin_hall(s,n,False,compensated).reshape(s.shape)
+		pdf = np.where((s >= 0) & (s <= n),density * n / (self.b - self.a),0.0)
+		return float(pdf) if pdf.ndim == 0 else pdf
 
-			"""
-					    n       i
-			f(x;a,b,n) =  ------------  Σ[(-1)^k·nCk·(r-k)^(n-1)]
-				       (b-a)(n-1)! k=0
-			"""
-			return partA * partB
+	def cdf(self,x,compensated=False):
+		"""
+		Method to calculate cumulative distribution function for bates distribution
+        
+		Args:
+			x(float/array): Random variable
+			compensated(bool): Whether to use compensated Horner evaluation
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for bates distribution
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Raises:
+			ValueError(string): Raised when n is not a positive integer
+		"""
+		s, n = self._standardize(x)
+		"""
+		F(x;a,b,n) = G(n(x-a)/(b-a)), G(s) = 1/n! Σ[k=0..⌊s⌋] (-1)^k·nCk·(s-k)^n
+		"""
+		if n > self.exactLimit:
+			distribution = self._edgeworth(s,n)[1]
+		else:
+			distribution = self._irwin_hall(s,n,True,compensated).reshape(s.shape)
+		cdf = np.where(s < 0,0.0,np.where(s > n,1.0,distribution))
+		return float(cdf) if cdf.ndim == 0 else cdf
 
 	def __add__(self,other):
 		"""
@@ -0,0 +1,254 @@
+"""
+Bayesian Testing
+(Beta-Bernoulli A/B testing and Thompson sampling)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import functools
+import numpy as np
+from .betaDistribution import Beta	#Import betaDistribution.py module
+from .specialFunctions import log_beta, regularized_incomplete_beta	#Import specialFunctions.py module
+
+#Largest number of terms summed by the closed form before switching to quadrature
+CLOSED_FORM_LIMIT = 20000
+#Gauss-Legendre nodes and weights on [-1,1] used by the quadrature
+LEGENDRE_NODES, LEGENDRE_WEIGHTS = np.polynomial.legendre.leggauss(256)
+
+@functools.lru_cache(maxsize=65536)
+def probability_b_beats_a(alphaA,betaA,alphaB,betaB):
+	"""
+	Function to calculate P(pB > pA) for pA ~ Beta(αA,βA) and pB ~ Beta(αB,βB)
+
+	Args:
+		alphaA(float): α of arm A
+		betaA(float): β of arm A
+		alphaB(float): α of arm B
+		betaB(float): β of arm B
+
+	Returns:
+		probability(float): P(pB > pA)
+	"""
+	#The closed form sums over the integer α of arm B, P(pB > pA) = 1 - P(pA > pB)
+	if float(alphaB).is_integer() and alphaB <= CLOSED_FORM_LIMIT and (alphaB <= alphaA or not float(alphaA).is_integer()):
+		return _closed_form(alphaA,betaA,alphaB,betaB)
+	if float(alphaA).is_integer() and alphaA <= CLOSED_FORM_LIMIT:
+		return 1.0 - _closed_form(alphaB,betaB,alphaA,betaA)
+	return _quadrature(alphaA,betaA,alphaB,betaB)
+
+def _closed_form(alphaA,betaA,alphaB,betaB):
+	"""
+	Function to evaluate P(pB > pA) with the exact finite sum, for integer αB
+
+	Args:
+		alphaA(float): α of arm A
+		betaA(float): β of arm A
+		alphaB(float): α of arm B (integer valued)
+		betaB(float): β of arm B
+
+	Returns:
+		probability(float): P(pB > pA)
+	"""
+	i = np.arange(int(alphaB),dtype=np.float64)
+	"""
+			   αB-1	  B(αA+i, βA+βB)
+	P(pB > pA) =  Σ   -------------------------------
+			   i=0  (βB+i) B(1+i, βB) B(αA, βA)
+	"""
+	logTerms = np.asarray(log_beta(alphaA + i,betaA + betaB)) - np.log(betaB + i) - np.asarray(log_beta(1 + i,betaB)) - log_beta(alphaA,betaA)
+	largest = logTerms.max()
+	probability = math.exp(largest) * float(np.exp(logTerms - largest).sum())
+	return min(max(probability,0.0),1.0)
+
+def _legendre_piece(lo,hi,exponent,fromLeft):
+	"""
+	Function to place Gauss-Legendre nodes on [lo,hi], graded towards an endpoint singularity
+
+	Args:
+		lo(float): Left end
+		hi(float): Right end
+		exponent(float): α (fromLeft) or β of the density, nodes are graded when it is below 1
+			and the piece touches 0 (fromLeft) or 1
+		fromLeft(bool): Whether the singular endpoint is 0 rather than 1
+
+	Returns:
+		logX(ndarray): ln x at the nodes
+		log1mX(ndarray): ln (1 - x) at the nodes
+		logWeights(ndarray): ln of the weights, including the jacobian of the substitution
+	"""
+	singular = exponent < 1 and (lo == 0.0 if fromLeft else hi == 1.0)
+	if not singular:
+		x = 0.5 * (hi - lo) * LEGENDRE_NODES + 0.5 * (hi + lo)
+		return np.log(x), np.log1p(-x), np.log(0.5 * (hi - lo) * LEGENDRE_WEIGHTS)
+
+	"""
+	x = u^(1/α) near 0 (or 1 - x = u^(1/β) near 1) turns x^(α-1) dx into du/α,
+	so the density is smooth in u. Logarithms are kept so tiny x does not underflow
+	"""
+	span = (hi if fromLeft else 1 - lo) ** exponent
+	u = 0.5 * span * (LEGENDRE_NODES + 1)
+	logNear = np.log(u) / exponent
+	logFar = np.log(-np.expm1(logNear))
+	logWeights = np.log(0.5 * span * LEGENDRE_WEIGHTS / exponent) + (1 / exponent - 1) * np.log(u)
+	return (logNear, logFar, logWeights) if fromLeft else (logFar, logNear, logWeights)
+
+def _quadrature(alphaA,betaA,alphaB,betaB):
+	"""
+	Function to evaluate P(pB > pA) = ∫ fA(x) (1 - I_x(αB,βB)) dx by Gauss-Legendre quadrature
+
+	Args:
+		alphaA(float): α of arm A
+		betaA(float): β of arm A
+		alphaB(float): α of arm B
+		betaB(float): β of arm B
+
+	Returns:
+		probability(float): P(pB > pA)
+	"""
+	total = alphaA + betaA
+	mean = alphaA / total
+	stdev = math.sqrt(alphaA * betaA / (total ** 2 * (total + 1)))
+
+	#Integrate over the region holding all but a negligible part of the mass of arm A,
+	#split at the mean so that each side can be graded towards its own singular end
+	lower = max(0.0,mean - 40 * stdev)
+	upper = min(1.0,mean + 40 * stdev)
+	pieces = [_legendre_piece(lower,mean,alphaA,True),_legendre_piece(mean,upper,betaA,False)]
+	logX, log1mX, logWeights = (np.concatenate(parts) for parts in zip(*pieces))
+
+	logDensity = (alphaA - 1) * logX + (betaA - 1) * log1mX - log_beta(alphaA,betaA)
+	survival = 1 - np.asarray(regularized_incomplete_beta(alphaB,betaB,np.exp(logX)))
+	probability = float((np.exp(logWeights + logDensity) * survival).sum())
+	return min(max(probability,0.0),1.0)
+
+class BayesianABTest:
+	"""
+	Bayesian A/B test class for Beta-Bernoulli experiments with several arms
+	Posteriors of every arm of every experiment are stored as arrays of α and β
+
+	Notation:
+		p ~ Beta(α0 + successes, β0 + failures)
+
+	Attributes:
+		1. alpha (posterior α, shape (experiments, arms))
+		2. beta (posterior β, shape (experiments, arms))
+		3. priorAlpha, priorBeta (parameters of the Beta prior)
+	"""
+	def __init__(self,arms=2,experiments=1,priorAlpha=1,priorBeta=1,seed=None):
+		self.arms = int(arms)
+		self.experiments = int(experiments)
+		self.priorAlpha = priorAlpha
+		self.priorBeta = priorBeta
+
+		self.alpha = np.full((self.experiments,self.arms),float(priorAlpha))
+		self.beta = np.full((self.experiments,self.arms),float(priorBeta))
+		self.rng = np.random.default_rng(seed)
+
+	def update(self,arms,successes,failures,experiments=0):
+		"""
+		Method to apply conjugate updates for batches of successes and failures
+
+		Args:
+			arms(int/array): Arm of each update
+			successes(int/array): Number of successes of each update
+			failures(int/array): Number of failures of each update
+			experiments(int/array): Experiment of each update
+
+		Returns:
+			No return value
+		"""
+		index = (np.asarray(experiments),np.asarray(arms))
+
+		#Unbuffered additions, so repeated (experiment, arm) pairs all count
+		np.add.at(self.alpha,index,np.asarray(successes,dtype=np.float64))
+		np.add.at(self.beta,index,np.asarray(failures,dtype=np.float64))
+
+	def update_outcomes(self,arms,outcomes,experiments=0):
+		"""
+		Method to apply conjugate updates for single bernoulli outcomes as they arrive
+
+		Args:
+			arms(int/array): Arm of each event
+			outcomes(int/array): 1 for a success and 0 for a failure
+			experiments(int/array): Experiment of each event
+
+		Returns:
+			No return value
+		"""
+		outcomes = np.asarray(outcomes,dtype=np.float64)
+		self.update(arms,outcomes,1 - outcomes,experiments)
+
+	def posterior(self,arm,experiment=0):
+		"""
+		Method to return the posterior of an arm as a Beta instance
+
+		Args:
+			arm(int): Arm index
+			experiment(int): Experiment index
+
+		Returns:
+			posterior(beta distribution): Beta(α, β) posterior of the arm
+		"""
+		return Beta(float(self.alpha[experiment,arm]),float(self.beta[experiment,arm]))
+
+	def probability_to_beat(self,armA=0,armB=1,experiment=0):
+		"""
+		Method to calculate the probability that arm B has a higher rate than arm A
+
+		Args:
+			armA(int): Index of arm A (control)
+			armB(int): Index of arm B (variant)
+			experiment(int): Experiment index
+
+		Returns:
+			probability(float): P(pB > pA)
+		"""
+		return probability_b_beats_a(float(self.alpha[experiment,armA]),float(self.beta[experiment,armA]),float(self.alpha[experiment,armB]),float(self.beta[experiment,armB]))
+
+	def expected_loss(self,armA=0,armB=1,experiment=0):
+		"""
+		Method to calculate the expected loss of shipping arm B instead of arm A
+
+		Args:
+			armA(int): Index of arm A (control)
+			armB(int): Index of arm B (variant)
+			experiment(int): Experiment index
+
+		Returns:
+			loss(float): E[max(pA - pB, 0)]
+		"""
+		aA, bA = float(self.alpha[experiment,armA]), float(self.beta[experiment,armA])
+		aB, bB = float(self.alpha[experiment,armB]), float(self.beta[experiment,armB])
+		"""
+		E[max(pA - pB, 0)] = E[pA] P(pA' > pB) - E[pB] P(pA > pB'),
+		where pA' ~ Beta(αA+1, βA) and pB' ~ Beta(αB+1, βB)
+		"""
+		gain = aA / (aA + bA) * (1 - probability_b_beats_a(aA + 1,bA,aB,bB))
+		cost = aB / (aB + bB) * (1 - probability_b_beats_a(aA,bA,aB + 1,bB))
+		return max(gain - cost,0.0)
+
+	def thompson_sample(self,draws=1):
+		"""
+		Method to select arms by Thompson sampling for every experiment at once
+
+		Args:
+			draws(int): Number of selections per experiment
+
+		Returns:
+			arms(ndarray): Selected arms, shape (draws, experiments)
+		"""
+		samples = self.rng.beta(self.alpha,self.beta,size=(int(draws),) + self.alpha.shape)
+		return samples.argmax(axis=-1)
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the bayesian A/B test instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the test
+		"""
+		return "Experiments: {}, Arms: {}, Posterior means: {}".format(self.experiments,self.arms,self.alpha / (self.alpha + self.beta))
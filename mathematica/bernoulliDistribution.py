@@ -5,6 +5,7 @@ Bernoulli Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
 
 class Bernoulli(Distribution):
@@ -71,14 +72,56 @@ class Bernoulli(Distribution):
 		Returns: 
 			self.p(float): Value of p
 		"""
-		self.n = len(self.data) 
-		self.p = 1.0 * sum(self.data) / self.n
+		#The fit runs on the counted data, two numbers for bernoulli outcomes
+		return self.replace_stats_with_counts()
+
+	def replace_stats_with_counts(self,values=None,counts=None):
+		"""
+		Method to calculate p from counted (or weighted) data
+        
+		Args: 
+			values(array): Distinct outcomes, the counted data of the instance when None
+			counts(array): Number of occurrences (or weight) of every outcome
+        
+		Returns: 
+			self.p(float): Value of p
+		"""
+		values, counts = self._weighted_data(values,counts)
+		observations = float(counts.sum())
+		#Number of observations, fractional only for weighted data
+		self.n = int(observations) if observations.is_integer() else observations
+		#p = Σ c k / Σ c
+		self.p = float(np.dot(values,counts) / observations)
 
 		#Calculate mean and standard deviation
 		self.mean = self.calculate_mean()
 		self.stdev = self.calculate_stdev()
 		return self.p
 
+	def calculate_log_likelihood(self,values=None,counts=None):
+		"""
+		Method to calculate the log-likelihood of counted data
+        
+		Args: 
+			values(array): Distinct outcomes, the counted data of the instance when None
+			counts(array): Number of occurrences of every outcome
+        
+		Returns: 
+			loglikelihood(float): Log-likelihood of the data
+		"""
+		values, counts = self._weighted_data(values,counts)
+		successes = float(np.dot(values,counts))
+		failures = float(counts.sum()) - successes
+		"""
+		ℓ(p) = S log(p) + (n-S) log(1-p)
+		"""
+		loglikelihood = 0.0
+		if successes:
+			loglikelihood += successes * math.log(self.p) if self.p > 0 else -math.inf
+		if failures:
+			loglikelihood += failures * math.log1p(-self.p) if self.p < 1 else -math.inf
+		return loglikelihood
+
 	def pdf(self,x):
 		"""
 		Method to calculate probability density function for bernoulli distribution
@@ -5,7 +5,9 @@ Binomial Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _recurrence_pmf	#Import generalDistribution.py module
+from .specialFunctions import log_gamma	#Import specialFunctions.py module
 
 class Binomial(Distribution):
 	"""
@@ -77,14 +79,111 @@ class Binomial(Distribution):
 			self.p(float): Value of p
 			self.n(float): Value of n    
 		"""
-		self.n = len(self.data)
-		self.p = 1.0 * sum(self.data) / self.n
+		#The fit runs on the counted data
+		return self.replace_stats_with_counts()
+
+	def replace_stats_with_counts(self,values=None,counts=None,trials=None):
+		"""
+		Method to calculate p and n from counted (or weighted) data
+        
+		Args: 
+			values(array): Distinct values, the counted data of the instance when None
+			counts(array): Number of occurrences (or weight) of every value
+			trials(int): Known number of trials behind every value. When None the values are
+				bernoulli outcomes, as in replace_stats_with_data
+        
+		Returns: 
+			self.p(float): Value of p
+			self.n(float): Value of n    
+		"""
+		values, counts = self._weighted_data(values,counts)
+		observations = counts.sum()
+		successes = np.dot(values,counts)
+
+		if trials is None:
+			self.n = int(round(observations))
+			self.p = float(successes / observations)
+		else:
+			#p = Σ c k / (n Σ c)
+			self.n = int(trials)
+			self.p = float(successes / (trials * observations))
 
 		#Calculate mean and standard deviation
 		self.mean = self.calculate_mean()
 		self.stdev = self.calculate_stdev()
 		return self.p, self.n
 
+	def calculate_log_likelihood(self,values=None,counts=None):
+		"""
+		Method to calculate the log-likelihood of counted data
+        
+		Args: 
+			values(array): Distinct numbers of successes, the counted data of the instance when None
+			counts(array): Number of occurrences of every value
+        
+		Returns: 
+			loglikelihood(float): Log-likelihood of the data
+		"""
+		values, counts = self._weighted_data(values,counts)
+		k = values
+		"""
+		ℓ = Σ c (ln n! - ln k! - ln (n-k)! + k ln p + (n-k) ln(1-p))
+		"""
+		with np.errstate(divide="ignore",invalid="ignore"):
+			logChoose = log_gamma(self.n + 1) - np.asarray(log_gamma(k + 1)) - np.asarray(log_gamma(self.n - k + 1))
+			logSuccess = np.where(k > 0,k * np.log(self.p),0.0)
+			logFailure = np.where(self.n - k > 0,(self.n - k) * np.log1p(-self.p),0.0)
+		return float(np.dot(counts,logChoose + logSuccess + logFailure))
+
+	def pmf_range(self,lo,hi):
+		"""
+		Method to calculate the probability mass function on a range of k in O(hi-lo) time
+        
+		Args:
+			lo(int): First number of successes
+			hi(int): Last number of successes
+
+		Returns:
+			pmf(ndarray): f(k) for k = lo..hi, zero outside {0,...,n}
+		"""
+		n, p = int(self.n), self.p
+		lo, hi = int(lo), int(hi)
+		if p == 0 or p == 1:
+			#All the mass sits at k = 0 or k = n
+			pmf = np.zeros(max(hi - lo + 1,0))
+			k = 0 if p == 0 else n
+			if lo <= k <= hi:
+				pmf[k - lo] = 1.0
+			return pmf
+
+		logOdds = math.log(p) - math.log1p(-p)
+		mode = min(int((n + 1) * p),n)
+		"""
+		f(k+1)/f(k) = (n-k)p / ((k+1)q) = 1 + (np-q-k) / ((k+1)q)
+
+		f(k)/f(m) = m! (n-m)! / (k! (n-k)!) * (p/q)^(k-m)
+		"""
+		def logRatio(k):
+			#log1p keeps the ratios near the mode accurate, they add up over long ranges
+			return np.log1p((n * p - (1 - p) - k) / ((k + 1) * (1 - p)))
+
+		def logRelative(k):
+			return log_gamma(mode + 1) + log_gamma(n - mode + 1) - log_gamma(k + 1) - log_gamma(n - k + 1) + (k - mode) * logOdds
+
+		return _recurrence_pmf(lo,hi,(0,n),mode,math.sqrt(n * p * (1 - p)),logRatio,logRelative)
+
+	def pmf_table(self):
+		"""
+		Method to calculate the probability mass function on the whole support in O(n) time
+        
+		Args:
+			none
+
+		Returns:
+			pmf(ndarray): f(k) for k = 0,1,...,n
+		"""
+		return self.pmf_range(0,self.n)
+
 	def pdf(self,k):
 		"""
 		Method to calculate probability density function for binomial distribution
@@ -6,7 +6,8 @@ Bradford Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
 
 class Bradford(Distribution):
 	"""
@@ -118,34 +119,65 @@ class Bradford(Distribution):
 		Method to calculate probability density function for bradford distribution
 	        
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for bradford distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for bradford distribution, 0 outside [min,max]
 		"""
-		try:
-			#Divided the formulae for mean into 2 parts: pdfNumerator and pdfDenominator
-			pdfNumerator = self.theta
-			pdfDenominator = ((self.theta * (x - self.min)) + self.max -self.min) * math.log(self.theta + 1)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not self.min <= x <= self.max:
+				return 0.0
+			return self.theta / ((self.theta * (x - self.min) + self.max - self.min) * math.log1p(self.theta))
+		def kernel(x):
 			"""
-							       θ
-			Standard deviation =  ----------------------------------
-					      (θ(x - min) + max - min)log(θ + 1) 
+							θ
+			f(x;θ,min,max) =  ----------------------------------
+					  (θ(x - min) + max - min)log(θ + 1) 
 			"""
-			return pdfNumerator / pdfDenominator
+			with np.errstate(divide="ignore"):
+				pdf = self.theta / ((self.theta * (x - self.min) + self.max - self.min) * math.log1p(self.theta))
+			return np.where((x >= self.min) & (x <= self.max),pdf,0.0)
+		return _blockwise(kernel,x)
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for bradford distribution
+	        
+		Args:
+			x(float/array): Random variable
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for bradford distribution
+		"""
+		if isinstance(x,(int,float)):
+			x = min(max(x,self.min),self.max)
+			return math.log1p(self.theta * (x - self.min) / (self.max - self.min)) / math.log1p(self.theta)
+		def kernel(x):
+			#F(x;θ,min,max) = ln(1 + θ(x-min)/(max-min)) / ln(1 + θ), x clipped to [min,max]
+			x = np.clip(x,self.min,self.max)
+			return np.log1p(self.theta * (x - self.min) / (self.max - self.min)) / math.log1p(self.theta)
+		return _blockwise(kernel,x)
+
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for bradford distribution
+	        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
 
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			if not 0 <= q <= 1:
+				return math.nan
+			return self.min + (self.max - self.min) * math.expm1(q * math.log1p(self.theta)) / self.theta
+		def kernel(q):
+			#Q(q;θ,min,max) = min + (max-min)((1+θ)^q - 1)/θ
+			ppf = self.min + (self.max - self.min) * np.expm1(q * math.log1p(self.theta)) / self.theta
+			return np.where((q >= 0) & (q <= 1),ppf,np.nan)
+		return _blockwise(kernel,q)
 
 	def __add__(self,other):
 		"""
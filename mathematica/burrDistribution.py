@@ -6,7 +6,20 @@ Burr Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+
+def _log1p_exp(u):
+	"""
+	Function to calculate ln(1 + e^u) of a float without overflowing e^u
+
+	Args:
+		u(float): Argument
+
+	Returns:
+		result(float): ln(1 + e^u)
+	"""
+	return u + math.log1p(math.exp(-u)) if u > 0 else math.log1p(math.exp(u))
 
 class Burr(Distribution):
 	"""
@@ -153,39 +166,51 @@ class Burr(Distribution):
 		Method to calculate probability density function for burr distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for burr distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
+			pdf(float/ndarray): Probability density function for burr distribution, 0 for x ≤ 0
 		"""
-		try:
-			#k raised to power a
-			powK = self.k ** self.a
-			#x raised to power (b-1)
-			powX = x ** (self.b - 1)
-
-			#numerator = a * b * k^(a) * x^(b-1)
-			numerator = self.a * self.b * powK * powX
-
-			#denomSum = k + x^(b)
-			denomSum = self.k + (x ** self.b)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not 0 < x < math.inf:
+				return 0.0
+			logX = math.log(x)
+			logPdf = math.log(self.a * self.b / self.k) + (self.b - 1) * logX - (self.a + 1) * _log1p_exp(self.b * logX - math.log(self.k))
+			return math.exp(logPdf) if logPdf < 709 else math.inf
+		def kernel(x):
 			"""
 				      α β k^(α) x^(β-1)
 			f(x;k,a,b) = -------------------
 				       (k+(x)^β)^(α+1)
-			"""			
-			powSum = self.a + 1
 
-			#denominator = (k + x^(b))^(a+1)
-			denominator = denomSum ** powSum
-			return numerator / denominator
+			evaluated as exp[ln(αβ/k) + (β-1) ln x - (α+1) ln(1 + x^β/k)] so k^α never overflows
+			"""
+			with np.errstate(divide="ignore",invalid="ignore"):
+				logX = np.log(x)
+				logPdf = math.log(self.a * self.b / self.k) + (self.b - 1) * logX - (self.a + 1) * np.log1p(np.exp(self.b * logX) / self.k)
+			return np.where((x > 0) & (x < np.inf),np.exp(logPdf),0.0)
+		return _blockwise(kernel,x)
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for burr distribution
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for burr distribution
+		"""
+		if isinstance(x,(int,float)):
+			if x <= 0:
+				return 0.0
+			return -math.expm1(-self.a * _log1p_exp(self.b * math.log(x) - math.log(self.k)))
+		def kernel(x):
+			#F(x;k,a,b) = 1 - (1 + x^β/k)^(-α)
+			x = np.maximum(x,0.0)
+			return -np.expm1(-self.a * np.log1p(x ** self.b / self.k))
+		return _blockwise(kernel,x)
 
 	def __add__(self,other):
 		"""
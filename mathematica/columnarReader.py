@@ -0,0 +1,342 @@
+"""
+Columnar Reader
+(Single pass multi-column CSV ingestion feeding several estimators)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import io
+import math
+import numpy as np
+from .exponentialDistribution import Exponential	#Import exponentialDistribution.py module
+from .gaussianDistribution import Gaussian	#Import gaussianDistribution.py module
+from .generalDistribution import _count, _merge_counts, _open, _read_lines	#Import generalDistribution.py module
+from .laplaceDistribution import Laplace	#Import laplaceDistribution.py module
+from .movingStatistics import _fit_moments	#Import movingStatistics.py module
+
+class _MomentFitter:
+	"""
+	Moment fitter class accumulating the mean and variance of a column (Chan et al.)
+	and setting the parameters of a Gaussian, Laplace or Exponential instance at the end
+	"""
+	def __init__(self,distribution):
+		self.distribution = distribution
+		self.count = 0
+		self.mean = 0.0
+		self.m2 = 0.0
+
+	def update(self,values):
+		values = values[~np.isnan(values)]
+		if values.size == 0:
+			return
+		"""
+		Parallel combination of (n, mean, M2) of the stream and of the chunk
+		"""
+		mean = float(values.mean())
+		m2 = float(np.dot(values - mean,values - mean))
+		total = self.count + values.size
+		delta = mean - self.mean
+		self.m2 += m2 + delta * delta * self.count * values.size / total
+		self.mean += delta * values.size / total
+		self.count = total
+
+	def finish(self):
+		if self.count < 2:
+			raise ValueError("fitting {} needs at least 2 values, the column has {}".format(type(self.distribution).__name__,self.count))
+		_fit_moments(self.distribution,self.mean,math.sqrt(self.m2 / (self.count - 1)))
+
+class _CountFitter:
+	"""
+	Count fitter class collapsing a column into distinct values and counts
+	and fitting a discrete distribution with replace_stats_with_counts at the end
+	"""
+	def __init__(self,distribution):
+		self.distribution = distribution
+		self.values = []
+		self.counts = []
+
+	def update(self,values):
+		values = values[~np.isnan(values)]
+		distinct, counts = _count(values)
+		self.values.append(distinct)
+		self.counts.append(counts)
+		if len(self.values) >= 64:
+			distinct, counts = _merge_counts(self.values,self.counts)
+			self.values, self.counts = [distinct], [counts]
+
+	def finish(self):
+		self.distribution.values, self.distribution.frequencies = _merge_counts(self.values,self.counts)
+		self.distribution.replace_stats_with_counts()
+
+class _CallableConsumer:
+	"""
+	Callable consumer class passing every chunk of a column to a function
+	"""
+	def __init__(self,function):
+		self.function = function
+
+	def update(self,values):
+		self.function(values)
+
+	def finish(self):
+		pass
+
+class _UpdatingConsumer:
+	"""
+	Updating consumer class passing every chunk of a column to an update(values) method,
+	as offered by KLLSketch, Empirical, MovingStatistics and ExponentialMovingStatistics
+	"""
+	def __init__(self,consumer):
+		self.consumer = consumer
+
+	def update(self,values):
+		self.consumer.update(values)
+
+	def finish(self):
+		pass
+
+def _adapter(consumer):
+	"""
+	Function to wrap a consumer so that it takes column chunks
+
+	Args:
+		consumer(object): Estimator with update(values), a discrete distribution with
+			replace_stats_with_counts, a Gaussian, Laplace or Exponential instance, or a callable
+
+	Returns:
+		adapter(object): Object with update(values) and finish()
+
+	Raises:
+		TypeError(string): Raised when the consumer can not take column chunks
+	"""
+	if hasattr(consumer,"update"):
+		return _UpdatingConsumer(consumer)
+	if hasattr(consumer,"replace_stats_with_counts"):
+		return _CountFitter(consumer)
+	if isinstance(consumer,(Gaussian,Laplace,Exponential)):
+		return _MomentFitter(consumer)
+	if callable(consumer):
+		return _CallableConsumer(consumer)
+	raise TypeError("{} can not consume column chunks".format(type(consumer).__name__))
+
+class ColumnarReader:
+	"""
+	Columnar reader class parsing selected columns of a delimited numeric file in large chunks
+	Every chunk becomes one float64 array per column, so several estimators are fed in one scan
+
+	Attributes:
+		1. file_name (path or binary file object, plain or gzip/bz2/xz/zstd compressed)
+		2. columns (selected columns, by name or by index)
+		3. delimiter (field separator, None for whitespace)
+		4. header (whether the first line holds the column names)
+		5. names (names of all columns, the indices when there is no header)
+
+	Notes:
+		Fields are parsed as plain numbers. Chunks holding empty or non-numeric fields fall
+		back to np.genfromtxt and read them as nan. Every line must have as many fields as the
+		first one, ragged lines raise a ValueError. Quoted fields are not supported.
+	"""
+	def __init__(self,file_name,columns=None,delimiter=",",header=True,chunkSize=1 << 24):
+		self.file_name = file_name
+		self.columns = columns
+		self.delimiter = delimiter
+		self.header = header
+		self.chunkSize = chunkSize
+		self.names = None
+		self.indices = None
+
+	def _resolve(self,width,names):
+		"""
+		Method to turn the selected columns into indices
+
+		Args:
+			width(int): Number of columns of the file
+			names(list): Column names from the header, None without a header
+
+		Returns:
+			No return value
+
+		Raises:
+			ValueError(string): Raised when a selected column does not exist
+		"""
+		self.names = names if names is not None else list(range(width))
+		columns = self.names if self.columns is None else self.columns
+
+		indices = []
+		for column in columns:
+			if isinstance(column,str):
+				if column not in self.names:
+					raise ValueError("no column named {!r}".format(column))
+				indices.append(self.names.index(column))
+			else:
+				if not -width <= column < width:
+					raise ValueError("column index {} is out of range".format(column))
+				indices.append(column % width)
+		self.indices = np.array(indices,dtype=np.intp)
+		self.selected = [self.names[index] for index in indices]
+		self.width = width
+
+	def _split(self,line):
+		"""
+		Method to split one line into fields
+
+		Args:
+			line(bytes): Line without its newline
+
+		Returns:
+			fields(list): Stripped fields as strings
+		"""
+		fields = line.split() if self.delimiter is None else line.split(self.delimiter.encode())
+		return [field.strip().strip(b"\"'").decode() for field in fields]
+
+	def _check_rows(self,block,rows):
+		"""
+		Method to check that every non-blank line of a block has as many fields as the first line
+
+		Args:
+			block(bytes): Block of complete lines
+			rows(int): Number of lines of the block
+
+		Returns:
+			No return value
+
+		Raises:
+			ValueError(string): Raised when a line has too few or too many fields
+		"""
+		buffer = np.frombuffer(block,dtype=np.uint8)
+		#Offset just past the end of every line
+		ends = np.append(np.flatnonzero(buffer == 10)[:rows],buffer.size)[:rows] + 1
+		if self.delimiter is None:
+			#Fields are runs of non-whitespace bytes
+			separator = buffer <= 32
+			marks = ~separator
+			marks[1:] &= separator[:-1]
+			fields = np.diff(np.searchsorted(np.flatnonzero(marks),ends),prepend=0)
+		elif len(self.delimiter.encode()) == 1:
+			fields = np.diff(np.searchsorted(np.flatnonzero(buffer == ord(self.delimiter.encode())),ends),prepend=0) + 1
+		else:
+			fields = np.array([part.count(self.delimiter.encode()) + 1 for part in block.split(b"\n")[:rows]])
+
+		#Blank lines are skipped by both parsers
+		mismatched = np.flatnonzero(fields != self.width)
+		lines = block.split(b"\n") if mismatched.size else []
+		for index in mismatched:
+			if lines[index].strip():
+				raise ValueError("a line has {} fields instead of {}: {!r}".format(fields[index],self.width,lines[index].decode(errors="replace")))
+
+	def _parse(self,block):
+		"""
+		Method to parse a block of complete lines into the selected columns
+
+		Args:
+			block(bytes): Block of complete lines
+
+		Returns:
+			table(ndarray): Values with shape (rows, selected columns)
+
+		Raises:
+			ValueError(string): Raised when a line does not have as many fields as the first line
+		"""
+		text = block if self.delimiter is None else block.replace(self.delimiter.encode(),b" ")
+		rows = block.count(b"\n") + (not block.endswith(b"\n"))
+		self._check_rows(block,rows)
+		try:
+			#Every row must contribute exactly width numbers, empty fields or blank lines break the count
+			values = np.array(text.split(),dtype=np.float64)
+			if values.size == rows * self.width:
+				return values.reshape(rows,self.width)[:,self.indices]
+		except ValueError:
+			pass
+
+		#Missing or non-numeric fields, parsed field by field
+		table = np.genfromtxt(io.BytesIO(block),delimiter=self.delimiter,usecols=self.indices,dtype=np.float64)
+		return table.reshape(-1,self.indices.size)
+
+	def chunks(self):
+		"""
+		Method to read the selected columns chunk by chunk
+
+		Args:
+			none
+
+		Returns:
+			chunks(generator): Yields dicts mapping every selected column to a float64 array
+		"""
+		file, owned = _open(self.file_name,self.chunkSize)
+		self.indices = None
+		try:
+			for block, starts, ends in _read_lines(file,self.chunkSize):
+				#Blocks may carry the start of the next line after the last newline
+				block = block[:ends[-1] + 1]
+				if self.indices is None:
+					first = block[starts[0]:ends[0]].rstrip(b"\r")
+					fields = self._split(first)
+					self._resolve(len(fields),fields if self.header else None)
+					if self.header:
+						block = block[ends[0] + 1:]
+				if not block.strip():
+					continue
+
+				table = self._parse(block)
+				yield {name: table[:,position] for position,name in enumerate(self.selected)}
+		finally:
+			if owned:
+				file.close()
+
+	def read(self):
+		"""
+		Method to read the selected columns whole
+
+		Args:
+			none
+
+		Returns:
+			columns(dict): Float64 array of every selected column
+		"""
+		parts = {}
+		for chunk in self.chunks():
+			for name,values in chunk.items():
+				parts.setdefault(name,[]).append(values)
+		return {name: np.concatenate(values) for name,values in parts.items()}
+
+	def feed(self,consumers):
+		"""
+		Method to feed several estimators from one sequential scan of the file
+
+		Args:
+			consumers(dict): Maps a column (name or index) to a consumer or a list of consumers.
+				A consumer is an estimator with update(values) (eg. KLLSketch, Empirical,
+				MovingStatistics), a discrete distribution fitted by replace_stats_with_counts
+				(eg. Poisson), a Gaussian, Laplace or Exponential instance fitted by its moments,
+				or a function called with every chunk
+
+		Returns:
+			consumers(dict): The consumers, updated or fitted
+		"""
+		if self.columns is None:
+			self.columns = list(consumers)
+
+		adapters = []
+		for column,consumer in consumers.items():
+			for target in (consumer if isinstance(consumer,(list,tuple)) else [consumer]):
+				adapters.append((column,_adapter(target)))
+
+		for chunk in self.chunks():
+			for column,adapter in adapters:
+				adapter.update(chunk[column if column in chunk else self.names[column]])
+
+		for column,adapter in adapters:
+			adapter.finish()
+		return consumers
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the columnar reader instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the reader
+		"""
+		return "File: {}, Columns: {}, Delimiter: {!r}".format(self.file_name,self.columns,self.delimiter)
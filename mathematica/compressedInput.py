@@ -0,0 +1,188 @@
+"""
+Compressed Input
+(Magic byte detection and background decompression of data files)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import bz2
+import gzip
+import lzma
+import queue
+import threading
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+#Leading bytes of every supported format
+MAGIC_BYTES = (
+	(b"\x1f\x8b","gzip"),
+	(b"BZh","bz2"),
+	(b"\xfd7zXZ\x00","xz"),
+	(b"\x28\xb5\x2f\xfd","zstd"),
+)
+
+def detect_compression(header):
+	"""
+	Function to identify the compression format from the first bytes of a file
+
+	Args:
+		header(bytes): First bytes of the file (at least 6)
+
+	Returns:
+		format(string): "gzip", "bz2", "xz", "zstd" or None for uncompressed data
+	"""
+	for magic,name in MAGIC_BYTES:
+		if header.startswith(magic):
+			return name
+	return None
+
+def decompressing_reader(file,chunkSize=1 << 20,owned=False):
+	"""
+	Function to wrap a binary file in a streaming decompressor when its magic bytes ask for one
+
+	Args:
+		file(file): Binary file object, buffered or seekable for the compression to be detected
+		chunkSize(int): Number of bytes decompressed per block
+		owned(bool): Whether closing the reader also closes the file
+
+	Returns:
+		reader(file): The file itself when uncompressed, otherwise a background reader of the decompressed bytes
+
+	Raises:
+		ValueError(string): Raised for zstd input when the zstandard package is missing
+	"""
+	#Buffered files can peek, other seekable files are rewound after reading the header
+	if hasattr(file,"peek"):
+		header = file.peek(6)[:6]
+	elif getattr(file,"seekable",lambda: False)():
+		position = file.tell()
+		header = file.read(6)
+		file.seek(position)
+	else:
+		header = b""
+
+	compression = detect_compression(header) if isinstance(header,bytes) else None
+	if compression is None:
+		return file
+
+	if compression == "gzip":
+		reader = gzip.GzipFile(fileobj=file,mode="rb")
+	elif compression == "bz2":
+		reader = bz2.BZ2File(file,mode="rb")
+	elif compression == "xz":
+		reader = lzma.LZMAFile(file,mode="rb")
+	else:
+		if zstandard is None:
+			raise ValueError("reading zstd compressed data needs the zstandard package")
+		try:
+			reader = zstandard.ZstdDecompressor().stream_reader(file,read_size=chunkSize,closefd=False)
+		except TypeError:
+			#zstandard before 0.15 has no closefd
+			reader = zstandard.ZstdDecompressor().stream_reader(file,read_size=chunkSize)
+
+	return BackgroundReader(reader,chunkSize,source=file if owned else None)
+
+class BackgroundReader:
+	"""
+	Background reader class that reads blocks on a separate thread into a bounded queue
+	The zlib, bz2, lzma and zstandard decompressors release the GIL, so decompression
+	overlaps with parsing on the calling thread while memory stays at depth blocks
+
+	Attributes:
+		1. reader (file object read by the thread)
+		2. source (file closed together with the reader, if any)
+		3. chunkSize (number of bytes per block)
+		4. depth (largest number of blocks waiting in the queue)
+	"""
+	def __init__(self,reader,chunkSize=1 << 20,depth=4,source=None):
+		self.reader = reader
+		self.source = source
+		self.chunkSize = chunkSize
+		self.depth = depth
+		self.finished = False
+
+		self.queue = queue.Queue(depth)
+		self.stopped = threading.Event()
+		self.thread = threading.Thread(target=self._run,daemon=True)
+		self.thread.start()
+
+	def _put(self,item):
+		"""
+		Method to queue a block, giving up once the reader is closed
+
+		Args:
+			item(bytes/exception): Block, empty at the end of the stream, or the error raised
+
+		Returns:
+			queued(bool): Whether the item was queued
+		"""
+		while not self.stopped.is_set():
+			try:
+				self.queue.put(item,timeout=0.1)
+				return True
+			except queue.Full:
+				continue
+		return False
+
+	def _run(self):
+		"""
+		Method run by the background thread
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		try:
+			while True:
+				block = self.reader.read(self.chunkSize)
+				if not self._put(block) or not block:
+					return
+		except Exception as error:
+			self._put(error)
+
+	def read(self,size=-1):
+		"""
+		Method to return the next decompressed block
+
+		Args:
+			size(int): Ignored, blocks always hold up to chunkSize bytes
+
+		Returns:
+			block(bytes): Next block, empty at the end of the stream
+		"""
+		if self.finished:
+			return b""
+		block = self.queue.get()
+		if isinstance(block,Exception):
+			self.finished = True
+			raise block
+		if not block:
+			self.finished = True
+		return block
+
+	def close(self):
+		"""
+		Method to stop the thread and close the underlying files
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		self.stopped.set()
+		self.thread.join()
+		self.reader.close()
+		if self.source is not None:
+			self.source.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,*exception):
+		self.close()
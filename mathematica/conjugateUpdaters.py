@@ -0,0 +1,427 @@
+"""
+Conjugate Updaters
+(Streaming Gamma-Poisson, Gamma-Exponential and Beta-Geometric posteriors)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from .exponentialDistribution import Exponential	#Import exponentialDistribution.py module
+from .geometricDistribution import Geometric	#Import geometricDistribution.py module
+from .poissonDistribution import Poisson	#Import poissonDistribution.py module
+
+class ConjugateUpdater:
+	"""
+	Generic conjugate updater class holding decayed sufficient statistics for many keys
+	Keys are integer indices into compact float arrays
+
+	Attributes:
+		1. keys (number of keys)
+		2. decay (forgetting factor applied per observation, 1 keeps everything)
+		3. first (first sufficient statistic of every key)
+		4. second (second sufficient statistic of every key)
+	"""
+	def __init__(self,keys=1,decay=1.0):
+		if not 0 < decay <= 1:
+			raise ValueError("decay must lie in (0,1]")
+
+		self.keys = int(keys)
+		self.decay = decay
+		self.first = np.zeros(self.keys)
+		self.second = np.zeros(self.keys)
+
+	def _accumulate(self,keys,first,second):
+		"""
+		Method to add per observation contributions to the sufficient statistics
+
+		Args:
+			keys(int/array): Key of each observation
+			first(array): Contribution of each observation to the first statistic
+			second(array): Contribution of each observation to the second statistic
+
+		Returns:
+			No return value
+		"""
+		keys = np.atleast_1d(np.asarray(keys,dtype=np.int64))
+		first = np.broadcast_to(np.asarray(first,dtype=np.float64),keys.shape)
+		second = np.broadcast_to(np.asarray(second,dtype=np.float64),keys.shape)
+
+		if self.decay == 1:
+			np.add.at(self.first,keys,first)
+			np.add.at(self.second,keys,second)
+			return
+
+		"""
+		S(n) = d S(n-1) + x(n), so after m observations of a key,
+		S = d^m S(0) + Σ d^(m-i) x(i), i = 1..m
+		"""
+		order = np.argsort(keys,kind="stable")
+		sortedKeys = keys[order]
+		#Runs of equal keys in the sorted order
+		start = np.flatnonzero(np.diff(sortedKeys,prepend=-1))
+		counts = np.diff(start,append=sortedKeys.size)
+		distinct = sortedKeys[start]
+		rank = np.arange(sortedKeys.size) - np.repeat(start,counts)
+		weights = self.decay ** (np.repeat(counts,counts) - 1 - rank)
+
+		factor = self.decay ** counts
+		self.first[distinct] = self.first[distinct] * factor + np.add.reduceat(first[order] * weights,start)
+		self.second[distinct] = self.second[distinct] * factor + np.add.reduceat(second[order] * weights,start)
+
+	def forget(self,factor,keys=None):
+		"""
+		Method to discount the history of some (or all) keys, eg. once per time step
+
+		Args:
+			factor(float): Multiplier applied to the sufficient statistics
+			keys(int/array): Keys to discount, all keys when None
+
+		Returns:
+			No return value
+		"""
+		if keys is None:
+			self.first *= factor
+			self.second *= factor
+		else:
+			self.first[keys] *= factor
+			self.second[keys] *= factor
+
+	def reset(self,keys=None):
+		"""
+		Method to return some (or all) keys to the prior
+
+		Args:
+			keys(int/array): Keys to reset, all keys when None
+
+		Returns:
+			No return value
+		"""
+		self.forget(0.0,keys)
+
+class GammaPoissonUpdater(ConjugateUpdater):
+	"""
+	Gamma-Poisson updater class for streaming estimates of poisson event rates
+	Gamma-Poisson updater class inherits from conjugate updater class
+
+	Notation:
+		λ ~ Gamma(α0 + Σx, β0 + Σt), x ~ Pois(λ t)
+
+	Attributes:
+		1. priorShape (α0)
+		2. priorRate (β0)
+		3. first (decayed sum of counts, Σx)
+		4. second (decayed sum of exposures, Σt)
+	"""
+	def __init__(self,keys=1,priorShape=1.0,priorRate=1.0,decay=1.0):
+		ConjugateUpdater.__init__(self,keys,decay)
+		self.priorShape = priorShape
+		self.priorRate = priorRate
+
+	def update(self,keys,counts,exposure=1.0):
+		"""
+		Method to add observed event counts
+
+		Args:
+			keys(int/array): Key of each observation
+			counts(int/array): Number of events observed
+			exposure(float/array): Length of the interval the events were counted over
+
+		Returns:
+			No return value
+		"""
+		self._accumulate(keys,counts,exposure)
+
+	def calculate_shape(self,keys=None):
+		"""
+		Method to calculate the posterior shape α = α0 + Σx
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			shape(ndarray): Posterior shape
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorShape + self.first[keys]
+
+	def calculate_rate(self,keys=None):
+		"""
+		Method to calculate the posterior rate β = β0 + Σt
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			rate(ndarray): Posterior rate
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorRate + self.second[keys]
+
+	def calculate_mean(self,keys=None):
+		"""
+		Method to calculate the posterior mean of the event rate λ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			mean(ndarray): α / β
+		"""
+		return self.calculate_shape(keys) / self.calculate_rate(keys)
+
+	def calculate_variance(self,keys=None):
+		"""
+		Method to calculate the posterior variance of the event rate λ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			variance(ndarray): α / β^2
+		"""
+		return self.calculate_shape(keys) / self.calculate_rate(keys) ** 2
+
+	def predictive(self,key,exposure=1.0):
+		"""
+		Method to return the plug-in predictive distribution of the count of one key
+
+		Args:
+			key(int): Key to read
+			exposure(float): Length of the interval to predict
+
+		Returns:
+			result(poisson distribution): Poisson instance with μ = E[λ] t
+		"""
+		return Poisson(float(self.calculate_mean(key)) * exposure)
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the gamma poisson updater instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the updater
+		"""
+		return "Keys: {}, Prior: Gamma({}, {}), Decay: {}".format(self.keys,self.priorShape,self.priorRate,self.decay)
+
+class GammaExponentialUpdater(ConjugateUpdater):
+	"""
+	Gamma-Exponential updater class for streaming estimates of exponential rates
+	Gamma-Exponential updater class inherits from conjugate updater class
+
+	Notation:
+		λ ~ Gamma(α0 + n, β0 + Σx), x ~ Exp(λ)
+
+	Attributes:
+		1. priorShape (α0)
+		2. priorRate (β0)
+		3. first (decayed number of observations, n)
+		4. second (decayed sum of observed durations, Σx)
+	"""
+	def __init__(self,keys=1,priorShape=1.0,priorRate=1.0,decay=1.0):
+		ConjugateUpdater.__init__(self,keys,decay)
+		self.priorShape = priorShape
+		self.priorRate = priorRate
+
+	def update(self,keys,durations):
+		"""
+		Method to add observed durations (eg. inter-arrival times)
+
+		Args:
+			keys(int/array): Key of each observation
+			durations(float/array): Observed duration
+
+		Returns:
+			No return value
+		"""
+		self._accumulate(keys,1.0,durations)
+
+	def calculate_shape(self,keys=None):
+		"""
+		Method to calculate the posterior shape α = α0 + n
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			shape(ndarray): Posterior shape
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorShape + self.first[keys]
+
+	def calculate_rate(self,keys=None):
+		"""
+		Method to calculate the posterior rate β = β0 + Σx
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			rate(ndarray): Posterior rate
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorRate + self.second[keys]
+
+	def calculate_mean(self,keys=None):
+		"""
+		Method to calculate the posterior mean of the rate λ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			mean(ndarray): α / β
+		"""
+		return self.calculate_shape(keys) / self.calculate_rate(keys)
+
+	def calculate_variance(self,keys=None):
+		"""
+		Method to calculate the posterior variance of the rate λ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			variance(ndarray): α / β^2
+		"""
+		return self.calculate_shape(keys) / self.calculate_rate(keys) ** 2
+
+	def predictive(self,key):
+		"""
+		Method to return the plug-in predictive distribution of the next duration of one key
+
+		Args:
+			key(int): Key to read
+
+		Returns:
+			result(exponential distribution): Exponential instance with λ = E[λ]
+		"""
+		return Exponential(float(self.calculate_mean(key)))
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the gamma exponential updater instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the updater
+		"""
+		return "Keys: {}, Prior: Gamma({}, {}), Decay: {}".format(self.keys,self.priorShape,self.priorRate,self.decay)
+
+class BetaGeometricUpdater(ConjugateUpdater):
+	"""
+	Beta-Geometric updater class for streaming estimates of geometric success probabilities
+	Beta-Geometric updater class inherits from conjugate updater class
+
+	Notation:
+		ρ ~ Beta(α0 + n, β0 + Σ failures), failures = k - 1 (trials) or k (failures)
+
+	Attributes:
+		1. priorAlpha (α0)
+		2. priorBeta (β0)
+		3. trial (True when observations count trials, False when they count failures)
+		4. first (decayed number of observations, n)
+		5. second (decayed number of failures)
+	"""
+	def __init__(self,keys=1,priorAlpha=1.0,priorBeta=1.0,decay=1.0,trials=True):
+		ConjugateUpdater.__init__(self,keys,decay)
+		self.priorAlpha = priorAlpha
+		self.priorBeta = priorBeta
+		self.trial = trials
+
+	def update(self,keys,observations):
+		"""
+		Method to add geometric observations
+
+		Args:
+			keys(int/array): Key of each observation
+			observations(int/array): Number of trials up to (or failures before) the first success
+
+		Returns:
+			No return value
+		"""
+		failures = np.asarray(observations,dtype=np.float64)
+		if self.trial is True:
+			failures = failures - 1
+		self._accumulate(keys,1.0,failures)
+
+	def calculate_alpha(self,keys=None):
+		"""
+		Method to calculate the posterior α = α0 + n
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			alpha(ndarray): Posterior α
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorAlpha + self.first[keys]
+
+	def calculate_beta(self,keys=None):
+		"""
+		Method to calculate the posterior β = β0 + Σ failures
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			beta(ndarray): Posterior β
+		"""
+		keys = slice(None) if keys is None else keys
+		return self.priorBeta + self.second[keys]
+
+	def calculate_mean(self,keys=None):
+		"""
+		Method to calculate the posterior mean of the success probability ρ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			mean(ndarray): α / (α + β)
+		"""
+		alpha = self.calculate_alpha(keys)
+		return alpha / (alpha + self.calculate_beta(keys))
+
+	def calculate_variance(self,keys=None):
+		"""
+		Method to calculate the posterior variance of the success probability ρ
+
+		Args:
+			keys(int/array): Keys to read, all keys when None
+
+		Returns:
+			variance(ndarray): α β / ((α+β)^2 (α+β+1))
+		"""
+		alpha = self.calculate_alpha(keys)
+		beta = self.calculate_beta(keys)
+		return alpha * beta / ((alpha + beta) ** 2 * (alpha + beta + 1))
+
+	def predictive(self,key):
+		"""
+		Method to return the plug-in predictive distribution of the next observation of one key
+
+		Args:
+			key(int): Key to read
+
+		Returns:
+			result(geometric distribution): Geometric instance with ρ = E[ρ]
+		"""
+		return Geometric(float(self.calculate_mean(key)),self.trial)
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the beta geometric updater instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the updater
+		"""
+		return "Keys: {}, Prior: Beta({}, {}), Decay: {}".format(self.keys,self.priorAlpha,self.priorBeta,self.decay)
@@ -0,0 +1,197 @@
+"""
+Data Cache
+(Memory mapped .npy sidecars of parsed data files)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import os
+import glob
+import hashlib
+import threading
+import numpy as np
+
+#Suffix marking the sidecars written by the cache
+SUFFIX = ".mathematica.npy"
+
+class DataCache:
+	"""
+	Data cache class storing the parsed float64 values of txt files as .npy sidecars
+	A sidecar is keyed by the size, modification time and optionally a content hash of its
+	source, and later loads memory map it instead of parsing the source again
+
+	Attributes:
+		1. directory (folder holding the sidecars, None puts them next to their source)
+		2. maxBytes (total size of the sidecars of a folder kept by the eviction)
+		3. hashContent (whether the key includes a hash of the whole source)
+
+	Notes:
+		Eviction is least recently used: every hit refreshes the modification time of the
+		sidecar and the oldest sidecars of a folder are removed once it holds more than
+		maxBytes. A sidecar is written to a temporary file and renamed, so readers never see
+		a partial one.
+	"""
+	def __init__(self,directory=None,maxBytes=1 << 32,hashContent=False):
+		self.directory = directory
+		self.maxBytes = maxBytes
+		self.hashContent = hashContent
+
+		if directory is not None:
+			os.makedirs(directory,exist_ok=True)
+
+	def _content_hash(self,path):
+		"""
+		Method to hash the content of a file in blocks
+
+		Args:
+			path(string): Path of the file
+
+		Returns:
+			digest(string): Hex digest of the content
+		"""
+		digest = hashlib.blake2b(digest_size=16)
+		with open(path,"rb") as file:
+			for block in iter(lambda: file.read(1 << 20),b""):
+				digest.update(block)
+		return digest.hexdigest()
+
+	def sidecar(self,path):
+		"""
+		Method to find the sidecar path of a source file for its current size and modification time
+
+		Args:
+			path(string): Path of the source file
+
+		Returns:
+			sidecar(string): Path of the sidecar
+			prefix(string): Part of the sidecar name shared by every version of the source
+		"""
+		path = os.path.abspath(os.fspath(path))
+		status = os.stat(path)
+		key = "{}:{}:{}".format(status.st_size,status.st_mtime_ns,self._content_hash(path) if self.hashContent else "")
+
+		folder = os.path.dirname(path) if self.directory is None else self.directory
+		name = os.path.basename(path)
+		pathDigest = hashlib.blake2b(path.encode(),digest_size=6).hexdigest()
+		keyDigest = hashlib.blake2b(key.encode(),digest_size=8).hexdigest()
+		prefix = os.path.join(folder,"{}.{}.".format(name,pathDigest))
+		return prefix + keyDigest + SUFFIX, prefix
+
+	def load(self,path,location=None):
+		"""
+		Method to memory map the cached values of a source file
+
+		Args:
+			path(string): Path of the source file
+			location(tuple): (sidecar, prefix) from sidecar(), found from the current source when None
+
+		Returns:
+			data(ndarray): Read only memory map of the values, None when there is no valid sidecar
+		"""
+		sidecar, prefix = self.sidecar(path) if location is None else location
+		try:
+			data = np.load(sidecar,mmap_mode="r")
+		except (OSError,ValueError):
+			return None
+
+		#Refresh the position of the sidecar in the eviction order, a read only folder keeps the old one
+		try:
+			os.utime(sidecar)
+		except OSError:
+			pass
+		return data
+
+	def store(self,path,data,location=None):
+		"""
+		Method to write the values of a source file to its sidecar
+
+		Args:
+			path(string): Path of the source file
+			data(array): Parsed values
+			location(tuple): (sidecar, prefix) from sidecar(), taken before the source was parsed so
+				that a source modified during the parse is not stored under its new key
+
+		Returns:
+			sidecar(string): Path of the sidecar, None when it could not be written (eg. a read only
+				or missing folder), in which case the caller keeps its parsed values
+		"""
+		sidecar, prefix = self.sidecar(path) if location is None else location
+		#The thread is part of the temporary name, as threads of one process may cache the same source at once
+		temporary = "{}.{}.{}.tmp".format(sidecar,os.getpid(),threading.get_ident())
+		try:
+			with open(temporary,"wb") as file:
+				np.save(file,np.asarray(data,dtype=np.float64))
+			os.replace(temporary,sidecar)
+		except OSError:
+			try:
+				os.remove(temporary)
+			except OSError:
+				pass
+			return None
+
+		#Sidecars of older versions of the source are stale
+		for stale in glob.glob(glob.escape(prefix) + "*" + SUFFIX):
+			if stale != sidecar:
+				self._remove(stale)
+
+		self.evict(os.path.dirname(sidecar),keep=sidecar)
+		return sidecar
+
+	def evict(self,folder=None,keep=None):
+		"""
+		Method to remove the least recently used sidecars of a folder until it fits in maxBytes
+
+		Args:
+			folder(string): Folder to clean, the cache directory when None
+			keep(string): Sidecar that is never removed
+
+		Returns:
+			removed(list): Paths of the removed sidecars
+		"""
+		folder = self.directory if folder is None else folder
+		sidecars = []
+		for sidecar in glob.glob(os.path.join(glob.escape(folder),"*" + SUFFIX)):
+			try:
+				status = os.stat(sidecar)
+			except OSError:
+				continue
+			sidecars.append((status.st_mtime_ns,status.st_size,sidecar))
+
+		total = sum(size for used,size,sidecar in sidecars)
+		removed = []
+		for used,size,sidecar in sorted(sidecars):
+			if total <= self.maxBytes:
+				break
+			if sidecar == keep:
+				continue
+			self._remove(sidecar)
+			total -= size
+			removed.append(sidecar)
+		return removed
+
+	def _remove(self,sidecar):
+		"""
+		Method to delete a sidecar, ignoring one already removed by another process
+
+		Args:
+			sidecar(string): Path of the sidecar
+
+		Returns:
+			No return value
+		"""
+		try:
+			os.remove(sidecar)
+		except FileNotFoundError:
+			pass
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the data cache instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the cache
+		"""
+		return "Directory: {}, Maximum bytes: {}, Content hash: {}".format(self.directory or "next to the source",self.maxBytes,self.hashContent)
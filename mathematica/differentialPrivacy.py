@@ -0,0 +1,299 @@
+"""
+Differential Privacy
+(Laplace and Gaussian noise mechanisms with a privacy budget accountant)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import os
+import math
+import threading
+import numpy as np
+from .gaussianDistribution import Gaussian	#Import gaussianDistribution.py module
+from .laplaceDistribution import Laplace	#Import laplaceDistribution.py module
+
+def secure_uniform(size):
+	"""
+	Function to draw uniform variates on (0,1) from the operating system CSPRNG
+
+	Args:
+		size(int/tuple): Number (or shape) of variates to draw
+
+	Returns:
+		samples(ndarray): Uniform variates built from 53 random bits each
+	"""
+	count = int(np.prod(size))
+	bits = np.frombuffer(os.urandom(8 * count),dtype=np.uint64)
+
+	#Keep the top 53 bits and centre them in their cell, so 0 and 1 never occur
+	samples = (bits >> np.uint64(11)).astype(np.float64)
+	samples += 0.5
+	samples *= 2.0 ** -53
+	return samples.reshape(size)
+
+class PrivacyAccountant:
+	"""
+	Privacy accountant class for tracking the privacy budget spent across calls
+	Budgets compose sequentially, so the losses of every query are added together
+
+	Attributes:
+		1. epsilonBudget (total ε that may be spent)
+		2. deltaBudget (total δ that may be spent)
+		3. epsilonSpent (ε spent so far)
+		4. deltaSpent (δ spent so far)
+		5. queries (number of queries charged)
+	"""
+	def __init__(self,epsilonBudget=1.0,deltaBudget=0.0):
+		self.epsilonBudget = epsilonBudget
+		self.deltaBudget = deltaBudget
+		self.epsilonSpent = 0.0
+		self.deltaSpent = 0.0
+		self.queries = 0
+		self._lock = threading.Lock()
+
+	def spend(self,epsilon,delta=0.0):
+		"""
+		Method to charge a query against the budget
+
+		Args:
+			epsilon(float): Privacy loss ε of the query
+			delta(float): Failure probability δ of the query
+
+		Returns:
+			remaining(tuple): Remaining (ε, δ) after the query
+
+		Raises:
+			ValueError(string): Raised when the query would exceed the budget
+		"""
+		with self._lock:
+			epsilonTotal = self.epsilonSpent + epsilon
+			deltaTotal = self.deltaSpent + delta
+
+			#A tiny tolerance lets the budget be split in equal floating point parts
+			if epsilonTotal > self.epsilonBudget * (1 + 1e-12) or deltaTotal > self.deltaBudget * (1 + 1e-12):
+				raise ValueError("privacy budget exhausted: spent ε={}, δ={} of ε={}, δ={}".format(self.epsilonSpent,self.deltaSpent,self.epsilonBudget,self.deltaBudget))
+
+			self.epsilonSpent = epsilonTotal
+			self.deltaSpent = deltaTotal
+			self.queries += 1
+			return self.epsilonBudget - self.epsilonSpent, self.deltaBudget - self.deltaSpent
+
+	def remaining(self):
+		"""
+		Method to calculate the remaining budget
+
+		Args:
+			none
+
+		Returns:
+			remaining(tuple): Remaining (ε, δ)
+		"""
+		with self._lock:
+			return self.epsilonBudget - self.epsilonSpent, self.deltaBudget - self.deltaSpent
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the privacy accountant instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the accountant
+		"""
+		return "ε spent: {} of {}, δ spent: {} of {}, Queries: {}".format(self.epsilonSpent,self.epsilonBudget,self.deltaSpent,self.deltaBudget,self.queries)
+
+class LaplaceMechanism(Laplace):
+	"""
+	Laplace mechanism class for releasing ε-differentially private values
+	Laplace mechanism class inherits from laplace class of laplaceDistribution.py module
+
+	Notation:
+		M(x) = x + Laplace(0,Δ/ε)
+
+	Attributes:
+		1. sensitivity (L1 sensitivity Δ of the query)
+		2. epsilon (privacy loss ε per release)
+		3. b (scale parameter, b = Δ/ε)
+
+	Parameters:
+		Δ > 0, ε > 0
+	"""
+	def __init__(self,sensitivity=1,epsilon=1,accountant=None,secure=False,seed=None):
+		if sensitivity <= 0 or epsilon <= 0:
+			raise ValueError("sensitivity and epsilon must be positive")
+
+		self.sensitivity = sensitivity
+		self.epsilon = epsilon
+		self.accountant = accountant
+		self.secure = secure
+		self.rng = np.random.default_rng(seed)
+
+		"""
+			Δ
+		β = ---
+			ε
+		"""
+		Laplace.__init__(self,0,sensitivity / epsilon)
+
+	def noise(self,size):
+		"""
+		Method to generate Laplace noise for a whole array in one call
+
+		Args:
+			size(int/tuple): Number (or shape) of noise values
+
+		Returns:
+			noise(ndarray): Laplace(0,β) noise
+		"""
+		if not self.secure:
+			return self.rng.laplace(0.0,self.b,size)
+
+		#Inverse cdf, x = -β sgn(u) ln(1 - 2|u|), u ∈ (-1/2,1/2)
+		u = secure_uniform(size)
+		u -= 0.5
+		noise = np.log1p(-2 * np.abs(u))
+		noise *= -self.b * np.sign(u)
+		return noise
+
+	def randomize(self,values,out=None):
+		"""
+		Method to release the values with Laplace noise added
+
+		Args:
+			values(float/array): True answers of the query (Δ is the L1 sensitivity of the whole array)
+			out(ndarray): Optional float array receiving the result in place
+
+		Returns:
+			noisy(float/ndarray): Differentially private values
+
+		Raises:
+			ValueError(string): Raised when the accountant has no budget left
+		"""
+		if self.accountant is not None:
+			self.accountant.spend(self.epsilon)
+
+		values = np.asarray(values,dtype=np.float64)
+		if out is None:
+			#Add the values onto the fresh noise buffer instead of allocating a result
+			noisy = self.noise(values.shape)
+			noisy += values
+		else:
+			noisy = np.add(values,self.noise(values.shape),out=out)
+		if noisy.ndim == 0:
+			return float(noisy)
+		return noisy
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the laplace mechanism instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the mechanism
+		"""
+		return "Δ: {}, ε: {}, β: {}".format(self.sensitivity,self.epsilon,self.b)
+
+class GaussianMechanism(Gaussian):
+	"""
+	Gaussian mechanism class for releasing (ε,δ)-differentially private values
+	Gaussian mechanism class inherits from gaussian class of gaussianDistribution.py module
+
+	Notation:
+		M(x) = x + N(0,σ), σ = Δ √(2 ln(1.25/δ)) / ε
+
+	Attributes:
+		1. sensitivity (L2 sensitivity Δ of the query)
+		2. epsilon (privacy loss ε per release)
+		3. delta (failure probability δ per release)
+		4. stdev (σ of the noise)
+
+	Parameters:
+		Δ > 0, 0 < ε < 1, 0 < δ < 1
+	"""
+	def __init__(self,sensitivity=1,epsilon=0.5,delta=1e-5,accountant=None,secure=False,seed=None):
+		if sensitivity <= 0:
+			raise ValueError("sensitivity must be positive")
+		#The classical calibration only holds for ε < 1
+		if not 0 < epsilon < 1:
+			raise ValueError("epsilon must lie in (0,1) for the gaussian mechanism")
+		if not 0 < delta < 1:
+			raise ValueError("delta must lie in (0,1)")
+
+		self.sensitivity = sensitivity
+		self.epsilon = epsilon
+		self.delta = delta
+		self.accountant = accountant
+		self.secure = secure
+		self.rng = np.random.default_rng(seed)
+
+		"""
+			Δ √(2 ln(1.25/δ))
+		σ = ------------------
+				ε
+		"""
+		sigma = sensitivity * math.sqrt(2 * math.log(1.25 / delta)) / epsilon
+		Gaussian.__init__(self,0,sigma)
+
+	def noise(self,size):
+		"""
+		Method to generate Gaussian noise for a whole array in one call
+
+		Args:
+			size(int/tuple): Number (or shape) of noise values
+
+		Returns:
+			noise(ndarray): N(0,σ) noise
+		"""
+		if not self.secure:
+			return self.rng.normal(0.0,self.stdev,size)
+
+		#Box-Muller transform of two CSPRNG uniform streams
+		u = secure_uniform(size)
+		v = secure_uniform(size)
+		noise = np.sqrt(-2 * np.log(u))
+		noise *= np.cos(2 * math.pi * v)
+		noise *= self.stdev
+		return noise
+
+	def randomize(self,values,out=None):
+		"""
+		Method to release the values with Gaussian noise added
+
+		Args:
+			values(float/array): True answers of the query (Δ is the L2 sensitivity of the whole array)
+			out(ndarray): Optional float array receiving the result in place
+
+		Returns:
+			noisy(float/ndarray): Differentially private values
+
+		Raises:
+			ValueError(string): Raised when the accountant has no budget left
+		"""
+		if self.accountant is not None:
+			self.accountant.spend(self.epsilon,self.delta)
+
+		values = np.asarray(values,dtype=np.float64)
+		if out is None:
+			#Add the values onto the fresh noise buffer instead of allocating a result
+			noisy = self.noise(values.shape)
+			noisy += values
+		else:
+			noisy = np.add(values,self.noise(values.shape),out=out)
+		if noisy.ndim == 0:
+			return float(noisy)
+		return noisy
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the gaussian mechanism instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the mechanism
+		"""
+		return "Δ: {}, ε: {}, δ: {}, σ: {}".format(self.sensitivity,self.epsilon,self.delta,self.stdev)
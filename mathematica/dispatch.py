@@ -0,0 +1,384 @@
+"""
+Dispatch
+(Calibrated routing of method calls between scalar loops, numpy and a process pool)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import os
+import json
+import time
+import platform
+import warnings
+import concurrent.futures
+import numpy as np
+
+#Environment variable naming the configuration file
+CONFIG_VARIABLE = "MATHEMATICA_DISPATCH"
+#Largest input evaluated element by element before calibration
+SCALAR_LIMIT = 16
+#Input sizes timed by the calibration
+CALIBRATION_SIZES = (1,2,4,8,16,32,64,128,256,512,1024)
+#Input sizes at which the process pool is tried
+POOL_SIZES = (1 << 18,1 << 20,1 << 22)
+
+def config_path():
+	"""
+	Function to find the dispatch configuration file
+
+	Args:
+		none
+
+	Returns:
+		path(string): $MATHEMATICA_DISPATCH, or ~/.mathematica/dispatch.json
+	"""
+	return os.environ.get(CONFIG_VARIABLE) or os.path.join(os.path.expanduser("~"),".mathematica","dispatch.json")
+
+def machine():
+	"""
+	Function to describe the machine a configuration is calibrated on
+
+	Args:
+		none
+
+	Returns:
+		machine(dict): Processor, number of CPUs and numpy version, as saved with the configuration
+	"""
+	return {"processor": platform.processor() or platform.machine(),"cpus": os.cpu_count(),"numpy": np.__version__}
+
+def _scalar_loop(function,flat):
+	"""
+	Function to evaluate a method element by element with Python floats
+
+	Args:
+		function(callable): Bound method
+		flat(ndarray): One dimensional input
+
+	Returns:
+		values(ndarray): Float64 results
+	"""
+	return np.fromiter((function(value) for value in flat.tolist()),dtype=np.float64,count=flat.size)
+
+def _evaluate_chunk(distribution,method,chunk,vectorized):
+	"""
+	Function run by the pool workers on one chunk
+
+	Args:
+		distribution(object): Distribution instance, pickled to the worker
+		method(string): Method name
+		chunk(ndarray): One dimensional input
+		vectorized(bool): Whether the method takes arrays
+
+	Returns:
+		values(ndarray): Results of the chunk
+	"""
+	function = getattr(distribution,method)
+	return np.asarray(function(chunk),dtype=np.float64) if vectorized else _scalar_loop(function,chunk)
+
+def _best_time(function,repeat=5):
+	"""
+	Function to time a call, keeping the fastest of several runs
+
+	Args:
+		function(callable): Call without arguments
+		repeat(int): Number of runs
+
+	Returns:
+		seconds(float): Fastest run
+	"""
+	best = float("inf")
+	for run in range(repeat):
+		start = time.perf_counter()
+		function()
+		best = min(best,time.perf_counter() - start)
+	return best
+
+class Dispatcher:
+	"""
+	Dispatcher class routing every evaluation of a distribution method by input size:
+	a loop of scalar calls for tiny inputs, one numpy call for the bulk, and chunks on a
+	process pool for inputs large enough to pay for the pickling
+
+	Attributes:
+		1. config (routing of every "Class.method", as loaded from or saved to the config file)
+		2. path (configuration file)
+		3. workers (number of pool processes)
+
+	Notes:
+		Each entry of config holds "vectorized" (whether the method takes arrays), "scalarLimit"
+		(largest input evaluated element by element) and "poolLimit" (smallest input sent to the
+		pool, None when the pool never won). Methods missing from the config are probed on their
+		first call and use SCALAR_LIMIT without a pool; those defaults are kept apart from config,
+		so save() only writes measured entries. calibrate() measures the crossovers of this
+		machine and saves them, so services share one config instead of hand tuning. A config
+		saved on another machine is ignored on load, with a warning.
+	"""
+	def __init__(self,path=None,workers=None):
+		self.path = path if path is not None else config_path()
+		self.workers = workers if workers is not None else (os.cpu_count() or 1)
+		self.config = {}
+		#Routing of methods missing from config, found by probing and never saved
+		self._probed = {}
+		self._pool = None
+		if os.path.exists(self.path):
+			self.load()
+
+	def load(self):
+		"""
+		Method to read the configuration file. Crossovers measured on another machine (a
+		different processor, number of CPUs or numpy version) do not carry over, so such a
+		file is ignored with a warning and the defaults are used until calibrate() is run
+
+		Args:
+			none
+
+		Returns:
+			No return value
+
+		Raises:
+			ValueError(string): Raised when the file is not a dispatch configuration
+		"""
+		with open(self.path) as file:
+			config = json.load(file)
+		if not isinstance(config.get("methods"),dict):
+			raise ValueError("{} is not a dispatch configuration".format(self.path))
+		if config.get("machine") != machine():
+			warnings.warn("{} was calibrated on {}, not on this machine ({}), using the defaults".format(self.path,config.get("machine"),machine()),RuntimeWarning)
+			self.config = {}
+			return
+		self.config = config["methods"]
+
+	def save(self):
+		"""
+		Method to write the configuration file, with the machine it was calibrated on
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		directory = os.path.dirname(self.path)
+		if directory:
+			os.makedirs(directory,exist_ok=True)
+		with open(self.path,"w") as file:
+			json.dump({"machine": machine(),"methods": self.config},file,indent=1,sort_keys=True)
+
+	def _entry(self,distribution,method,flat):
+		"""
+		Method to find the routing of a method, probing it on its first use
+
+		Args:
+			distribution(object): Distribution instance
+			method(string): Method name
+			flat(ndarray): Input, of which the first two elements are used for the probe
+
+		Returns:
+			entry(dict): Routing of the method, calibrated or probed
+		"""
+		key = "{}.{}".format(type(distribution).__name__,method)
+		entry = self.config.get(key) or self._probed.get(key)
+		if entry is None:
+			entry = self._probed[key] = {"vectorized": self._probe(getattr(distribution,method),flat),"scalarLimit": SCALAR_LIMIT,"poolLimit": None}
+		return entry
+
+	@staticmethod
+	def _probe(function,flat):
+		"""
+		Method to find whether a method takes arrays
+
+		Args:
+			function(callable): Bound method
+			flat(ndarray): Input
+
+		Returns:
+			vectorized(bool): Whether a two element array gives two results
+		"""
+		sample = np.resize(flat,2) if flat.size else np.zeros(2)
+		try:
+			result = np.asarray(function(sample))
+		except (TypeError,ValueError):
+			return False
+		return result.shape == (2,)
+
+	def _pool_map(self,distribution,method,flat,vectorized):
+		"""
+		Method to evaluate chunks of the input on the process pool
+
+		Args:
+			distribution(object): Distribution instance
+			method(string): Method name
+			flat(ndarray): One dimensional input
+			vectorized(bool): Whether the method takes arrays
+
+		Returns:
+			values(ndarray): Results in input order
+		"""
+		if self._pool is None:
+			self._pool = concurrent.futures.ProcessPoolExecutor(self.workers)
+		chunks = np.array_split(flat,self.workers)
+		futures = [self._pool.submit(_evaluate_chunk,distribution,method,chunk,vectorized) for chunk in chunks]
+		return np.concatenate([future.result() for future in futures])
+
+	def route(self,distribution,method,size):
+		"""
+		Method to find the route an input of a given size takes
+
+		Args:
+			distribution(object): Distribution instance
+			method(string): Method name
+			size(int): Number of elements
+
+		Returns:
+			route(string): "scalar", "vector" or "pool"
+		"""
+		key = "{}.{}".format(type(distribution).__name__,method)
+		entry = self.config.get(key) or self._probed.get(key)
+		if entry is None:
+			return "scalar" if size <= SCALAR_LIMIT else "vector"
+		if entry["poolLimit"] is not None and size >= entry["poolLimit"] and self.workers > 1:
+			return "pool"
+		if size <= entry["scalarLimit"] or not entry["vectorized"]:
+			return "scalar"
+		return "vector"
+
+	def evaluate(self,distribution,method,x):
+		"""
+		Method to evaluate a method of a distribution on the fastest route for the input size
+
+		Args:
+			distribution(object): Distribution instance
+			method(string): Method name, eg. "pdf", "cdf" or "ppf"
+			x(float/array): Input
+
+		Returns:
+			values(float/ndarray): Float for scalar input, array of the shape of x otherwise
+		"""
+		function = getattr(distribution,method)
+		if np.ndim(x) == 0:
+			return float(function(float(x)))
+
+		x = np.asarray(x,dtype=np.float64)
+		flat = x.ravel()
+		entry = self._entry(distribution,method,flat)
+		route = self.route(distribution,method,flat.size)
+		if route == "pool":
+			values = self._pool_map(distribution,method,flat,entry["vectorized"])
+		elif route == "scalar":
+			values = _scalar_loop(function,flat)
+		else:
+			values = np.asarray(function(flat),dtype=np.float64)
+		return values.reshape(x.shape)
+
+	def calibrate(self,distributions,methods=("pdf","cdf","ppf"),pool=True,save=True):
+		"""
+		Method to measure the crossovers of every method on this machine
+
+		Args:
+			distributions(list): Distribution instances, one per class to calibrate
+			methods(tuple): Method names, those an instance lacks are skipped
+			pool(bool): Whether to time the process pool (needs more than one worker)
+			save(bool): Whether to write the configuration file afterwards
+
+		Returns:
+			config(dict): Routing of every calibrated "Class.method"
+		"""
+		rng = np.random.default_rng(0)
+		for distribution in distributions:
+			for method in methods:
+				if not hasattr(distribution,method):
+					continue
+				function = getattr(distribution,method)
+				x = self._points(distribution,method,rng,max(CALIBRATION_SIZES))
+				vectorized = self._probe(function,x)
+
+				"""
+				scalarLimit: largest size at which the scalar loop still beats one numpy call
+				"""
+				scalarLimit = 0
+				if vectorized:
+					for size in CALIBRATION_SIZES:
+						part = x[:size]
+						if _best_time(lambda: _scalar_loop(function,part)) < _best_time(lambda: function(part)):
+							scalarLimit = size
+				else:
+					scalarLimit = max(CALIBRATION_SIZES)
+
+				"""
+				poolLimit: smallest size at which the pool beats the single process route
+				"""
+				poolLimit = None
+				if pool and self.workers > 1:
+					large = self._points(distribution,method,rng,max(POOL_SIZES))
+					self._pool_map(distribution,method,large[:2 * self.workers],vectorized)
+					for size in POOL_SIZES:
+						part = large[:size]
+						single = _best_time(lambda: _evaluate_chunk(distribution,method,part,vectorized),repeat=3)
+						if _best_time(lambda: self._pool_map(distribution,method,part,vectorized),repeat=3) < single:
+							poolLimit = size
+							break
+
+				key = "{}.{}".format(type(distribution).__name__,method)
+				self.config[key] = {"vectorized": vectorized,"scalarLimit": scalarLimit,"poolLimit": poolLimit}
+
+		if save:
+			self.save()
+		return self.config
+
+	@staticmethod
+	def _points(distribution,method,rng,size):
+		"""
+		Method to draw calibration inputs in the domain of a method
+
+		Args:
+			distribution(object): Distribution instance
+			method(string): Method name
+			rng(Generator): Random generator
+			size(int): Number of points
+
+		Returns:
+			x(ndarray): Probabilities for ppf, points in the bulk of the distribution otherwise
+		"""
+		u = rng.uniform(0.01,0.99,size)
+		if method == "ppf":
+			return u
+		if hasattr(distribution,"ppf"):
+			return np.asarray([distribution.ppf(q) for q in u[:64]] * (size // 64 + 1),dtype=np.float64)[:size]
+		#Without a ppf, points one standard deviation either side of the mean, when both are defined
+		try:
+			center, spread = float(distribution.mean), float(distribution.stdev)
+		except (AttributeError,TypeError,ValueError):
+			center, spread = 0.0, 1.0
+		return center + spread * (2 * u - 1)
+
+	def close(self):
+		"""
+		Method to shut the process pool down
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		if self._pool is not None:
+			self._pool.shutdown()
+			self._pool = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,*exception):
+		self.close()
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the dispatcher
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the dispatcher
+		"""
+		return "Config: {}, Methods: {}, Workers: {}".format(self.path,len(self.config),self.workers)
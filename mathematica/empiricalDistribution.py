@@ -0,0 +1,381 @@
+"""
+Empirical Distribution
+(Fixed memory streaming histogram with log or linear buckets)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import numpy as np
+from .generalDistribution import Distribution, _combine_moments	#Import generalDistribution.py module
+
+#Layout of the buffer header, followed by one float64 count per bucket
+LOG, LINEAR = 0.0, 1.0
+HEADER = 9
+
+class Empirical(Distribution):
+	"""
+	Empirical distribution class for percentile, cdf, pdf and moment queries on streamed data
+	Empirical class inherits from distribution class of generalDistribution.py module
+
+	Notation:
+		Log buckets (HDR style) grow by γ = (1+a)/(1-a), so a bucket representative is within
+		a relative error a of any value in the bucket. Values in (-lowest, lowest) share a zero
+		bucket and values beyond ±highest fall in two overflow buckets.
+
+	Attributes:
+		1. edges (bucket boundaries, the outermost are ±∞)
+		2. counts (number of values in every bucket)
+		3. count, average, m2 (exact number, mean and sum of squared deviations of the values)
+		4. minimum, maximum (exact extremes)
+
+	Notes:
+		All state lives in one float64 buffer (header, then counts), so to_buffer() and
+		from_buffer() serialize without copying. Counts are exact up to 2^53.
+	"""
+	def __init__(self,lowest=1e-6,highest=1e9,relativeAccuracy=0.01,buffer=None):
+		Distribution.__init__(self,0,0)
+		if buffer is None:
+			if not 0 < lowest < highest:
+				raise ValueError("0 < lowest < highest is required")
+			if not 0 < relativeAccuracy < 1:
+				raise ValueError("relative accuracy must lie in (0,1)")
+			edges = self._log_edges(lowest,highest,relativeAccuracy)
+			buffer = np.zeros(HEADER + edges.size - 1)
+			buffer[:4] = (LOG,lowest,highest,relativeAccuracy)
+			buffer[7:9] = (np.inf,-np.inf)
+			self._initialise(buffer,edges)
+		else:
+			self._initialise(buffer,None)
+
+	@staticmethod
+	def _log_edges(lowest,highest,relativeAccuracy):
+		"""
+		Method to build log bucket boundaries mirrored around a zero bucket
+
+		Args:
+			lowest(float): Smallest magnitude resolved by the log buckets
+			highest(float): Largest magnitude resolved by the log buckets
+			relativeAccuracy(float): Relative error a of the bucket representatives
+
+		Returns:
+			edges(ndarray): Bucket boundaries in ascending order
+		"""
+		gamma = (1 + relativeAccuracy) / (1 - relativeAccuracy)
+		buckets = int(math.ceil(math.log(highest / lowest) / math.log(gamma)))
+		positive = lowest * gamma ** np.arange(buckets + 1)
+		return np.concatenate(([-np.inf],-positive[::-1],positive,[np.inf]))
+
+	def _initialise(self,buffer,edges):
+		"""
+		Method to attach the instance to a state buffer
+
+		Args:
+			buffer(ndarray): float64 state buffer (header followed by counts)
+			edges(ndarray): Bucket boundaries, rebuilt from the header when None
+
+		Returns:
+			No return value
+		"""
+		if edges is None:
+			mode, first, second, third = (float(value) for value in buffer[:4])
+			if mode == LOG:
+				edges = self._log_edges(first,second,third)
+			else:
+				edges = np.concatenate(([-np.inf],np.linspace(first,second,int(third) + 1),[np.inf]))
+			if buffer.size != HEADER + edges.size - 1:
+				raise ValueError("buffer does not match the bucket layout in its header")
+
+		self.buffer = buffer
+		self.edges = edges
+		#Views into the buffer, so updates write straight into it
+		self.counts = buffer[HEADER:]
+		self._cumulative = None
+
+		#Representatives, within relative error a for log buckets and the midpoint for linear ones
+		lower, upper = edges[:-1], edges[1:]
+		with np.errstate(invalid="ignore",divide="ignore"):
+			if buffer[0] == LOG:
+				centers = np.where(lower * upper > 0,2 * lower * upper / (lower + upper),0.0)
+			else:
+				centers = (lower + upper) / 2
+		self.centers = np.where(np.isfinite(centers),centers,np.where(np.isinf(lower),upper,lower))
+
+	@classmethod
+	def linear(cls,low,high,bins=1000):
+		"""
+		Method to build an empirical distribution with equal width buckets on [low, high]
+
+		Args:
+			low(float): Lower end of the bucketed range
+			high(float): Upper end of the bucketed range
+			bins(int): Number of buckets inside the range
+
+		Returns:
+			result(empirical distribution): Empty Empirical instance
+		"""
+		if not low < high:
+			raise ValueError("low must be smaller than high")
+		buffer = np.zeros(HEADER + int(bins) + 2)
+		buffer[:4] = (LINEAR,low,high,int(bins))
+		buffer[7:9] = (np.inf,-np.inf)
+		return cls(buffer=buffer)
+
+	@classmethod
+	def from_buffer(cls,buffer):
+		"""
+		Method to attach an empirical distribution to a serialized buffer without copying it
+
+		Args:
+			buffer(bytes/memoryview/ndarray): Buffer produced by to_buffer(), writable to keep updating it
+
+		Returns:
+			result(empirical distribution): Empirical instance sharing the memory of the buffer
+		"""
+		return cls(buffer=np.frombuffer(buffer,dtype=np.float64))
+
+	def to_buffer(self):
+		"""
+		Method to expose the state as a buffer without copying it
+
+		Args:
+			none
+
+		Returns:
+			buffer(memoryview): Header and counts as float64
+		"""
+		return memoryview(self.buffer)
+
+	@property
+	def count(self):
+		#Number of values seen
+		return self.buffer[4]
+
+	@property
+	def average(self):
+		#Mean of the values seen
+		return self.buffer[5]
+
+	@property
+	def m2(self):
+		#Sum of the squared deviations of the values seen from their mean
+		return self.buffer[6]
+
+	@property
+	def minimum(self):
+		#Smallest value seen
+		return self.buffer[7]
+
+	@property
+	def maximum(self):
+		#Largest value seen
+		return self.buffer[8]
+
+	def update(self,values):
+		"""
+		Method to add a chunk of values to the histogram
+
+		Args:
+			values(float/array): New values
+
+		Returns:
+			No return value
+		"""
+		values = np.asarray(values,dtype=np.float64).ravel()
+		values = values[~np.isnan(values)]
+		if values.size == 0:
+			return
+
+		buckets = np.clip(np.searchsorted(self.edges,values,side="right") - 1,0,self.counts.size - 1)
+		self.counts += np.bincount(buckets,minlength=self.counts.size)
+
+		self.buffer[4:7] = _combine_moments(*self.buffer[4:7].tolist(),values)
+		self.buffer[7] = min(self.buffer[7],values.min())
+		self.buffer[8] = max(self.buffer[8],values.max())
+		self._cumulative = None
+
+	def merge(self,other):
+		"""
+		Method to merge the histogram of another shard into this one
+
+		Args:
+			other(empirical distribution): Empirical instance with the same buckets
+
+		Returns:
+			self(empirical distribution): The merged instance
+
+		Raises:
+			ValueError(string): Raised when the bucket layouts differ
+		"""
+		if not np.array_equal(self.buffer[:4],other.buffer[:4]):
+			raise ValueError("only histograms with the same buckets can be merged")
+
+		self.counts += other.counts
+		self.buffer[4:7] = _combine_moments(*self.buffer[4:7].tolist(),other=other.buffer[4:7].tolist())
+		self.buffer[7] = min(self.buffer[7],other.buffer[7])
+		self.buffer[8] = max(self.buffer[8],other.buffer[8])
+		self._cumulative = None
+		return self
+
+	def read_data_file(self,file_name,chunkSize=1 << 20):
+		"""
+		Method to stream numbers from a txt file(file_name) into the histogram
+
+		Args:
+			file_name(string/file): Name of the file (or an open file object) to read data from
+			chunkSize(int): Number of bytes read per chunk
+
+		Returns:
+			No return value
+		"""
+		for chunk in self.read_data_chunks(file_name,chunkSize):
+			self.update(chunk)
+
+	def _bounds(self):
+		"""
+		Method to list bucket boundaries clipped to the exact extremes
+
+		Args:
+			none
+
+		Returns:
+			lower(ndarray): Lower boundary of every bucket
+			upper(ndarray): Upper boundary of every bucket
+		"""
+		lower = np.clip(self.edges[:-1],self.minimum,self.maximum)
+		upper = np.clip(self.edges[1:],self.minimum,self.maximum)
+		return lower, upper
+
+	def _cumulative_counts(self):
+		"""
+		Method to calculate the cumulative bucket counts, cached until the next update
+
+		Args:
+			none
+
+		Returns:
+			cumulative(ndarray): Number of values in every bucket and the buckets below it
+		"""
+		if self._cumulative is None:
+			self._cumulative = np.cumsum(self.counts)
+		return self._cumulative
+
+	def calculate_mean(self):
+		"""
+		Method to calculate the exact mean of the values seen
+
+		Args:
+			none
+
+		Returns:
+			self.mean(float): Mean of the values
+		"""
+		self.mean = float(self.average)
+		return self.mean
+
+	def calculate_stdev(self,sample=True):
+		"""
+		Method to calculate the exact standard deviation of the values seen
+
+		Args:
+			sample(bool): Whether the values are a sample or the whole population
+
+		Returns:
+			self.stdev(float): Standard deviation of the values
+		"""
+		n = self.count - 1 if sample else self.count
+		self.calculate_mean()
+		self.stdev = math.sqrt(float(self.m2) / n)
+		return self.stdev
+
+	def calculate_moment(self,order=3,central=True):
+		"""
+		Method to approximate a higher moment from the bucket representatives
+
+		Args:
+			order(int): Order of the moment
+			central(bool): Whether the moment is taken about the mean
+
+		Returns:
+			moment(float): Approximate moment
+		"""
+		center = self.calculate_mean() if central else 0.0
+		return float(np.dot(self.counts,(self.centers - center) ** order) / self.count)
+
+	def pdf(self,x):
+		"""
+		Method to estimate the probability density function
+
+		Args:
+			x(float/array): Points to evaluate
+
+		Returns:
+			density(float/ndarray): Fraction of values in the bucket of x divided by its width
+		"""
+		x = np.asarray(x,dtype=np.float64)
+		bucket = np.clip(np.searchsorted(self.edges,x,side="right") - 1,0,self.counts.size - 1)
+		lower, upper = self._bounds()
+		width = upper[bucket] - lower[bucket]
+
+		inside = (x >= self.minimum) & (x <= self.maximum)
+		with np.errstate(divide="ignore",invalid="ignore"):
+			density = np.where(inside,self.counts[bucket] / (self.count * width),0.0)
+		return float(density) if density.ndim == 0 else density
+
+	def cdf(self,x):
+		"""
+		Method to estimate the cumulative distribution function, interpolating inside buckets
+
+		Args:
+			x(float/array): Points to evaluate
+
+		Returns:
+			probability(float/ndarray): Estimated P(X ≤ x)
+		"""
+		x = np.asarray(x,dtype=np.float64)
+		cumulative = self._cumulative_counts()
+		bucket = np.clip(np.searchsorted(self.edges,x,side="right") - 1,0,self.counts.size - 1)
+		lower, upper = self._bounds()
+		lower, upper = lower[bucket], upper[bucket]
+
+		with np.errstate(divide="ignore",invalid="ignore"):
+			fraction = np.where(upper > lower,(np.clip(x,lower,upper) - lower) / (upper - lower),1.0)
+		below = cumulative[bucket] - self.counts[bucket]
+		probability = (below + fraction * self.counts[bucket]) / self.count
+		probability = np.where(x < self.minimum,0.0,np.where(x >= self.maximum,1.0,probability))
+		return float(probability) if probability.ndim == 0 else probability
+
+	def ppf(self,q):
+		"""
+		Method to estimate the quantile function (inverse cdf), interpolating inside buckets
+
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			quantile(float/ndarray): Estimated quantile
+		"""
+		q = np.asarray(q,dtype=np.float64)
+		cumulative = self._cumulative_counts()
+		target = q * self.count
+		bucket = np.minimum(np.searchsorted(cumulative,target,side="left"),self.counts.size - 1)
+		lower, upper = self._bounds()
+
+		below = cumulative[bucket] - self.counts[bucket]
+		with np.errstate(divide="ignore",invalid="ignore"):
+			fraction = np.where(self.counts[bucket] > 0,(target - below) / self.counts[bucket],0.0)
+		quantile = lower[bucket] + np.clip(fraction,0,1) * (upper[bucket] - lower[bucket])
+		quantile = np.where(q <= 0,self.minimum,np.where(q >= 1,self.maximum,quantile))
+		return float(quantile) if quantile.ndim == 0 else quantile
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the empirical distribution instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the empirical distribution
+		"""
+		return "Buckets: {}, Count: {}, Minimum: {}, Maximum: {}".format(self.counts.size,int(self.count),self.minimum,self.maximum)
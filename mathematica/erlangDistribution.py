@@ -6,7 +6,9 @@ Erlang Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .precision import get_dtype	#Import precision.py module
 
 class Erlang(Distribution):
 	"""
@@ -137,6 +139,21 @@ class Erlang(Distribution):
 		except ValueError as error:
 			raise
 
+	def sample(self,size=1,seed=None):
+		"""
+		Method to draw random variates from the erlang distribution, in the dtype of the precision policy
+
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of erlang random variates
+		"""
+		rng = np.random.default_rng(seed)
+		#Erlang(k,μ) is a gamma distribution with integer shape k and scale μ
+		return float(self.mu) * rng.standard_gamma(self.k,size,dtype=get_dtype())
+
 	def __add__(self,other):
 		"""
 		Method to add together two erlang distributions
@@ -5,7 +5,9 @@ Exponential Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#import generalDistribution.py module
+from .precision import get_dtype	#Import precision.py module
 
 class Exponential(Distribution):
 	"""
@@ -79,22 +81,54 @@ class Exponential(Distribution):
 		Method to calculate probability density function for exponential distribution
 
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			self.lamda(float): Probability density function for exponential distribution
+			pdf(float/ndarray): Probability density function for exponential distribution, 0 for x < 0
 		"""
-		#For random variable less than zero
-		if x < 0:
-			return 0
-
-		#Otherwise,
-		else:
-			power = -1.0 * self.lamda * x
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			return self.lamda * math.exp(-self.lamda * x) if x >= 0 else 0.0
+		lamda = float(self.lamda)
+		def kernel(x):
 			"""
-			f(x;λ) = λ e^(-λ/x)
+			f(x;λ) = λ e^(-λx), x ≥ 0
 			"""
-			return self.lamda * math.exp(power)
+			return np.where(x >= 0,lamda * np.exp(-lamda * np.maximum(x,0)),0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for exponential distribution
+
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for exponential distribution
+		"""
+		if isinstance(x,(int,float)):
+			return -math.expm1(-self.lamda * max(x,0.0))
+		lamda = float(self.lamda)
+		def kernel(x):
+			#F(x;λ) = 1 - e^(-λx), x ≥ 0
+			return -np.expm1(-lamda * np.maximum(x,0))
+		return _blockwise(kernel,x)
+
+	def sample(self,size=1,seed=None):
+		"""
+		Method to draw random variates from the exponential distribution, in the dtype of the precision policy
+
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of exponential random variates
+		"""
+		rng = np.random.default_rng(seed)
+		#Scale of the distribution = 1/λ
+		return (1.0 / float(self.lamda)) * rng.standard_exponential(size,dtype=get_dtype())
 
 	def __add__(self,other):
 		"""
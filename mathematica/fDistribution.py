@@ -6,7 +6,9 @@ F Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+from .specialFunctions import regularized_incomplete_beta	#Import specialFunctions.py module
 
 class F(Distribution):
 	"""
@@ -104,34 +106,62 @@ class F(Distribution):
 		Method to calculate probability density function for F distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for F distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for F distribution, 0 for x < 0
 		"""
-		try:
-			#Numerator of the pdf
-			pdfNumerator = math.gamma((self.d1 + self.d2) / 2) * ((self.d1 / self.d2) ** (self.d1 / 2)) * (x ** ((self.d1 / 2) - 1))
-			#Denominator of the pdf
-			pdfDenominator = math.gamma(self.d1 / 2) * math.gamma(self.d2 / 2) * (1 + ((self.d1 * x) / self.d2)) ** ((self.d1 + self.d2) / 2)
+		d1, d2 = self.d1, self.d2
+		#ln[Γ(d1+d2 / 2) (d1/d2)^(d1/2) / (Γ(d1/2) Γ(d2/2))]
+		logConstant = math.lgamma((d1 + d2) / 2) - math.lgamma(d1 / 2) - math.lgamma(d2 / 2) + d1 / 2 * math.log(d1 / d2)
+		#f(0) is infinite for d1 < 2, 1 for d1 = 2 and 0 otherwise
+		atZero = math.inf if d1 < 2 else (1.0 if d1 == 2 else 0.0)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if x > 0:
+				return math.exp(logConstant + (d1 / 2 - 1) * math.log(x) - (d1 + d2) / 2 * math.log1p(d1 * x / d2))
+			return atZero if x == 0 else 0.0
+
+		def kernel(x):
 			"""
 					Γ(d1+d2 / 2) (d1/d2)^(d1/2) x^(d1/2 - 1)
 			f(x;d1,d2) = ----------------------------------------------, x>0
 					Γ(d1/2) Γ(d2/2) (1 + d1x/d2)^(d1+d2 / 2)
 			"""
-			return pdfNumerator / pdfDenominator
+			with np.errstate(divide="ignore",invalid="ignore"):
+				pdf = np.exp(logConstant + (d1 / 2 - 1) * np.log(x) - (d1 + d2) / 2 * np.log1p(d1 * x / d2))
+			return np.where(x > 0,pdf,np.where(x == 0,atZero,0.0))
+		return _blockwise(kernel,x)
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for F distribution
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for F distribution
+		"""
+		x = np.maximum(np.asarray(x,dtype=np.float64),0)
+		"""
+		F(x;d1,d2) = I_t(d1/2, d2/2), t = d1 x / (d1 x + d2)
+		"""
+		return regularized_incomplete_beta(self.d1 / 2,self.d2 / 2,self.d1 * x / (self.d1 * x + self.d2))
+
+	def sf(self,x):
+		"""
+		Method to calculate survival function (1 - cdf) for F distribution
+
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			sf(float/ndarray): Survival function for F distribution
+		"""
+		x = np.maximum(np.asarray(x,dtype=np.float64),0)
+		#Evaluated directly, so that small upper tail probabilities keep their precision
+		return regularized_incomplete_beta(self.d2 / 2,self.d1 / 2,self.d2 / (self.d2 + self.d1 * x))
 
 	def __repr__(self):
 		"""
@@ -6,7 +6,9 @@ Gaussian Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+from .precision import get_dtype	#Import precision.py module
 
 class Gaussian(Distribution):
 	"""
@@ -82,18 +84,39 @@ class Gaussian(Distribution):
 		Method to calculate probability density function for gaussian distribution
 		
 		Args:
-			x(float): Point for calculating pdf
+			x(float/array): Point for calculating pdf
 					
 		Returns:
-			pdf(float): Probability density function for gaussian distribution
+			pdf(float/ndarray): Probability density function for gaussian distribution
 		"""
-		pdf = (1.0 / (self.stdev * math.sqrt(2 * math.pi))) * math.exp(-0.5 * ((x - self.mean) / self.stdev) ** 2)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			z = (x - self.mean) / self.stdev
+			return math.exp(-0.5 * z * z) / (self.stdev * math.sqrt(2 * math.pi))
+		mean, stdev = float(self.mean), float(self.stdev)
+		def kernel(x):
+			"""
+				      1	    -(1/2)((x-μ)/σ)^(2)
+			f(x;μ,σ) = ------- e
+				    σ √2π
+			"""
+			z = (x - mean) / stdev
+			return (1.0 / (stdev * math.sqrt(2 * math.pi))) * np.exp(-0.5 * z * z)
+		return _blockwise(kernel,x)
+
+	def sample(self,size=1,seed=None):
 		"""
-			      1	    -(1/2)((x-μ)/σ)^(2)
-		f(x;μ,σ) = ------- e
-			    σ √2π
+		Method to draw random variates from the gaussian distribution, in the dtype of the precision policy
+
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of gaussian random variates
 		"""
-		return pdf
+		rng = np.random.default_rng(seed)
+		return float(self.mean) + float(self.stdev) * rng.standard_normal(size,dtype=get_dtype())
 
 	def __add__(self, other):
 		
@@ -5,6 +5,294 @@ General Distribution
 # Author: Ashwin Raj <rajashwin733@gmail.com>
 # License: GNU General Public License v3.0
 
+import os
+import glob
+import math
+import itertools
+import collections
+import concurrent.futures
+import numpy as np
+from .chebyshevApproximation import ApproximatedDistribution	#Import chebyshevApproximation.py module
+from .compressedInput import decompressing_reader	#Import compressedInput.py module
+from .dataCache import DataCache	#Import dataCache.py module
+from .precision import get_dtype	#Import precision.py module
+
+#Sampling schemes understood by Distribution.read_data_file
+SAMPLING = (None,"reservoir","bernoulli","stride")
+
+def _open(file_name,chunkSize=1 << 20):
+	"""
+	Function to open a file for binary reading unless an open file object is given
+	gzip, bz2, xz and zstd data is recognised by its magic bytes and decompressed on the fly
+
+	Args:
+		file_name(string/file): Name of the file or an open file object
+		chunkSize(int): Number of bytes decompressed per block
+
+	Returns:
+		file(file): File object yielding the (decompressed) bytes
+		owned(bool): Whether the caller has to close the file
+	"""
+	if isinstance(file_name,(str,bytes)) or hasattr(file_name,"__fspath__"):
+		file = open(file_name,"rb")
+		try:
+			return decompressing_reader(file,chunkSize,owned=True), True
+		except BaseException:
+			file.close()
+			raise
+
+	file = decompressing_reader(file_name,chunkSize)
+	#A decompressor wrapped around the caller's file is closed here, the file itself is not
+	return file, file is not file_name
+
+def _read_lines(file,chunkSize):
+	"""
+	Function to split a file into blocks of complete lines
+
+	Args:
+		file(file): File object opened for reading
+		chunkSize(int): Number of bytes read per block
+
+	Returns:
+		blocks(generator): Yields (block, starts, ends) with the byte range of every line
+	"""
+	remainder = b""
+	while True:
+		block = file.read(chunkSize)
+		if not block:
+			break
+		if isinstance(block,str):
+			block = block.encode()
+
+		block = remainder + block
+		ends = np.flatnonzero(np.frombuffer(block,dtype=np.uint8) == 10)
+		if ends.size == 0:
+			remainder = block
+			continue
+		remainder = block[ends[-1] + 1:]
+		yield block, np.concatenate(([0],ends[:-1] + 1)), ends
+
+	#The last line may have no newline
+	if remainder.strip():
+		yield remainder, np.array([0]), np.array([len(remainder)])
+
+def _tokens(block):
+	"""
+	Function to find the whitespace separated fields of a block, as read_data_chunks splits them
+
+	Args:
+		block(bytes): Block of complete lines
+
+	Returns:
+		starts(ndarray): Byte offset where every field starts
+		ends(ndarray): Byte offset just past the end of every field
+	"""
+	#Spaces, tabs, newlines and carriage returns all separate fields, blank lines hold none
+	filled = np.frombuffer(block,dtype=np.uint8) > 32
+	edges = np.flatnonzero(np.diff(filled.view(np.int8),prepend=0,append=0))
+	return edges[0::2], edges[1::2]
+
+def _parse(block,starts,ends,lines):
+	"""
+	Function to parse selected fields of a block
+
+	Args:
+		block(bytes): Block of complete lines
+		starts(ndarray): Byte offset where every field starts
+		ends(ndarray): Byte offset where every field ends
+		lines(ndarray): Fields to parse, relative to the block
+
+	Returns:
+		values(ndarray): Parsed float64 values
+	"""
+	return np.array([float(block[starts[i]:ends[i]]) for i in lines],dtype=np.float64)
+
+def _count(values):
+	"""
+	Function to collapse values into distinct values and their counts
+
+	Args:
+		values(array): Values
+
+	Returns:
+		distinct(ndarray): Distinct values in ascending order
+		counts(ndarray): Number of occurrences of every distinct value
+	"""
+	values = np.asarray(values,dtype=np.float64).ravel()
+	if values.size == 0:
+		return np.empty(0), np.empty(0,dtype=np.int64)
+
+	#Small non-negative integers are counted with one bincount pass instead of a sort
+	largest = values.max()
+	if values.min() >= 0 and largest <= 16 * values.size + 1024 and np.array_equal(values,np.floor(values)):
+		counts = np.bincount(values.astype(np.int64))
+		distinct = np.flatnonzero(counts)
+		return distinct.astype(np.float64), counts[distinct]
+	return np.unique(values,return_counts=True)
+
+def _merge_counts(values,counts):
+	"""
+	Function to merge several counted representations into one
+
+	Args:
+		values(list): Distinct values of every part
+		counts(list): Counts of every part
+
+	Returns:
+		distinct(ndarray): Distinct values in ascending order
+		counts(ndarray): Total count of every distinct value
+	"""
+	distinct, inverse = np.unique(np.concatenate(values),return_inverse=True)
+	total = np.zeros(distinct.size,dtype=np.int64)
+	np.add.at(total,inverse.ravel(),np.concatenate(counts))
+	return distinct, total
+
+def _combine_moments(count,mean,m2,values=None,other=None):
+	"""
+	Function to fold a chunk of values, or the moments of another part, into running moments
+	with the parallel formula of Chan et al., which does not cancel like Σx² - n·mean²
+
+	Args:
+		count(float): Number of values so far
+		mean(float): Mean of the values so far
+		m2(float): Sum of the squared deviations from the mean so far
+		values(ndarray): Chunk of new values
+		other(tuple): (count, mean, m2) of another part, used when values is None
+
+	Returns:
+		moments(tuple): Combined (count, mean, m2)
+	"""
+	if values is not None:
+		otherMean = float(values.mean()) if values.size else 0.0
+		other = (values.size,otherMean,float(np.dot(values - otherMean,values - otherMean)))
+	otherCount, otherMean, otherM2 = other
+	if otherCount == 0:
+		return count, mean, m2
+	total = count + otherCount
+	delta = otherMean - mean
+	return total, mean + delta * otherCount / total, m2 + otherM2 + delta * delta * count * otherCount / total
+
+def _bernoulli_positions(rng,fraction,batch=65536):
+	"""
+	Function to draw the positions kept by bernoulli sampling, skipping ahead by geometric gaps
+
+	Args:
+		rng(Generator): Random number generator
+		fraction(float): Probability of keeping each value
+		batch(int): Number of positions drawn at once
+
+	Returns:
+		positions(generator): Yields ascending arrays of kept positions
+	"""
+	position = -1
+	while True:
+		positions = position + np.cumsum(rng.geometric(fraction,batch))
+		position = int(positions[-1])
+		yield positions
+
+def _blockwise(kernel,x,blockSize=1 << 15):
+	"""
+	Function to apply an elementwise kernel in cache sized blocks, so the temporaries of
+	masked or piecewise expressions stay in cache instead of streaming through memory.
+	Inputs and results take the dtype of the precision policy (see precision.py). Its numpy
+	calls cost microseconds, so methods evaluate Python scalars with math before calling it
+
+	Args:
+		kernel(callable): Maps a float array to an array of the same shape
+		x(float/array): Input
+		blockSize(int): Number of elements per block
+
+	Returns:
+		result(float/ndarray): Float for scalar input, array of the shape of x otherwise
+	"""
+	dtype = get_dtype()
+	x = np.asarray(x,dtype=dtype)
+	if x.size <= blockSize:
+		result = np.asarray(kernel(x),dtype=dtype)
+		return float(result) if result.ndim == 0 else result
+
+	flat = x.ravel()
+	result = np.empty_like(flat)
+	for start in range(0,flat.size,blockSize):
+		result[start:start + blockSize] = kernel(flat[start:start + blockSize])
+	return result.reshape(x.shape)
+
+def _recurrence_pmf(lo,hi,support,mode,spread,logRatio,logRelative):
+	"""
+	Function to evaluate a discrete pmf on k = lo..hi from the ratios of neighbouring terms,
+	summing log ratios outward from the mode and normalizing over the bulk of the mass
+
+	Args:
+		lo(int): First k of the range
+		hi(int): Last k of the range
+		support(tuple): First and last k of the support, the last may be math.inf
+		mode(int): Mode of the distribution
+		spread(float): Standard deviation, sizes the window summed for the normalization
+		logRatio(callable): Maps an array of k to ln(f(k+1)/f(k))
+		logRelative(callable): Maps one k to ln(f(k)/f(mode)), used only for ranges away from the mode
+
+	Returns:
+		pmf(ndarray): f(k) for k = lo..hi, zero outside the support
+	"""
+	def relative(a,b):
+		#ln(f(k)/f(mode)) for k = a..b, anchored at the point of the range nearest the mode
+		anchor = min(max(mode,a),b)
+		offset = 0.0 if anchor == mode else float(logRelative(anchor))
+		ratios = logRatio(np.arange(a,b,dtype=np.float64))
+		index = anchor - a
+		logs = np.empty(b - a + 1)
+		logs[index] = offset
+		logs[index + 1:] = offset + np.cumsum(ratios[index:])
+		logs[:index] = offset - np.cumsum(ratios[:index][::-1])[::-1]
+		return logs
+
+	pmf = np.zeros(max(hi - lo + 1,0))
+	first, last = max(lo,support[0]), min(hi,support[1])
+	if first > last:
+		return pmf
+
+	#Beyond 40 standard deviations the mass is below double precision
+	width = int(math.ceil(40 * spread)) + 40
+	low, high = max(mode - width,support[0]), int(min(mode + width,support[1]))
+	logNormalizer = math.log(np.exp(relative(low,high)).sum())
+
+	pmf[first - lo:last - lo + 1] = np.exp(relative(first,int(last)) - logNormalizer)
+	return pmf
+
+def _load_file(file_name,options):
+	"""
+	Function to read one file in a worker
+
+	Args:
+		file_name(string): Name of the file
+		options(dict): Keyword arguments of read_data_file
+
+	Returns:
+		data(ndarray): Values, None when counted
+		values(ndarray): Distinct values when counted
+		frequencies(ndarray): Counts of the distinct values when counted
+	"""
+	reader = Distribution()
+	reader.read_data_file(file_name,**options)
+	return (None if options.get("counted") else np.asarray(reader.data)), reader.values, reader.frequencies
+
+def _aggregate_file(file_name,factory,chunkSize):
+	"""
+	Function to stream one file into a new partial aggregate in a worker
+
+	Args:
+		file_name(string): Name of the file
+		factory(callable): Builds an empty accumulator with update(values)
+		chunkSize(int): Number of bytes read per chunk
+
+	Returns:
+		partial(object): Accumulator holding the values of the file
+	"""
+	partial = factory()
+	for chunk in Distribution().read_data_chunks(file_name,chunkSize):
+		partial.update(chunk)
+	return partial
+
 class Distribution:
 	"""
 	Generic Distribution class for calculating probability distribution
@@ -18,33 +306,440 @@ class Distribution:
 		self.mean = mu
 		#Sandard deviation of the distribution
 		self.stdev = sigma
-		#List of floats extracted from input file
+		#Floats extracted from input file
 		self.data = []
+		#Counted representation of the data, distinct values and their counts
+		self.values = None
+		self.frequencies = None
 
 	
-	def read_data_file(self,file_name):
+	def read_data_file(self,file_name,sampling=None,size=None,fraction=None,stride=None,seed=None,dtype=None,counted=False,cache=None,chunkSize=1 << 20):
 		"""
 		Method to read data from a txt file(file_name) and store in self.data.
-		The txt file should have one number (float) per line.
+		The txt file should have one number (float) per line. Files with a dtype (raw binary)
+		or a .npy extension are memory mapped, so only the sampled values are read from disk.
 
 		Args:
-			Name of the file to read data from.
+			file_name(string/file): Name of the file (or an open file object) to read data from
+			sampling(string): None (every value), "reservoir", "bernoulli" or "stride"
+			size(int): Number of values kept by reservoir sampling
+			fraction(float): Probability of keeping each value in bernoulli sampling
+			stride(int): Distance between the values kept by stride sampling
+			seed(int): Seed making the sample reproducible
+			dtype(string/dtype): Type of the values of a raw binary file
+			counted(bool): Store distinct values and counts (self.values, self.frequencies) instead of self.data
+			cache(DataCache/bool): Cache of parsed txt files, True for .npy sidecars next to the source.
+				Open file objects have no path to key a sidecar on and are always parsed
+			chunkSize(int): Number of bytes read per chunk of a txt file
 
 		Returns:
 			No return value
+
+		Raises:
+			ValueError(string): Raised when the sampling scheme or its parameter is invalid
 		"""
-		with open(file_name) as file:
-		#file_name: name of the txt file to read data from
-			data_list = []
-			#Returns one line from the file
-			line = file.readline()
+		if sampling not in SAMPLING:
+			raise ValueError("sampling must be None, 'reservoir', 'bernoulli' or 'stride'")
+		if sampling == "reservoir" and not (size is not None and size >= 1):
+			raise ValueError("reservoir sampling needs a size of at least 1")
+		if sampling == "bernoulli" and not (fraction is not None and 0 < fraction <= 1):
+			raise ValueError("bernoulli sampling needs a fraction in (0,1]")
+		if sampling == "stride" and not (stride is not None and stride >= 1):
+			raise ValueError("stride sampling needs a stride of at least 1")
+
+		rng = np.random.default_rng(seed)
+		self.values = None
+		self.frequencies = None
+		binary = dtype is not None or str(file_name).endswith(".npy")
+
+		if cache and not binary and isinstance(file_name,(str,os.PathLike)):
+			#A cached file is memory mapped, a miss parses the whole file once and writes the sidecar
+			cache = DataCache() if cache is True else cache
+			#The key is taken before parsing, so a file written meanwhile is not cached as its new version
+			location = cache.sidecar(file_name)
+			values = cache.load(file_name,location)
+			if values is None:
+				chunks = list(self.read_data_chunks(file_name,chunkSize))
+				values = np.concatenate(chunks) if chunks else np.empty(0)
+				sidecar = cache.store(file_name,values,location)
+				#Without a sidecar (unwritable cache folder) the parsed values are kept in memory
+				if sidecar is not None:
+					values = np.load(sidecar,mmap_mode="r")
+			data = self._sample_values(values,sampling,size,fraction,stride,rng)
 
-			while line:
-				#Add data to the list
-				data_list.append(int(line))
-				line = file.readline()
+		elif counted and sampling is None and not binary:
+			#Every chunk is counted as it is read, so memory follows the number of distinct values
+			values, counts = [], []
+			for chunk in self.read_data_chunks(file_name,chunkSize):
+				distinct, frequency = _count(chunk)
+				values.append(distinct)
+				counts.append(frequency)
+				if len(values) >= 64:
+					distinct, frequency = _merge_counts(values,counts)
+					values, counts = [distinct], [frequency]
+			self.values, self.frequencies = _merge_counts(values,counts) if values else _count([])
+			self.data = []
+			return
+
+		elif binary:
+			data = self._read_binary(file_name,sampling,size,fraction,stride,rng,dtype)
+		elif sampling is None:
+			chunks = list(self.read_data_chunks(file_name,chunkSize))
+			data = np.concatenate(chunks) if chunks else np.empty(0)
+		else:
+			data = self._read_sampled_values(file_name,sampling,size,fraction,stride,rng,chunkSize)
+
+		if counted:
+			self.values, self.frequencies = _count(data)
+			self.data = []
+			return
 
-		#Close the file
-		file.close()
 		#store the data in the class attribute
-		self.data = data_list
\ No newline at end of file
+		self.data = data
+
+	def read_data_files(self,file_names,workers=None,accumulator=None,factory=None,processes=False,**options):
+		"""
+		Method to read many files concurrently and merge them in the order of the paths.
+		Reads and decompression release the GIL and overlap on threads, but parsing text into
+		floats holds it, so processes=True is the choice when parsing dominates.
+
+		Args:
+			file_names(string/list): Glob pattern (eg. "logs/*.txt.gz") or list of file names
+			workers(int): Number of threads (or processes), the executor default when None
+			accumulator(object): Estimator with update(values) (or merge(partial) with a factory)
+				fed in path order instead of storing the values in self.data
+			factory(callable): Builds an empty accumulator per file, so workers aggregate their
+				file and only partials travel back to be merged into the accumulator
+			processes(bool): Use a process pool instead of a thread pool
+			**options: Keyword arguments of read_data_file applied to every file
+
+		Returns:
+			accumulator(object): The accumulator, None when the values are stored in self.data
+
+		Raises:
+			ValueError(string): Raised when a factory is given without an accumulator to merge into
+		"""
+		if isinstance(file_names,(str,bytes)) or hasattr(file_names,"__fspath__"):
+			file_names = sorted(glob.glob(os.fspath(file_names),recursive=True))
+		file_names = list(file_names)
+		if factory is not None and accumulator is None:
+			raise ValueError("a factory needs an accumulator to merge the partial aggregates into")
+
+		executor = concurrent.futures.ProcessPoolExecutor(workers) if processes else concurrent.futures.ThreadPoolExecutor(workers)
+		#Only a bounded window of files is in flight, so memory does not grow with the file count
+		window = 2 * getattr(executor,"_max_workers",4)
+		counted = options.get("counted",False) and accumulator is None
+		if accumulator is not None:
+			options = dict(options,counted=False)
+		chunkSize = options.get("chunkSize",1 << 20)
+
+		def submit(file_name):
+			if factory is not None:
+				return executor.submit(_aggregate_file,file_name,factory,chunkSize)
+			return executor.submit(_load_file,file_name,options)
+
+		parts, values, frequencies = [], [], []
+		with executor:
+			names = iter(file_names)
+			pending = collections.deque(submit(name) for position,name in zip(range(window),names))
+			while pending:
+				#Results are consumed in path order while the next file is already submitted
+				result = pending.popleft().result()
+				for name in itertools.islice(names,1):
+					pending.append(submit(name))
+
+				if factory is not None:
+					accumulator.merge(result)
+				elif accumulator is not None:
+					accumulator.update(result[0])
+				elif counted:
+					values.append(result[1])
+					frequencies.append(result[2])
+				else:
+					parts.append(result[0])
+
+		if accumulator is not None:
+			return accumulator
+
+		self.values = None
+		self.frequencies = None
+		if counted:
+			self.values, self.frequencies = _merge_counts(values,frequencies) if values else _count(np.empty(0))
+			self.data = []
+			return None
+
+		#One allocation for the merged buffer
+		data = np.empty(sum(part.size for part in parts))
+		offset = 0
+		for part in parts:
+			data[offset:offset + part.size] = part
+			offset += part.size
+		self.data = data
+		return None
+
+	def count_data(self):
+		"""
+		Method to return the data in counted form, distinct values and their counts
+
+		Args:
+			none
+
+		Returns:
+			values(ndarray): Distinct values in ascending order
+			frequencies(ndarray): Number of occurrences of every distinct value
+		"""
+		#Data loaded without counted=True is counted on every call, so later edits of self.data are seen
+		if self.values is None:
+			return _count(self.data)
+		return self.values, self.frequencies
+
+	def _weighted_data(self,values=None,counts=None):
+		"""
+		Method to resolve the values and counts used by a weighted fit
+
+		Args:
+			values(array): Distinct values, the counted data of the instance when None
+			counts(array): Count (or weight) of every value, ones when None
+
+		Returns:
+			values(ndarray): Values as float64
+			counts(ndarray): Counts as float64
+		"""
+		if values is None:
+			values, counts = self.count_data()
+		values = np.asarray(values,dtype=np.float64)
+		counts = np.ones(values.shape) if counts is None else np.asarray(counts,dtype=np.float64)
+		return values, counts
+
+	def _read_binary(self,file_name,sampling,size,fraction,stride,rng,dtype):
+		"""
+		Method to sample a raw binary or .npy file through a memory map
+
+		Args:
+			file_name(string): Name of the file
+			sampling(string): Sampling scheme
+			size(int): Reservoir size
+			fraction(float): Bernoulli probability
+			stride(int): Stride
+			rng(Generator): Random number generator
+			dtype(string/dtype): Type of the values of a raw binary file
+
+		Returns:
+			data(ndarray): Sampled float64 values
+		"""
+		if str(file_name).endswith(".npy"):
+			values = np.load(file_name,mmap_mode="r")
+		else:
+			values = np.memmap(file_name,dtype=dtype,mode="r")
+		return self._sample_values(values,sampling,size,fraction,stride,rng)
+
+	def _sample_values(self,values,sampling,size,fraction,stride,rng):
+		"""
+		Method to sample an array, typically a memory map, reading only the kept values
+
+		Args:
+			values(ndarray): Values to sample
+			sampling(string): Sampling scheme
+			size(int): Reservoir size
+			fraction(float): Bernoulli probability
+			stride(int): Stride
+			rng(Generator): Random number generator
+
+		Returns:
+			data(ndarray): Sampled float64 values
+		"""
+		values = values.reshape(-1)
+		total = values.size
+
+		if sampling is None:
+			#float64 memory maps are used in place, without a copy
+			return np.asarray(values,dtype=np.float64)
+		if sampling == "stride":
+			#Slicing a memory map only touches the pages holding the kept values
+			return np.array(values[int(rng.integers(stride)) % max(total,1)::stride],dtype=np.float64)
+		if sampling == "reservoir":
+			#The length is known, so a uniform subset replaces the single pass reservoir
+			index = np.sort(rng.choice(total,min(size,total),replace=False))
+			return np.array(values[index],dtype=np.float64)
+
+		kept = []
+		for positions in _bernoulli_positions(rng,fraction):
+			kept.append(positions[positions < total])
+			if positions[-1] >= total:
+				break
+		return np.array(values[np.concatenate(kept)],dtype=np.float64)
+
+	def _read_sampled_values(self,file_name,sampling,size,fraction,stride,rng,chunkSize):
+		"""
+		Method to sample the numbers of a txt file in one pass, parsing only the kept ones.
+		Numbers are split on any whitespace like read_data_chunks, so blank lines are skipped
+		and a line holding several numbers contributes each of them.
+
+		Args:
+			file_name(string/file): Name of the file or an open file object
+			sampling(string): Sampling scheme
+			size(int): Reservoir size
+			fraction(float): Bernoulli probability
+			stride(int): Stride
+			rng(Generator): Random number generator
+			chunkSize(int): Number of bytes read per block
+
+		Returns:
+			data(ndarray): Sampled float64 values
+		"""
+		file, owned = _open(file_name,chunkSize)
+		kept = []
+		first = 0
+
+		if sampling == "stride":
+			following = int(rng.integers(stride))
+		elif sampling == "bernoulli":
+			positions = _bernoulli_positions(rng,fraction)
+			pending = next(positions)
+		else:
+			reservoir = np.empty(size)
+			filled = 0
+
+		try:
+			for block, lineStarts, lineEnds in _read_lines(file,chunkSize):
+				#The block may carry the start of the next line after its last newline
+				starts, ends = _tokens(block[:lineEnds[-1] + 1])
+				last = first + starts.size
+
+				if sampling == "stride":
+					lines = np.arange(following,last,stride)
+					if lines.size:
+						following = int(lines[-1]) + stride
+					kept.append(_parse(block,starts,ends,lines - first))
+
+				elif sampling == "bernoulli":
+					while pending[-1] < last:
+						pending = np.concatenate((pending,next(positions)))
+					lines = pending[pending < last]
+					pending = pending[lines.size:]
+					kept.append(_parse(block,starts,ends,lines - first))
+
+				else:
+					if filled < size:
+						#The first size lines fill the reservoir
+						taken = min(size - filled,starts.size)
+						reservoir[filled:filled + taken] = _parse(block,starts,ends,np.arange(taken))
+						filled += taken
+						if filled == size:
+							weight = np.exp(np.log(rng.random()) / size)
+							following = size - 1 + int(np.log(rng.random()) / np.log1p(-weight)) + 1
+
+					"""
+					Algorithm L: the gap to the next replaced line is geometric with
+					parameter W, and W shrinks by U^(1/k) after every replacement
+					"""
+					while filled == size and following < last:
+						reservoir[rng.integers(size)] = float(block[starts[following - first]:ends[following - first]])
+						weight *= np.exp(np.log(rng.random()) / size)
+						following += int(np.log(rng.random()) / np.log1p(-weight)) + 1
+
+				first = last
+		finally:
+			if owned:
+				file.close()
+
+		if sampling == "reservoir":
+			return reservoir[:filled].copy()
+		return np.concatenate(kept) if kept else np.empty(0)
+
+	def logpdf(self,x):
+		"""
+		Method to calculate the natural logarithm of the probability density function
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			logpdf(float/ndarray): ln f(x), -inf where the density is zero
+		"""
+		with np.errstate(divide="ignore"):
+			logpdf = np.log(self.pdf(x))
+		return float(logpdf) if np.ndim(logpdf) == 0 else logpdf
+
+	def sample(self,size=1,seed=None):
+		"""
+		Method to draw random variates by inverting the cdf, in the dtype of the precision policy
+        
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of random variates
+
+		Raises:
+			TypeError(string): Raised when the distribution has no ppf
+		"""
+		if not hasattr(self,"ppf"):
+			raise TypeError("{} has no ppf to sample with".format(type(self).__name__))
+		rng = np.random.default_rng(seed)
+		return np.asarray(self.ppf(rng.random(size,dtype=get_dtype())))
+
+	def approximate(self,lo,hi,tol=1e-10,degree=12):
+		"""
+		Method to fit piecewise Chebyshev approximants of the log density and the distribution
+		function on [lo,hi], for instances evaluated many times over a known range.
+		Evaluation costs about 35 ns per point, so it pays off over special functions (eg. the
+		incomplete beta of F.cdf) but not over a vectorized elementary pdf; every approximant is
+		timed against its exact method when fitted and only used where it is faster.
+		The errors reported in sampledError are the largest seen on a verification grid of every
+		piece, a check rather than a certified bound between the grid points
+
+		Args:
+			lo(float): Lower end of the range
+			hi(float): Upper end of the range
+			tol(float): Error aimed for, absolute in ln f (so relative in f) and in F
+			degree(int): Degree of every Chebyshev piece
+
+		Returns:
+			approximation(ApproximatedDistribution): Object with pdf, logpdf, cdf, methods and sampledError
+
+		Raises:
+			ValueError(string): Raised when the density is zero or infinite somewhere on [lo,hi]
+		"""
+		return ApproximatedDistribution(self,lo,hi,tol,degree)
+
+	def read_data_chunks(self,file_name,chunkSize=1 << 20):
+		"""
+		Method to read numbers from a txt file(file_name) in chunks of bounded memory.
+		Numbers may be separated by newlines or any other whitespace.
+
+		Args:
+			file_name(string/file): Name of the file (or an open file object) to read data from
+			chunkSize(int): Number of bytes read per chunk
+
+		Returns:
+			chunks(generator): Yields float64 arrays, one per chunk
+		"""
+		file, owned = _open(file_name,chunkSize)
+		try:
+			remainder = b""
+			while True:
+				block = file.read(chunkSize)
+				if not block:
+					break
+				if isinstance(block,str):
+					block = block.encode()
+
+				#A number cut at the end of the block is completed by the next block
+				block = remainder + block
+				cut = max(block.rfind(b"\n"),block.rfind(b" "),block.rfind(b"\t"))
+				if cut < 0:
+					remainder = block
+					continue
+				remainder = block[cut + 1:]
+				values = np.array(block[:cut].split(),dtype=np.float64)
+				if values.size:
+					yield values
+
+			values = np.array(remainder.split(),dtype=np.float64)
+			if values.size:
+				yield values
+		finally:
+			if owned:
+				file.close()
@@ -5,6 +5,7 @@ Geometric Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
 
 class Geometric(Distribution):
@@ -97,6 +98,90 @@ class Geometric(Distribution):
 		except ValueError as error:
 			raise
 
+	def replace_stats_with_counts(self,values=None,counts=None):
+		"""
+		Method to calculate ρ from counted (or weighted) data
+        
+		Args: 
+			values(array): Distinct numbers of trials (or failures), the counted data of the instance when None
+			counts(array): Number of occurrences (or weight) of every value
+        
+		Returns: 
+			self.p(float): Value of ρ
+		"""
+		values, counts = self._weighted_data(values,counts)
+		observations = counts.sum()
+		total = np.dot(values,counts)
+
+		#k trials: ρ = n / Σ c k, k failures: ρ = n / (n + Σ c k)
+		if self.trial is True:
+			self.p = float(observations / total)
+		else:
+			self.p = float(observations / (observations + total))
+
+		#Calculate mean and standard deviation
+		self.calculate_mean()
+		self.calculate_stdev()
+		return self.p
+
+	def calculate_log_likelihood(self,values=None,counts=None):
+		"""
+		Method to calculate the log-likelihood of counted data
+        
+		Args: 
+			values(array): Distinct numbers of trials (or failures), the counted data of the instance when None
+			counts(array): Number of occurrences of every value
+        
+		Returns: 
+			loglikelihood(float): Log-likelihood of the data
+		"""
+		values, counts = self._weighted_data(values,counts)
+		failures = values - 1 if self.trial is True else values
+		"""
+		ℓ(ρ) = Σ c (ln ρ + f ln(1-ρ)), f = number of failures
+		"""
+		with np.errstate(divide="ignore",invalid="ignore"):
+			logFailure = np.where(failures > 0,failures * np.log1p(-self.p),0.0)
+		return float(np.dot(counts,math.log(self.p) + logFailure))
+
+	def pmf_range(self,lo,hi):
+		"""
+		Method to calculate the probability mass function on a range of k in O(hi-lo) time
+        
+		Args:
+			lo(int): First number of trials (or failures)
+			hi(int): Last number of trials (or failures)
+
+		Returns:
+			pmf(ndarray): f(k) for k = lo..hi, zero outside the support
+		"""
+		first = 1 if self.trial is True else 0
+		k = np.arange(int(lo),int(hi) + 1)
+		failures = k - first
+		"""
+		The ratio f(k+1)/f(k) = 1-ρ is constant, so ln f(k) = ln ρ + f ln(1-ρ), f = number of failures
+		"""
+		with np.errstate(divide="ignore",invalid="ignore"):
+			logs = math.log(self.p) + np.where(failures > 0,failures * np.log1p(-self.p),0.0)
+		return np.where(failures >= 0,np.exp(logs),0.0)
+
+	def pmf_table(self,tailMass=1e-16):
+		"""
+		Method to calculate the probability mass function from the first k until the remaining tail is negligible
+        
+		Args:
+			tailMass(float): Largest probability left beyond the last entry
+
+		Returns:
+			pmf(ndarray): f(k) for k = 1,2,...,K with trials, k = 0,1,...,K with failures
+		"""
+		first = 1 if self.trial is True else 0
+		if self.p == 1:
+			return self.pmf_range(first,first)
+		#The tail beyond f failures is (1-ρ)^(f+1)
+		failures = max(int(math.ceil(math.log(tailMass) / math.log1p(-self.p))) - 1,0)
+		return self.pmf_range(first,first + failures)
+
 	def pdf(self,x=1):
 		"""
 		Method to calculate probability density function for geometric distribution
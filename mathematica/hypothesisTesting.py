@@ -0,0 +1,275 @@
+"""
+Hypothesis Testing
+(Batch Welch t-tests, one way ANOVA and multiple testing corrections)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from .specialFunctions import regularized_incomplete_beta	#Import specialFunctions.py module
+
+class WelchTest:
+	"""
+	Welch test class for comparing the means of two groups on many metrics at once
+	Every attribute is an array holding one entry per metric (column)
+
+	Notation:
+		t = (x̄A - x̄B) / √(sA²/nA + sB²/nB)
+
+	Attributes:
+		1. meanA, varianceA, sizeA (summary statistics of group A)
+		2. meanB, varianceB, sizeB (summary statistics of group B)
+		3. t (test statistic)
+		4. df (Welch–Satterthwaite degrees of freedom)
+	"""
+	def __init__(self,meanA,varianceA,sizeA,meanB,varianceB,sizeB):
+		self.meanA = np.asarray(meanA,dtype=np.float64)
+		self.varianceA = np.asarray(varianceA,dtype=np.float64)
+		self.sizeA = np.asarray(sizeA,dtype=np.float64)
+		self.meanB = np.asarray(meanB,dtype=np.float64)
+		self.varianceB = np.asarray(varianceB,dtype=np.float64)
+		self.sizeB = np.asarray(sizeB,dtype=np.float64)
+
+		self.t = None
+		self.df = None
+		self.pvalue = None
+
+	@classmethod
+	def from_data(cls,groupA,groupB):
+		"""
+		Method to build the test from raw observations, one column per metric
+
+		Args:
+			groupA(array): Observations of group A, shape (nA, metrics)
+			groupB(array): Observations of group B, shape (nB, metrics)
+
+		Returns:
+			test(WelchTest): Test built from the column summaries
+		"""
+		groupA = np.asarray(groupA,dtype=np.float64)
+		groupB = np.asarray(groupB,dtype=np.float64)
+		return cls(groupA.mean(axis=0),groupA.var(axis=0,ddof=1),groupA.shape[0],groupB.mean(axis=0),groupB.var(axis=0,ddof=1),groupB.shape[0])
+
+	def calculate_statistic(self):
+		"""
+		Method to calculate the t statistic and the degrees of freedom of every metric
+
+		Args:
+			none
+
+		Returns:
+			self.t(ndarray): Welch t statistic
+			self.df(ndarray): Welch–Satterthwaite degrees of freedom
+		"""
+		errorA = self.varianceA / self.sizeA
+		errorB = self.varianceB / self.sizeB
+		standardError = errorA + errorB
+
+		with np.errstate(divide="ignore",invalid="ignore"):
+			self.t = (self.meanA - self.meanB) / np.sqrt(standardError)
+			"""
+				   (sA²/nA + sB²/nB)^2
+			df = -----------------------------------------
+				(sA²/nA)^2 / (nA-1) + (sB²/nB)^2 / (nB-1)
+			"""
+			self.df = standardError ** 2 / (errorA ** 2 / (self.sizeA - 1) + errorB ** 2 / (self.sizeB - 1))
+		return self.t, self.df
+
+	def calculate_pvalue(self,alternative="two-sided"):
+		"""
+		Method to calculate the p-value of every metric
+
+		Args:
+			alternative(string): "two-sided", "greater" (mean A > mean B) or "less"
+
+		Returns:
+			self.pvalue(ndarray): p-values
+
+		Raises:
+			ValueError(string): Raised when the alternative is unknown
+		"""
+		if self.t is None:
+			self.calculate_statistic()
+
+		"""
+		P(|T| > |t|) = I_x(df/2, 1/2), x = df / (df + t^2)
+		"""
+		twoSided = np.asarray(regularized_incomplete_beta(self.df / 2,0.5,self.df / (self.df + self.t ** 2)))
+
+		if alternative == "two-sided":
+			self.pvalue = twoSided
+		elif alternative == "greater":
+			self.pvalue = np.where(self.t > 0,twoSided / 2,1 - twoSided / 2)
+		elif alternative == "less":
+			self.pvalue = np.where(self.t < 0,twoSided / 2,1 - twoSided / 2)
+		else:
+			raise ValueError("alternative must be 'two-sided', 'greater' or 'less'")
+		return self.pvalue
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the welch test instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the test
+		"""
+		return "Metrics: {}, t: {}, df: {}, p-value: {}".format(self.meanA.size,self.t,self.df,self.pvalue)
+
+class AnovaTest:
+	"""
+	One way ANOVA class for comparing the means of k groups on many metrics at once
+	Summary arrays have shape (groups, metrics)
+
+	Notation:
+		F = (SS_between / (k-1)) / (SS_within / (N-k))
+
+	Attributes:
+		1. means (group means)
+		2. variances (group sample variances, ddof = 1)
+		3. sizes (group sizes)
+		4. f (test statistic)
+		5. d1, d2 (degrees of freedom, k-1 and N-k)
+	"""
+	def __init__(self,means,variances,sizes):
+		self.means = np.asarray(means,dtype=np.float64)
+		self.variances = np.asarray(variances,dtype=np.float64)
+		self.sizes = np.asarray(sizes,dtype=np.float64)
+
+		#Sizes shared by every metric may be given as one entry per group
+		if self.sizes.ndim == 1 and self.means.ndim == 2:
+			self.sizes = self.sizes[:,np.newaxis]
+
+		self.f = None
+		self.d1 = None
+		self.d2 = None
+		self.pvalue = None
+
+	@classmethod
+	def from_data(cls,groups):
+		"""
+		Method to build the test from raw observations, one column per metric
+
+		Args:
+			groups(list): Observations of each group, arrays of shape (n_i, metrics)
+
+		Returns:
+			test(AnovaTest): Test built from the column summaries
+		"""
+		groups = [np.asarray(group,dtype=np.float64) for group in groups]
+		means = np.stack([group.mean(axis=0) for group in groups])
+		variances = np.stack([group.var(axis=0,ddof=1) for group in groups])
+		sizes = np.array([group.shape[0] for group in groups],dtype=np.float64)
+		return cls(means,variances,sizes)
+
+	def calculate_statistic(self):
+		"""
+		Method to calculate the F statistic and the degrees of freedom of every metric
+
+		Args:
+			none
+
+		Returns:
+			self.f(ndarray): F statistic
+			self.d1(ndarray): Degrees of freedom between groups
+			self.d2(ndarray): Degrees of freedom within groups
+		"""
+		groups = self.means.shape[0]
+		sizes = np.broadcast_to(self.sizes,self.means.shape)
+		total = sizes.sum(axis=0)
+
+		grandMean = (sizes * self.means).sum(axis=0) / total
+		between = (sizes * (self.means - grandMean) ** 2).sum(axis=0)
+		within = ((sizes - 1) * self.variances).sum(axis=0)
+
+		self.d1 = np.full(grandMean.shape,groups - 1,dtype=np.float64)
+		self.d2 = total - groups
+		with np.errstate(divide="ignore",invalid="ignore"):
+			self.f = (between / self.d1) / (within / self.d2)
+		return self.f, self.d1, self.d2
+
+	def calculate_pvalue(self):
+		"""
+		Method to calculate the p-value of every metric
+
+		Args:
+			none
+
+		Returns:
+			self.pvalue(ndarray): p-values, P(F > f)
+		"""
+		if self.f is None:
+			self.calculate_statistic()
+
+		"""
+		P(F > f) = I_x(d2/2, d1/2), x = d2 / (d2 + d1 f)
+		"""
+		self.pvalue = np.asarray(regularized_incomplete_beta(self.d2 / 2,self.d1 / 2,self.d2 / (self.d2 + self.d1 * self.f)))
+		return self.pvalue
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the anova test instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the test
+		"""
+		return "Groups: {}, F: {}, d1: {}, d2: {}, p-value: {}".format(self.means.shape[0],self.f,self.d1,self.d2,self.pvalue)
+
+def holm_correction(pvalues,axis=-1):
+	"""
+	Function to adjust p-values for multiple testing with the Holm step-down method
+
+	Args:
+		pvalues(array): Raw p-values
+		axis(int): Axis holding the family of tests
+
+	Returns:
+		adjusted(ndarray): Holm adjusted p-values, in the original order
+	"""
+	pvalues = np.moveaxis(np.asarray(pvalues,dtype=np.float64),axis,-1)
+	m = pvalues.shape[-1]
+	order = np.argsort(pvalues,axis=-1,kind="stable")
+	ranked = np.take_along_axis(pvalues,order,axis=-1)
+
+	"""
+	p(i) adjusted = max over j ≤ i of min(1, (m - j + 1) p(j))
+	"""
+	adjusted = np.minimum(ranked * np.arange(m,0,-1),1.0)
+	adjusted = np.maximum.accumulate(adjusted,axis=-1)
+
+	result = np.empty_like(adjusted)
+	np.put_along_axis(result,order,adjusted,axis=-1)
+	return np.moveaxis(result,-1,axis)
+
+def benjamini_hochberg(pvalues,axis=-1):
+	"""
+	Function to adjust p-values with the Benjamini–Hochberg false discovery rate method
+
+	Args:
+		pvalues(array): Raw p-values
+		axis(int): Axis holding the family of tests
+
+	Returns:
+		adjusted(ndarray): BH adjusted p-values (q-values), in the original order
+	"""
+	pvalues = np.moveaxis(np.asarray(pvalues,dtype=np.float64),axis,-1)
+	m = pvalues.shape[-1]
+	order = np.argsort(pvalues,axis=-1,kind="stable")
+	ranked = np.take_along_axis(pvalues,order,axis=-1)
+
+	"""
+	p(i) adjusted = min over j ≥ i of min(1, m p(j) / j)
+	"""
+	adjusted = ranked * m / np.arange(1,m + 1)
+	adjusted = np.minimum.accumulate(adjusted[...,::-1],axis=-1)[...,::-1]
+	adjusted = np.minimum(adjusted,1.0)
+
+	result = np.empty_like(adjusted)
+	np.put_along_axis(result,order,adjusted,axis=-1)
+	return np.moveaxis(result,-1,axis)
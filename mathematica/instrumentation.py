@@ -0,0 +1,371 @@
+"""
+Instrumentation
+(Opt-in call counters and latency histograms for the methods of every distribution)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import bisect
+import functools
+import threading
+import time
+import numpy as np
+from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .memoryAccounting import data_elements, track_memory	#Import memoryAccounting.py module
+
+try:
+	from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+except ImportError:
+	CounterMetricFamily = GaugeMetricFamily = HistogramMetricFamily = None
+
+#Methods wrapped on every class that defines them
+METHODS = (
+	"pdf","logpdf","cdf","sf","ppf","pmf_range","pmf_table",
+	"calculate_mean","calculate_stdev","calculate_log_likelihood",
+	"read_data_file","read_data_files","count_data","replace_stats_with_data","replace_stats_with_counts",
+	"sample","update",
+)
+#Upper bounds of the latency buckets in seconds, the last bucket is unbounded
+BUCKETS = (1e-6,2.5e-6,5e-6,1e-5,2.5e-5,5e-5,1e-4,2.5e-4,5e-4,1e-3,2.5e-3,5e-3,1e-2,2.5e-2,5e-2,0.1,0.25,0.5,1.0,2.5,5.0,10.0)
+#Methods whose element count is the size of the data read or fitted
+DATA_METHODS = ("read_data_file","read_data_files","count_data","replace_stats_with_data","replace_stats_with_counts")
+
+class _Statistics:
+	"""
+	Statistics class of one class and method: calls, elements, total seconds and bucket counts,
+	plus the largest peak, the total of the peaks, the retained bytes and the allocations of the
+	calls measured in memory mode
+	"""
+	__slots__ = ("calls","elements","seconds","buckets","peak","peakTotal","retained","allocations")
+
+	def __init__(self):
+		self.calls = 0
+		self.elements = 0
+		self.seconds = 0.0
+		self.buckets = [0] * (len(BUCKETS) + 1)
+		self.peak = None
+		self.peakTotal = 0
+		self.retained = 0
+		self.allocations = 0
+
+	def quantile(self,q):
+		"""
+		Method to estimate a latency quantile from the histogram, interpolating within the bucket
+
+		Args:
+			q(float): Probability in [0,1]
+
+		Returns:
+			seconds(float): Estimated quantile, the largest finite bound for the unbounded bucket
+		"""
+		if self.calls == 0:
+			return 0.0
+		rank = q * self.calls
+		seen = 0
+		for index,count in enumerate(self.buckets):
+			if count and seen + count >= rank:
+				if index == len(BUCKETS):
+					return BUCKETS[-1]
+				lower = BUCKETS[index - 1] if index else 0.0
+				return lower + (BUCKETS[index] - lower) * (rank - seen) / count
+			seen += count
+		return BUCKETS[-1]
+
+#Statistics per (class name, method name), guarded by one lock
+_statistics = {}
+_lock = threading.Lock()
+#Original functions of the wrapped methods, to restore on disable()
+_originals = {}
+
+def _elements(instance,method,result):
+	"""
+	Function to count the elements handled by a call
+
+	Args:
+		instance(object): Instance the method was called on
+		method(string): Method name
+		result(object): Return value of the call
+
+	Returns:
+		elements(int): Size of an array result, of the data for reading and fitting methods, 1 otherwise
+	"""
+	if method in DATA_METHODS:
+		return data_elements(instance)
+	return result.size if isinstance(result,np.ndarray) else 1
+
+def _record(className,method,seconds,elements,report=None):
+	"""
+	Function to add one call to the statistics
+
+	Args:
+		className(string): Name of the class of the instance
+		method(string): Method name
+		seconds(float): Duration of the call
+		elements(int): Elements handled by the call
+		report(MemoryReport): Memory of the call, in memory mode
+
+	Returns:
+		No return value
+	"""
+	bucket = bisect.bisect_left(BUCKETS,seconds)
+	with _lock:
+		statistics = _statistics.get((className,method))
+		if statistics is None:
+			statistics = _statistics[(className,method)] = _Statistics()
+		statistics.calls += 1
+		statistics.elements += elements
+		statistics.seconds += seconds
+		statistics.buckets[bucket] += 1
+		if report is not None:
+			statistics.peak = max(statistics.peak or 0,report.peak)
+			statistics.peakTotal += report.peak
+			statistics.retained += report.retained
+			statistics.allocations += report.allocations or 0
+
+def _wrap(function,method):
+	"""
+	Function to wrap a method with timing and counting
+
+	Args:
+		function(callable): Original function
+		method(string): Method name
+
+	Returns:
+		wrapper(callable): Instrumented function
+	"""
+	@functools.wraps(function)
+	def wrapper(self,*args,**kwargs):
+		start = time.perf_counter()
+		result = function(self,*args,**kwargs)
+		_record(type(self).__name__,method,time.perf_counter() - start,_elements(self,method,result))
+		return result
+	wrapper._instrumented = True
+	return wrapper
+
+def _wrap_memory(function,method):
+	"""
+	Function to wrap a method with timing, counting and memory accounting
+
+	Args:
+		function(callable): Original function
+		method(string): Method name
+
+	Returns:
+		wrapper(callable): Instrumented function
+	"""
+	@functools.wraps(function)
+	def wrapper(self,*args,**kwargs):
+		#Allocations are counted for loads, fits and batch evaluations, scalar calls only get their peak
+		snapshots = method in DATA_METHODS or (bool(args) and isinstance(args[0],np.ndarray))
+		with track_memory(method,snapshots=snapshots) as report:
+			start = time.perf_counter()
+			result = function(self,*args,**kwargs)
+			seconds = time.perf_counter() - start
+		_record(type(self).__name__,method,seconds,_elements(self,method,result),report)
+		return result
+	wrapper._instrumented = True
+	return wrapper
+
+def _classes(extra=()):
+	"""
+	Function to list Distribution and all its subclasses, plus extra classes
+
+	Args:
+		extra(tuple): Other classes to instrument, eg. KLLSketch or Empirical
+
+	Returns:
+		classes(list): Classes to instrument
+	"""
+	classes, pending = [], [Distribution]
+	while pending:
+		cls = pending.pop()
+		if cls not in classes:
+			classes.append(cls)
+			pending.extend(cls.__subclasses__())
+	return classes + [cls for cls in extra if cls not in classes]
+
+def enable(classes=(),memory=False):
+	"""
+	Function to instrument the methods in METHODS of every distribution class
+
+	Args:
+		classes(tuple): Other classes to instrument as well
+		memory(bool): Whether to measure the memory of every call with tracemalloc (see
+			memoryAccounting.py), which slows calls down considerably
+
+	Returns:
+		No return value
+
+	Notes:
+		Methods are wrapped on the class defining them, and calls are recorded under the class
+		of the instance. While disabled no wrapper exists, so instrumentation costs nothing.
+		Call disable() before enabling again with another memory setting.
+	"""
+	wrap = _wrap_memory if memory else _wrap
+	with _lock:
+		for cls in _classes(classes):
+			for method in METHODS:
+				function = cls.__dict__.get(method)
+				if callable(function) and not getattr(function,"_instrumented",False):
+					_originals[(cls,method)] = function
+					setattr(cls,method,wrap(function,method))
+
+def disable():
+	"""
+	Function to restore the original methods, keeping the statistics collected so far
+
+	Args:
+		none
+
+	Returns:
+		No return value
+	"""
+	with _lock:
+		for (cls,method),function in _originals.items():
+			setattr(cls,method,function)
+		_originals.clear()
+
+def enabled():
+	"""
+	Function to find whether instrumentation is on
+
+	Args:
+		none
+
+	Returns:
+		enabled(bool): Whether any method is wrapped
+	"""
+	return bool(_originals)
+
+def reset():
+	"""
+	Function to clear the statistics
+
+	Args:
+		none
+
+	Returns:
+		No return value
+	"""
+	with _lock:
+		_statistics.clear()
+
+def as_dict():
+	"""
+	Function to export the statistics
+
+	Args:
+		none
+
+	Returns:
+		statistics(dict): Maps "Class.method" to calls, elements, seconds, mean, p50, p90, p99
+			(seconds, estimated from the histogram) and the bucket counts, plus peak, retained,
+			allocations and bytesPerElement (total of the peaks over total elements) for methods
+			measured in memory mode
+	"""
+	output = {}
+	with _lock:
+		for key,statistics in sorted(_statistics.items()):
+			values = output["{}.{}".format(*key)] = {
+				"calls": statistics.calls,"elements": statistics.elements,"seconds": statistics.seconds,"mean": statistics.seconds / statistics.calls,
+				"p50": statistics.quantile(0.5),"p90": statistics.quantile(0.9),"p99": statistics.quantile(0.99),
+				"buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"],statistics.buckets)),
+			}
+			if statistics.peak is not None:
+				values.update(peak=statistics.peak,retained=statistics.retained,allocations=statistics.allocations,bytesPerElement=statistics.peakTotal / max(statistics.elements,1))
+	return output
+
+def prometheus_text(prefix="mathematica"):
+	"""
+	Function to export the statistics in the Prometheus text exposition format
+
+	Args:
+		prefix(string): Prefix of the metric names
+
+	Returns:
+		text(string): Calls and elements counters and the latency histogram of every method
+	"""
+	statistics = as_dict()
+	lines = [
+		"# HELP {}_calls_total Calls of distribution methods".format(prefix),
+		"# TYPE {}_calls_total counter".format(prefix),
+	]
+	for key,values in statistics.items():
+		lines.append('{}_calls_total{{class="{}",method="{}"}} {}'.format(prefix,*key.split("."),values["calls"]))
+
+	lines += ["# HELP {}_elements_total Elements handled by distribution methods".format(prefix),"# TYPE {}_elements_total counter".format(prefix)]
+	for key,values in statistics.items():
+		lines.append('{}_elements_total{{class="{}",method="{}"}} {}'.format(prefix,*key.split("."),values["elements"]))
+
+	lines += ["# HELP {}_call_seconds Latency of distribution methods".format(prefix),"# TYPE {}_call_seconds histogram".format(prefix)]
+	for key,values in statistics.items():
+		className, method = key.split(".")
+		cumulative = 0
+		for bound,count in values["buckets"].items():
+			cumulative += count
+			lines.append('{}_call_seconds_bucket{{class="{}",method="{}",le="{}"}} {}'.format(prefix,className,method,bound,cumulative))
+		lines.append('{}_call_seconds_sum{{class="{}",method="{}"}} {!r}'.format(prefix,className,method,values["seconds"]))
+		lines.append('{}_call_seconds_count{{class="{}",method="{}"}} {}'.format(prefix,className,method,values["calls"]))
+
+	measured = {key: values for key,values in statistics.items() if "peak" in values}
+	if measured:
+		lines += ["# HELP {}_peak_bytes Largest traced memory of a call".format(prefix),"# TYPE {}_peak_bytes gauge".format(prefix)]
+		for key,values in measured.items():
+			lines.append('{}_peak_bytes{{class="{}",method="{}"}} {}'.format(prefix,*key.split("."),values["peak"]))
+		lines += ["# HELP {}_bytes_per_element Peak bytes per element over all calls".format(prefix),"# TYPE {}_bytes_per_element gauge".format(prefix)]
+		for key,values in measured.items():
+			lines.append('{}_bytes_per_element{{class="{}",method="{}"}} {!r}'.format(prefix,*key.split("."),values["bytesPerElement"]))
+	return "\n".join(lines) + "\n"
+
+class _Collector:
+	"""
+	Collector class handing the statistics to a prometheus_client registry on every scrape
+	"""
+	def __init__(self,prefix):
+		self.prefix = prefix
+
+	def collect(self):
+		calls = CounterMetricFamily(self.prefix + "_calls","Calls of distribution methods",labels=["class","method"])
+		elements = CounterMetricFamily(self.prefix + "_elements","Elements handled by distribution methods",labels=["class","method"])
+		latency = HistogramMetricFamily(self.prefix + "_call_seconds","Latency of distribution methods",labels=["class","method"])
+		peak = GaugeMetricFamily(self.prefix + "_peak_bytes","Largest traced memory of a call",labels=["class","method"])
+		perElement = GaugeMetricFamily(self.prefix + "_bytes_per_element","Peak bytes per element over all calls",labels=["class","method"])
+		for key,values in as_dict().items():
+			labels = key.split(".")
+			calls.add_metric(labels,values["calls"])
+			elements.add_metric(labels,values["elements"])
+			cumulative, buckets = 0, []
+			for bound,count in values["buckets"].items():
+				cumulative += count
+				buckets.append((bound,cumulative))
+			latency.add_metric(labels,buckets,values["seconds"])
+			if "peak" in values:
+				peak.add_metric(labels,values["peak"])
+				perElement.add_metric(labels,values["bytesPerElement"])
+		yield calls
+		yield elements
+		yield latency
+		yield peak
+		yield perElement
+
+def register(registry=None,prefix="mathematica"):
+	"""
+	Function to publish the statistics through prometheus_client
+
+	Args:
+		registry(CollectorRegistry): Registry to add the collector to, the default registry for None
+		prefix(string): Prefix of the metric names
+
+	Returns:
+		collector(object): The registered collector
+
+	Raises:
+		ValueError(string): Raised when the prometheus_client package is missing
+	"""
+	if CounterMetricFamily is None:
+		raise ValueError("publishing metrics needs the prometheus_client package, prometheus_text() works without it")
+	if registry is None:
+		from prometheus_client import REGISTRY as registry
+	collector = _Collector(prefix)
+	registry.register(collector)
+	return collector
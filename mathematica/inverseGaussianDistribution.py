@@ -6,7 +6,37 @@ Inverse Gaussian Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+from .specialFunctions import erfc	#Import specialFunctions.py module
+
+#Beyond this z erfc underflows and ln Φ(-z) uses its asymptotic series
+TAIL_SERIES_START = 26.0
+
+def _log_normal_tail(z):
+	"""
+	Function to calculate ln Φ(-z), the log upper tail of the standard normal distribution
+
+	Args:
+		z(float/ndarray): Arguments
+
+	Returns:
+		logTail(float/ndarray): ln Φ(-z), a float for float z
+	"""
+	if isinstance(z,float):
+		if z < TAIL_SERIES_START:
+			return math.log(0.5 * math.erfc(z / math.sqrt(2)))
+		w = 1 / (z * z)
+		return -z * z / 2 - math.log(z) - 0.5 * math.log(2 * math.pi) + math.log(1 + w * (-1 + w * (3 + w * (-15 + w * 105))))
+	with np.errstate(divide="ignore",invalid="ignore"):
+		direct = np.log(0.5 * np.asarray(erfc(np.minimum(z,TAIL_SERIES_START) / math.sqrt(2))))
+		"""
+		Φ(-z) = φ(z)/z [1 - 1/z² + 3/z⁴ - 15/z⁶ + 105/z⁸], relative error below 1e-11 for z ≥ 26
+		"""
+		w = 1 / (z * z)
+		series = 1 + w * (-1 + w * (3 + w * (-15 + w * 105)))
+		asymptotic = -z * z / 2 - np.log(z) - 0.5 * math.log(2 * math.pi) + np.log(series)
+	return np.where(z < TAIL_SERIES_START,direct,asymptotic)
 
 class InverseGaussian(Distribution):
 	"""
@@ -72,38 +102,63 @@ class InverseGaussian(Distribution):
 		Method to calculate probability density function for inverse gaussian distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for inverse gaussian distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for inverse gaussian distribution, 0 for x ≤ 0
 		"""
-		try:
-			#Splitting the expression to calculate pdf for convenience
-			powNumerator = -1.0 * self.lamda * ((x - self.mu) ** 2)
-			powDenominator = 2 * (self.mu ** 2) * x
-
-			partOne = self.lamda / (2 * math.pi * (x ** 3))
-			powE = powNumerator / powDenominator
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not 0 < x < math.inf:
+				return 0.0
+			deviation = (x - self.mu) / math.sqrt(x)
+			return math.exp(0.5 * math.log(self.lamda / (2 * math.pi)) - 1.5 * math.log(x) - self.lamda / (2 * self.mu ** 2) * deviation * deviation)
+		def kernel(x):
 			"""
 					 λ		λ (x-μ)^(2)
 			f(x;μ,λ) = √(---------) exp[- --------------]
 				     2 π x^(3)		 2 μ^(2) x
 			"""
-			operand1 = math.sqrt(partOne)
-			operand2 = math.exp(powE)
-			return operand1 * operand2
-
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+			#Points outside (0,∞) are masked before use, f is 0 there. x^3 and (x-μ)^2 overflow long
+			#before the density vanishes, so it is taken as exp[ln √(λ/2π) - 3/2 ln x - λ/(2μ^2) ((x-μ)/√x)^2]
+			inside = (x > 0) & (x < np.inf)
+			safe = np.where(inside,x,self.mu)
+			with np.errstate(over="ignore"):
+				deviation = (safe - self.mu) / np.sqrt(safe)
+				logPdf = 0.5 * math.log(self.lamda / (2 * math.pi)) - 1.5 * np.log(safe) - self.lamda / (2 * self.mu ** 2) * deviation * deviation
+			return np.where(inside,np.exp(logPdf),0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for inverse gaussian distribution
+        
+		Args:
+			x(float/array): Random variable
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for inverse gaussian distribution
+		"""
+		if isinstance(x,(int,float)):
+			if not 0 < x < math.inf:
+				return 1.0 if x == math.inf else 0.0
+			root = math.sqrt(self.lamda / x)
+			lower = 0.5 * math.erfc(-root * (x / self.mu - 1) / math.sqrt(2))
+			return lower + math.exp(2 * self.lamda / self.mu + _log_normal_tail(root * (x / self.mu + 1)))
+		def kernel(x):
+			"""
+			F(x;μ,λ) = Φ(√(λ/x)(x/μ - 1)) + e^(2λ/μ) Φ(-√(λ/x)(x/μ + 1))
+			"""
+			#Points outside (0,∞) are masked before building z, F is 0 at or below 0 and 1 at +∞
+			inside = (x > 0) & (x < np.inf)
+			safe = np.where(inside,x,self.mu)
+			root = np.sqrt(self.lamda / safe)
+			lower = 0.5 * np.asarray(erfc(-root * (safe / self.mu - 1) / math.sqrt(2)))
+			#e^(2λ/μ) overflows long before the product does, so the second term is summed in logs
+			z = root * (safe / self.mu + 1)
+			upper = np.exp(2 * self.lamda / self.mu + _log_normal_tail(z))
+			return np.where(inside,lower + upper,np.where(x == np.inf,1.0,0.0))
+		return _blockwise(kernel,x)
 
 	def __repr__(self):
 		"""
@@ -6,7 +6,9 @@ Lévy Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+from .specialFunctions import erfc	#Import specialFunctions.py module
 
 class Levy(Distribution):
 	"""
@@ -68,40 +70,55 @@ class Levy(Distribution):
 		Method to calculate probability density function for lévy distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for lévy distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for lévy distribution, 0 for x ≤ μ
 		"""
-		try:
-			#Exponent with base e = -(c/2(x-μ))
-			powE = (-1.0 * self.c) / (2 * (x - self.a))
-
-			#Numerator of the operand2
-			operand2Numerator = math.exp(powE)
-			#Denominator of the operand2
-			operand2Denominator = (x - self.a) ** (3 / 2)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			shifted = x - self.a
+			if not shifted > 0:
+				return 0.0
+			return math.sqrt(self.c / (2 * math.pi)) * math.exp(-self.c / (2 * shifted) - 1.5 * math.log(shifted))
+		def kernel(x):
 			"""
 						 -(c/2(x-μ))
 						e
 			f(x;μ,c) = √(c/2π) --------------
 					    (x-μ)^(3/2)
 			"""
-			operand1 = math.sqrt(self.c / (2 * math.pi))
-			operand2 = operand2Numerator / operand2Denominator
-			return operand1 * operand2
-
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+			#Points at or below μ are masked before exponentiating, e^(-c/2(x-μ)) overflows just below μ,
+			#and the power is taken in the exponent so that (x-μ)^(3/2) can not underflow just above it
+			shifted = x - self.a
+			inside = shifted > 0
+			safe = np.where(inside,shifted,1.0)
+			with np.errstate(over="ignore"):
+				#c/2(x-μ) may still reach +∞ just above μ, where e^(-∞) = 0 is the right density
+				pdf = math.sqrt(self.c / (2 * math.pi)) * np.exp(-self.c / (2 * safe) - 1.5 * np.log(safe))
+			return np.where(inside,pdf,0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for lévy distribution
+        
+		Args:
+			x(float/array): Random variable
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for lévy distribution
+		"""
+		if isinstance(x,(int,float)):
+			shifted = x - self.a
+			return math.erfc(math.sqrt(self.c / (2 * shifted))) if shifted > 0 else 0.0
+		def kernel(x):
+			#F(x;μ,c) = erfc(√(c/2(x-μ)))
+			with np.errstate(divide="ignore",invalid="ignore"):
+				shifted = x - self.a
+				cdf = np.asarray(erfc(np.sqrt(self.c / (2 * np.maximum(shifted,0.0)))))
+			return np.where(shifted > 0,cdf,0.0)
+		return _blockwise(kernel,x)
 
 	def __add__(self,other):
 		"""
@@ -6,8 +6,10 @@ Log Logistic Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from numpy import sin	#Import sin() method from Numpy module
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
+from .precision import get_dtype	#Import precision.py module
 
 class LogLogistic(Distribution):
 	"""
@@ -118,34 +120,85 @@ class LogLogistic(Distribution):
 		Method to calculate probability density function for log logistic distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for log logistic distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for log logistic distribution, 0 for x < 0
 		"""
-		try:
-			#Numerator of the pdf expression
-			pdfNumerator = (self.b / self.a) * ((x / self.a)**(self.b - 1))
-			#Denominator of the pdf expression
-			pdfDenominator = (1 + ((x / self.a) ** self.b)) ** 2
+		#f(0) is infinite for β < 1, 1/α for β = 1 and 0 otherwise
+		atZero = math.inf if self.b < 1 else (1 / self.a if self.b == 1 else 0.0)
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			if not x >= 0:
+				return 0.0
+			scaled = x / self.a
+			if scaled == 0:
+				return atZero
+			#Above α the powers are of α/x < 1, as in the kernel, so that they never overflow
+			base = self.a / x if scaled > 1 else scaled
+			power = base ** self.b
+			return (self.b / self.a) * (power * base if scaled > 1 else power / base) / (1 + power) ** 2
+		def kernel(x):
 			"""				  
 				    (β/α) (x/α)^(β-1)
 			f(x;α,β) = -------------------
 				    ((1 + (x/α)^β)^2)
+
+			divided through by (x/α)^(2β) for x > α so that the powers are of α/x < 1 and never overflow
 			"""
-			return pdfNumerator / pdfDenominator
+			with np.errstate(divide="ignore",invalid="ignore"):
+				clipped = np.maximum(x,0.0)
+				scaled = clipped / self.a
+				above = scaled > 1
+				base = np.where(above,self.a / clipped,scaled)
+				power = base ** self.b
+				pdf = (self.b / self.a) * np.where(above,power * base,power / base) / (1 + power) ** 2
+			return np.where(x >= 0,np.where(scaled > 0,pdf,atZero),0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for log logistic distribution
+        
+		Args:
+			x(float/array): Random variable
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for log logistic distribution
+		"""
+		if isinstance(x,(int,float)):
+			if x <= 0:
+				return 0.0
+			try:
+				return 1 / (1 + (self.a / x) ** self.b)
+			except OverflowError:
+				return 0.0
+		def kernel(x):
+			#F(x;α,β) = 1 / (1 + (x/α)^(-β)), which unlike (x/α)^β / (1 + (x/α)^β) does not turn nan as x → ∞
+			with np.errstate(divide="ignore",over="ignore"):
+				return 1 / (1 + (self.a / np.maximum(x,0.0)) ** self.b)
+		return _blockwise(kernel,x)
+
+	def sample(self,size=1,seed=None):
+		"""
+		Method to draw random variates from the log logistic distribution, in the dtype of the precision policy
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of log logistic random variates
+		"""
+		rng = np.random.default_rng(seed)
+		u = rng.random(size,dtype=get_dtype())
+		"""
+		Inverse of the cdf, F(x) = 1 / (1 + (x/α)^(-β))
+				   u
+		x = α (-------)^(1/β)
+			  1 - u
+		"""
+		return float(self.a) * (u / (1 - u)) ** (1.0 / float(self.b))
 
 	def __repr__(self):
 		"""
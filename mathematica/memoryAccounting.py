@@ -0,0 +1,192 @@
+"""
+Memory Accounting
+(tracemalloc backed peak, retained and per element memory of loads, fits and evaluations)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import sys
+import threading
+import contextlib
+import tracemalloc
+import numpy as np
+
+#Frames kept per allocation when tracking starts tracemalloc itself
+TRACEBACK_LIMIT = 1
+
+#Regions open in any thread, tracemalloc is started by the first one and stopped by the last
+_lock = threading.Lock()
+_active = 0
+#Whether tracemalloc was started by track_memory rather than by the caller
+_owned = False
+
+def data_bytes(data):
+	"""
+	Function to find the bytes held by a data buffer
+
+	Args:
+		data(list/ndarray): Data, eg. self.data of a distribution
+
+	Returns:
+		bytes(int): nbytes of an array (0 for a memory map), the list plus its distinct elements otherwise
+	"""
+	if isinstance(data,np.memmap):
+		return 0
+	if isinstance(data,np.ndarray):
+		return int(data.nbytes) if data.base is None or not isinstance(data.base,np.memmap) else 0
+	if isinstance(data,(list,tuple)):
+		seen, size = set(), sys.getsizeof(data)
+		for value in data:
+			if id(value) not in seen:
+				seen.add(id(value))
+				size += sys.getsizeof(value)
+		return size
+	return sys.getsizeof(data)
+
+def data_elements(instance):
+	"""
+	Function to count the values held by a distribution
+
+	Args:
+		instance(object): Distribution instance
+
+	Returns:
+		elements(int): len(data), or the total of the frequencies for data stored as counts
+	"""
+	frequencies = getattr(instance,"frequencies",None)
+	data = getattr(instance,"data",None)
+	if frequencies is not None and not len(data if data is not None else ()):
+		return int(np.sum(frequencies))
+	try:
+		return len(data)
+	except TypeError:
+		return 0
+
+def _snapshot():
+	"""
+	Function to take a tracemalloc snapshot without the blocks of tracemalloc itself
+
+	Args:
+		none
+
+	Returns:
+		snapshot(Snapshot): Filtered snapshot
+	"""
+	return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False,tracemalloc.__file__),))
+
+class MemoryReport:
+	"""
+	Memory report class of one tracked region
+
+	Attributes:
+		1. label (name of the region)
+		2. elements (number of elements loaded, fitted or evaluated)
+		3. peak (largest traced memory above the start of the region, in bytes)
+		4. retained (traced memory still held at the end, in bytes)
+		5. allocations (memory blocks allocated in the region and still alive, None without snapshots)
+		6. dataBytes (bytes of the data, values and frequencies of the instance, None without an instance)
+		7. bytesPerElement (peak / elements)
+
+	Notes:
+		tracemalloc traces the whole process, so allocations made by other threads during the
+		region are counted as well. numpy buffers are traced through its allocator hooks.
+	"""
+	def __init__(self,label,elements=None):
+		self.label = label
+		self.elements = elements
+		self.peak = 0
+		self.retained = 0
+		self.allocations = None
+		self.dataBytes = None
+
+	@property
+	def bytesPerElement(self):
+		return self.peak / self.elements if self.elements else None
+
+	def as_dict(self):
+		"""
+		Method to export the report
+
+		Args:
+			none
+
+		Returns:
+			report(dict): Every attribute of the report
+		"""
+		return {"label": self.label,"elements": self.elements,"peak": self.peak,"retained": self.retained,
+			"allocations": self.allocations,"dataBytes": self.dataBytes,"bytesPerElement": self.bytesPerElement}
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the report
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the report
+		"""
+		perElement = "{:.1f}".format(self.bytesPerElement) if self.bytesPerElement is not None else "n/a"
+		return "{}: Elements: {}, Peak: {} bytes, Retained: {} bytes, Allocations: {}, Data: {} bytes, Bytes per element: {}".format(
+			self.label,self.elements,self.peak,self.retained,self.allocations,self.dataBytes,perElement)
+
+@contextlib.contextmanager
+def track_memory(label="region",instance=None,elements=None,snapshots=True):
+	"""
+	Function to measure the memory of a block of code
+
+	Args:
+		label(string): Name of the region
+		instance(object): Distribution whose data buffers are measured at the end, and whose
+			number of values is the element count when elements is None
+		elements(int): Number of elements handled by the region
+		snapshots(bool): Whether to count the surviving allocations with tracemalloc snapshots,
+			which costs time in proportion to the traced blocks
+
+	Returns:
+		report(MemoryReport): Filled in when the block exits
+
+	Notes:
+		tracemalloc is started when the first region of the process opens, if it is not tracing
+		yet, and stopped when the last one closes, so regions may overlap across threads. The
+		peak is only reset while no other region is open, thus nested or concurrent regions
+		report the peak since the oldest open region began, and all of them count the
+		allocations of the others.
+	"""
+	global _active, _owned
+	report = MemoryReport(label,elements)
+	with _lock:
+		if _active == 0:
+			_owned = not tracemalloc.is_tracing()
+			if _owned:
+				tracemalloc.start(TRACEBACK_LIMIT)
+			resetPeak = getattr(tracemalloc,"reset_peak",None)
+			if resetPeak is not None:
+				resetPeak()
+		_active += 1
+
+	try:
+		before = _snapshot() if snapshots else None
+		start = tracemalloc.get_traced_memory()[0]
+		try:
+			yield report
+		finally:
+			current, peak = tracemalloc.get_traced_memory()
+			report.peak = max(peak - start,0)
+			report.retained = current - start
+			if before is not None:
+				difference = _snapshot().compare_to(before,"lineno")
+				report.allocations = sum(max(statistic.count_diff,0) for statistic in difference)
+	finally:
+		with _lock:
+			_active -= 1
+			if _active == 0 and _owned:
+				tracemalloc.stop()
+				_owned = False
+
+	if instance is not None:
+		data = getattr(instance,"data",None)
+		frequencies = getattr(instance,"frequencies",None)
+		report.dataBytes = (data_bytes(data) if data is not None else 0) + (data_bytes(frequencies) + data_bytes(instance.values) if frequencies is not None else 0)
+		if report.elements is None:
+			report.elements = data_elements(instance)
@@ -0,0 +1,416 @@
+"""
+Moving Statistics
+(Sliding window and exponentially weighted moment estimators)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import numpy as np
+from .exponentialDistribution import Exponential	#Import exponentialDistribution.py module
+from .gaussianDistribution import Gaussian	#Import gaussianDistribution.py module
+from .laplaceDistribution import Laplace	#Import laplaceDistribution.py module
+
+#Outputs per segment of restarted prefix sums in MovingStatistics.rolling
+SEGMENT = 4096
+
+def _fit_moments(distribution,mean,stdev):
+	"""
+	Function to set the parameters of a distribution from a mean and a standard deviation
+
+	Args:
+		distribution(distribution): Gaussian, Laplace or Exponential instance
+		mean(float): Mean of the data
+		stdev(float): Standard deviation of the data
+
+	Returns:
+		distribution(distribution): The updated instance
+
+	Raises:
+		TypeError(string): Raised when the distribution can not be fitted from moments
+	"""
+	if isinstance(distribution,Gaussian):
+		distribution.mean = mean
+		distribution.stdev = stdev
+	elif isinstance(distribution,Laplace):
+		#Variance = 2β^(2)
+		distribution.mu = mean
+		distribution.b = stdev / math.sqrt(2)
+		distribution.calculate_mean()
+		distribution.calculate_stdev()
+	elif isinstance(distribution,Exponential):
+		#Mean = 1/λ
+		distribution.lamda = 1 / mean
+		distribution.calculate_mean()
+		distribution.calculate_stdev()
+	else:
+		raise TypeError("moments can only update Gaussian, Laplace or Exponential instances")
+	return distribution
+
+def _sliding_extreme(x,window,accumulate):
+	"""
+	Function to calculate the minimum (or maximum) of every full window (van Herk/Gil-Werman)
+
+	Args:
+		x(ndarray): Samples, padded so the first output window is full
+		window(int): Length of the window
+		accumulate(ufunc): np.minimum or np.maximum
+
+	Returns:
+		extreme(ndarray): Extreme of x[i:i+window] for i = 0..len(x)-window
+	"""
+	fill = np.inf if accumulate is np.minimum else -np.inf
+	blocks = -(-x.size // window)
+	padded = np.full(blocks * window,fill)
+	padded[:x.size] = x
+	padded = padded.reshape(blocks,window)
+
+	#Running extreme from the left and from the right inside every block of length window
+	prefix = accumulate.accumulate(padded,axis=1).ravel()
+	suffix = accumulate.accumulate(padded[:,::-1],axis=1)[:,::-1].ravel()
+
+	count = x.size - window + 1
+	return accumulate(suffix[:count],prefix[window - 1:window - 1 + count])
+
+def _exponential_filter(inputs,initial,decay):
+	"""
+	Function to run the recurrence y(n) = decay y(n-1) + inputs(n) over a chunk
+
+	Args:
+		inputs(ndarray): Inputs of the recurrence
+		initial(float): Value of y before the chunk
+		decay(float): Decay factor, 0 ≤ decay < 1
+
+	Returns:
+		outputs(ndarray): y(n) for every input
+	"""
+	#Without decay (α = 1) the recurrence keeps only the latest input
+	if decay == 0:
+		return np.array(inputs,dtype=np.float64)
+
+	outputs = np.empty(inputs.size)
+
+	#Blocks are kept short enough for decay^(-block) to stay finite
+	block = max(1,int(200 * math.log(10) / -math.log(decay)))
+	powers = decay ** -np.arange(1,min(block,inputs.size) + 1,dtype=np.float64)
+
+	for start in range(0,inputs.size,block):
+		chunk = inputs[start:start + block]
+		scale = powers[:chunk.size]
+		"""
+		y(j) = decay^(j+1) (y(-1) + Σ decay^(-(i+1)) inputs(i)), i ≤ j
+		"""
+		outputs[start:start + chunk.size] = (initial + np.cumsum(chunk * scale)) / scale
+		initial = outputs[start + chunk.size - 1]
+	return outputs
+
+class MovingStatistics:
+	"""
+	Moving statistics class for the mean, variance, minimum and maximum of a sliding window
+	The last windowSize samples are kept in a ring buffer and chunks are processed vectorized
+
+	Attributes:
+		1. windowSize (number of samples in the window)
+		2. count (number of samples seen)
+		3. mean, variance, minimum, maximum (statistics of the current window)
+
+	Notes:
+		Every chunk is processed in O(1) work per sample: window sums come from prefix sums,
+		restarted every SEGMENT samples around the local mean so that drift does not cost
+		precision, and window extremes from the van Herk/Gil-Werman block algorithm. Reading
+		the window tail costs O(windowSize) per chunk, so chunks of at least windowSize
+		samples keep the amortized cost constant.
+	"""
+	def __init__(self,windowSize=1000):
+		if windowSize < 1:
+			raise ValueError("window size must be at least 1")
+
+		self.windowSize = int(windowSize)
+		self.buffer = np.zeros(self.windowSize)
+		self.position = 0
+		self.count = 0
+
+		self.mean = float("nan")
+		self.variance = float("nan")
+		self.minimum = float("nan")
+		self.maximum = float("nan")
+
+	def _tail(self):
+		"""
+		Method to read the samples held in the ring buffer, oldest first
+
+		Args:
+			none
+
+		Returns:
+			tail(ndarray): Up to windowSize - 1 most recent samples
+		"""
+		held = min(self.count,self.windowSize - 1)
+		index = (self.position - held + np.arange(held)) % self.windowSize
+		return self.buffer[index]
+
+	def _store(self,samples):
+		"""
+		Method to write samples into the ring buffer
+
+		Args:
+			samples(ndarray): New samples
+
+		Returns:
+			No return value
+		"""
+		samples = samples[-self.windowSize:]
+		index = (self.position + np.arange(samples.size)) % self.windowSize
+		self.buffer[index] = samples
+		self.position = (self.position + samples.size) % self.windowSize
+
+	def rolling(self,samples):
+		"""
+		Method to add a chunk of samples and return the window statistics after every sample
+
+		Args:
+			samples(array): New samples
+
+		Returns:
+			statistics(dict): Arrays "mean", "variance", "stdev", "minimum" and "maximum"
+		"""
+		samples = np.asarray(samples,dtype=np.float64).ravel()
+		if samples.size == 0:
+			empty = np.empty(0)
+			return {"mean": empty, "variance": empty, "stdev": empty, "minimum": empty, "maximum": empty}
+
+		w = self.windowSize
+		tail = self._tail()
+		values = np.concatenate((tail,samples))
+
+		#Number of samples in the window ending at every new sample
+		sizes = np.minimum(self.count + np.arange(1,samples.size + 1),w).astype(np.float64)
+
+		ends = tail.size + np.arange(1,samples.size + 1)
+		starts = ends - sizes.astype(np.int64)
+		mean = np.empty(samples.size)
+		variance = np.empty(samples.size)
+
+		"""
+		Prefix sums are restarted every SEGMENT outputs, shifted by the mean of the samples
+		the segment's windows cover, so drifting data can not build up large sums
+		Variance = (Σ(x-r)^2 - (Σ(x-r))^2 / n) / (n - 1)
+		"""
+		for first in range(0,samples.size,SEGMENT):
+			last = min(first + SEGMENT,samples.size)
+			lo, hi = starts[first], ends[last - 1]
+			segment = values[lo:hi]
+			reference = segment.mean()
+			shifted = segment - reference
+			sums = np.concatenate(([0.0],np.cumsum(shifted)))
+			squares = np.concatenate(([0.0],np.cumsum(shifted * shifted)))
+
+			n = sizes[first:last]
+			windowSum = sums[ends[first:last] - lo] - sums[starts[first:last] - lo]
+			windowSquares = squares[ends[first:last] - lo] - squares[starts[first:last] - lo]
+			windowMean = windowSum / n
+			with np.errstate(divide="ignore",invalid="ignore"):
+				variance[first:last] = np.maximum(windowSquares - windowSum * windowMean,0) / (n - 1)
+			mean[first:last] = windowMean + reference
+		variance[sizes < 2] = float("nan")
+
+		#Windows that are not full yet are padded with neutral values
+		missing = w - 1 - tail.size
+		minimum = _sliding_extreme(np.concatenate((np.full(missing,np.inf),values)),w,np.minimum)
+		maximum = _sliding_extreme(np.concatenate((np.full(missing,-np.inf),values)),w,np.maximum)
+
+		self._store(samples)
+		self.count += samples.size
+		self.mean = float(mean[-1])
+		self.variance = float(variance[-1])
+		self.minimum = float(minimum[-1])
+		self.maximum = float(maximum[-1])
+
+		return {"mean": mean, "variance": variance, "stdev": np.sqrt(variance), "minimum": minimum, "maximum": maximum}
+
+	def update(self,samples):
+		"""
+		Method to add a chunk of samples
+
+		Args:
+			samples(array): New samples
+
+		Returns:
+			No return value
+		"""
+		self.rolling(samples)
+
+	def calculate_mean(self):
+		"""
+		Method to calculate the mean of the current window
+
+		Args:
+			none
+
+		Returns:
+			self.mean(float): Mean of the window
+		"""
+		return self.mean
+
+	def calculate_stdev(self):
+		"""
+		Method to calculate the sample standard deviation of the current window
+
+		Args:
+			none
+
+		Returns:
+			stdev(float): Standard deviation of the window
+		"""
+		return math.sqrt(self.variance)
+
+	def update_distribution(self,distribution):
+		"""
+		Method to refresh the parameters of a Gaussian, Laplace or Exponential instance from the window
+
+		Args:
+			distribution(distribution): Instance to update
+
+		Returns:
+			distribution(distribution): The updated instance
+		"""
+		return _fit_moments(distribution,self.mean,self.calculate_stdev())
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the moving statistics instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the window
+		"""
+		return "Window: {}, Samples: {}, Mean: {}, Variance: {}, Minimum: {}, Maximum: {}".format(self.windowSize,self.count,self.mean,self.variance,self.minimum,self.maximum)
+
+class ExponentialMovingStatistics:
+	"""
+	Exponential moving statistics class for the exponentially weighted mean and variance (EWMA)
+
+	Notation:
+		m(n) = m(n-1) + α (x(n) - m(n-1))
+		v(n) = (1-α) (v(n-1) + α (x(n) - m(n-1))^2)
+
+	Attributes:
+		1. alpha (smoothing factor, 0 < α ≤ 1)
+		2. count (number of samples seen)
+		3. mean, variance (current exponentially weighted estimates)
+	"""
+	def __init__(self,alpha=None,halfLife=None):
+		#A half life h gives α = 1 - 2^(-1/h)
+		if alpha is None:
+			if halfLife is None:
+				raise ValueError("either alpha or halfLife is required")
+			alpha = 1 - 2 ** (-1 / halfLife)
+		if not 0 < alpha <= 1:
+			raise ValueError("alpha must lie in (0,1]")
+
+		self.alpha = alpha
+		self.count = 0
+		self.mean = float("nan")
+		self.variance = float("nan")
+
+	def rolling(self,samples):
+		"""
+		Method to add a chunk of samples and return the estimates after every sample
+
+		Args:
+			samples(array): New samples
+
+		Returns:
+			statistics(dict): Arrays "mean", "variance" and "stdev"
+		"""
+		samples = np.asarray(samples,dtype=np.float64).ravel()
+		if samples.size == 0:
+			empty = np.empty(0)
+			return {"mean": empty, "variance": empty, "stdev": empty}
+
+		#The first sample ever seen initialises the estimates
+		start = 0
+		if self.count == 0:
+			self.mean = float(samples[0])
+			self.variance = 0.0
+			start = 1
+
+		a = self.alpha
+		rest = samples[start:]
+		mean = _exponential_filter(a * rest,self.mean,1 - a)
+
+		#Deviations from the previous mean drive the variance recurrence
+		previous = np.concatenate(([self.mean],mean[:-1]))
+		deviation = rest - previous
+		variance = _exponential_filter((1 - a) * a * deviation * deviation,self.variance,1 - a)
+
+		if start:
+			mean = np.concatenate(([self.mean],mean))
+			variance = np.concatenate(([0.0],variance))
+
+		self.count += samples.size
+		self.mean = float(mean[-1])
+		self.variance = float(variance[-1])
+		return {"mean": mean, "variance": variance, "stdev": np.sqrt(variance)}
+
+	def update(self,samples):
+		"""
+		Method to add a chunk of samples
+
+		Args:
+			samples(array): New samples
+
+		Returns:
+			No return value
+		"""
+		self.rolling(samples)
+
+	def calculate_mean(self):
+		"""
+		Method to calculate the exponentially weighted mean
+
+		Args:
+			none
+
+		Returns:
+			self.mean(float): Exponentially weighted mean
+		"""
+		return self.mean
+
+	def calculate_stdev(self):
+		"""
+		Method to calculate the exponentially weighted standard deviation
+
+		Args:
+			none
+
+		Returns:
+			stdev(float): Exponentially weighted standard deviation
+		"""
+		return math.sqrt(self.variance)
+
+	def update_distribution(self,distribution):
+		"""
+		Method to refresh the parameters of a Gaussian, Laplace or Exponential instance from the estimates
+
+		Args:
+			distribution(distribution): Instance to update
+
+		Returns:
+			distribution(distribution): The updated instance
+		"""
+		return _fit_moments(distribution,self.mean,self.calculate_stdev())
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the exponential moving statistics instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the estimator
+		"""
+		return "α: {}, Samples: {}, Mean: {}, Variance: {}".format(self.alpha,self.count,self.mean,self.variance)
@@ -5,7 +5,9 @@ Poisson Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution 	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _recurrence_pmf 	#Import generalDistribution.py module
+from .specialFunctions import log_gamma	#Import specialFunctions.py module
 
 class Poisson(Distribution):
 	"""
@@ -75,6 +77,97 @@ class Poisson(Distribution):
 		return self.mu
 
 
+	def replace_stats_with_counts(self,values=None,counts=None):
+		"""
+		Method to calculate the rate parameter from counted (or weighted) data
+        
+		Args: 
+			values(array): Distinct counts of events, the counted data of the instance when None
+			counts(array): Number of occurrences (or weight) of every value
+        
+		Returns: 
+			self.mu(float): Rate parameter
+		"""
+		values, counts = self._weighted_data(values,counts)
+		#μ = Σ c k / Σ c
+		self.mu = float(np.dot(values,counts) / counts.sum())
+
+		#Calculate mean and standard deviation
+		self.mean = self.calculate_mean()
+		self.stdev = self.calculate_stdev()
+		return self.mu
+
+	def calculate_log_likelihood(self,values=None,counts=None):
+		"""
+		Method to calculate the log-likelihood of counted data
+        
+		Args: 
+			values(array): Distinct counts of events, the counted data of the instance when None
+			counts(array): Number of occurrences of every value
+        
+		Returns: 
+			loglikelihood(float): Log-likelihood of the data
+		"""
+		values, counts = self._weighted_data(values,counts)
+		"""
+		ℓ(μ) = Σ c (k ln μ - μ - ln k!)
+		"""
+		with np.errstate(divide="ignore",invalid="ignore"):
+			logRate = np.where(values > 0,values * np.log(self.mu),0.0)
+		return float(np.dot(counts,logRate - self.mu - np.asarray(log_gamma(values + 1))))
+
+	def pmf_range(self,lo,hi):
+		"""
+		Method to calculate the probability mass function on a range of k in O(hi-lo) time
+        
+		Args:
+			lo(int): First number of events
+			hi(int): Last number of events
+
+		Returns:
+			pmf(ndarray): f(k) for k = lo..hi, zero below 0
+		"""
+		mu = self.mu
+		lo, hi = int(lo), int(hi)
+		if mu == 0:
+			#All the mass sits at k = 0
+			pmf = np.zeros(max(hi - lo + 1,0))
+			if lo <= 0 <= hi:
+				pmf[-lo] = 1.0
+			return pmf
+
+		logRate = math.log(mu)
+		mode = int(mu)
+		"""
+		f(k+1)/f(k) = μ/(k+1) = 1 + (μ-k-1)/(k+1)
+
+		f(k)/f(m) = m!/k! μ^(k-m)
+		"""
+		def logRatio(k):
+			#log1p keeps the ratios near the mode accurate, they add up over long ranges
+			return np.log1p((mu - k - 1) / (k + 1))
+
+		def logRelative(k):
+			return log_gamma(mode + 1) - log_gamma(k + 1) + (k - mode) * logRate
+
+		return _recurrence_pmf(lo,hi,(0,math.inf),mode,math.sqrt(mu),logRatio,logRelative)
+
+	def pmf_table(self,tailMass=1e-16):
+		"""
+		Method to calculate the probability mass function from 0 until the remaining tail is negligible
+        
+		Args:
+			tailMass(float): Largest probability left beyond the last entry
+
+		Returns:
+			pmf(ndarray): f(k) for k = 0,1,...,K
+		"""
+		pmf = self.pmf_range(0,int(self.mu + 40 * math.sqrt(self.mu)) + 40)
+		#Mass beyond every k, the table stops at the first k leaving less than tailMass
+		tail = np.cumsum(pmf[::-1])[::-1]
+		beyond = np.flatnonzero(tail[1:] < tailMass)
+		return pmf[:beyond[0] + 1] if beyond.size else pmf
+
 	def pdf(self,x):
 		"""
 		Method to calculate probability density function for poisson distribution
@@ -0,0 +1,148 @@
+"""
+Precision
+(Global and scoped float64/float32 policy for the vectorized kernels)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import threading
+import contextlib
+import numpy as np
+
+#Names of the supported precisions
+PRECISIONS = {"double": np.float64,"single": np.float32}
+#Machine epsilon of float32, the unit of the error bounds
+SINGLE_EPSILON = float(np.finfo(np.float32).eps)
+
+"""
+Error bounds of the single precision kernels, in units of SINGLE_EPSILON (2^-23 ≈ 1.19e-7)
+
+pdf: relative error, ppf: error relative to the largest quantile, cdf and logpdf: absolute
+error. Errors are measured against the double precision kernels at the same float32 inputs,
+at the parameters and over the ranges of asv_benchmarks/benchmarks/precision.py, and every
+bound is at least twice the error measured there. Far tails, where the exponent of exp()
+grows, lose relative accuracy in proportion to that exponent.
+"""
+ERROR_BOUNDS = {
+	"Uniform": {"pdf": 1,"cdf": 1,"ppf": 1,"logpdf": 1},
+	"Trapezoidal": {"pdf": 1,"cdf": 1,"ppf": 1,"logpdf": 8},
+	"Arcsine": {"pdf": 4,"cdf": 16,"ppf": 4,"logpdf": 4},
+	"BoundedArcsine": {"pdf": 4,"cdf": 8,"ppf": 4,"logpdf": 8},
+	"Reciprocal": {"pdf": 2,"cdf": 2,"ppf": 8,"logpdf": 8},
+	"Bradford": {"pdf": 4,"cdf": 4,"ppf": 4,"logpdf": 8},
+	"Burr": {"pdf": 64,"cdf": 2,"logpdf": 64},
+	"LogLogistic": {"pdf": 16,"cdf": 2,"logpdf": 16},
+	"InverseGaussian": {"pdf": 64,"cdf": 8,"logpdf": 128},
+	"Levy": {"pdf": 16,"cdf": 1,"logpdf": 32},
+	"F": {"pdf": 32,"logpdf": 32},
+	"Gaussian": {"pdf": 16,"logpdf": 16},
+	"Exponential": {"pdf": 4,"cdf": 2,"logpdf": 16},
+	"Laplace": {"pdf": 4,"cdf": 2,"logpdf": 16},
+}
+
+#Precision of the whole process, and the scoped overrides of every thread
+_default = "double"
+_local = threading.local()
+
+def _check(name):
+	"""
+	Function to validate a precision name
+
+	Args:
+		name(string): "double" or "single"
+
+	Returns:
+		name(string): The validated name
+
+	Raises:
+		ValueError(string): Raised for an unknown precision
+	"""
+	if name not in PRECISIONS:
+		raise ValueError("precision must be one of {}, got {!r}".format(sorted(PRECISIONS),name))
+	return name
+
+def set_precision(name):
+	"""
+	Function to set the precision of the whole process
+
+	Args:
+		name(string): "double" (float64, the default) or "single" (float32)
+
+	Returns:
+		previous(string): The precision that was set before
+	"""
+	global _default
+	previous, _default = _default, _check(name)
+	return previous
+
+def get_precision():
+	"""
+	Function to find the precision in effect on the calling thread
+
+	Args:
+		none
+
+	Returns:
+		name(string): "double" or "single"
+	"""
+	stack = getattr(_local,"stack",None)
+	return stack[-1] if stack else _default
+
+def get_dtype():
+	"""
+	Function to find the numpy dtype of the precision in effect on the calling thread
+
+	Args:
+		none
+
+	Returns:
+		dtype(type): np.float64 or np.float32
+	"""
+	return PRECISIONS[get_precision()]
+
+@contextlib.contextmanager
+def use_precision(name):
+	"""
+	Function to switch the precision of the calling thread inside a with block
+
+	Args:
+		name(string): "double" or "single"
+
+	Returns:
+		context(context manager): Restores the previous precision on exit
+	"""
+	stack = getattr(_local,"stack",None)
+	if stack is None:
+		stack = _local.stack = []
+	stack.append(_check(name))
+	try:
+		yield name
+	finally:
+		stack.pop()
+
+def measure_error(distribution,method,x):
+	"""
+	Function to measure the error of a single precision kernel against the double precision one
+
+	Args:
+		distribution(object): Distribution instance
+		method(string): "pdf", "logpdf", "cdf" or "ppf"
+		x(array): Points (probabilities for ppf), rounded to float32 first
+
+	Returns:
+		error(float): Largest error in units of SINGLE_EPSILON, relative for pdf, relative to the largest quantile for ppf, absolute otherwise
+	"""
+	x = np.asarray(x,dtype=np.float32)
+	with use_precision("single"):
+		single = np.asarray(getattr(distribution,method)(x),dtype=np.float64)
+	with use_precision("double"):
+		double = np.asarray(getattr(distribution,method)(x.astype(np.float64)),dtype=np.float64)
+
+	finite = np.isfinite(double)
+	error = np.abs(single[finite] - double[finite])
+	if method == "pdf":
+		error = error / np.maximum(np.abs(double[finite]),np.finfo(np.float64).tiny)
+	elif method == "ppf" and error.size:
+		#Quantiles may cross zero, so they are compared with the largest one
+		error = error / max(np.abs(double[finite]).max(),np.finfo(np.float64).tiny)
+	return float(error.max()) / SINGLE_EPSILON if error.size else 0.0
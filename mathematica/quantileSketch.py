@@ -0,0 +1,318 @@
+"""
+Quantile Sketch
+(Mergeable KLL sketch for streaming quantiles and empirical distributions)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import numpy as np
+from .generalDistribution import Distribution, _combine_moments	#Import generalDistribution.py module
+
+class KLLSketch(Distribution):
+	"""
+	KLL sketch class for approximate quantiles, cdf and pdf of data far larger than memory
+	KLL sketch class inherits from general distribution class
+
+	Notation:
+		Level h is a compactor holding items of weight 2^h. A full compactor sorts its items
+		and promotes every other one (random offset) to level h+1.
+
+	Attributes:
+		1. k (accuracy parameter, the observed normalized rank error is about 2.5/k)
+		2. levels (list of compactors, one float64 array per level)
+		3. count, average, m2 (exact number, mean and sum of squared deviations of the items)
+		4. minimum, maximum (exact extremes)
+
+	Notes:
+		Memory stays below about 3k items whatever the size of the stream. Sketches built on
+		different processes (they pickle as plain numpy arrays) combine with merge().
+	"""
+	def __init__(self,k=200,seed=None):
+		if k < 8:
+			raise ValueError("k must be at least 8")
+
+		Distribution.__init__(self,0,0)
+		self.k = int(k)
+		self.levels = [np.empty(0)]
+		self.rng = np.random.default_rng(seed)
+
+		self.count = 0
+		self.average = 0.0
+		self.m2 = 0.0
+		self.minimum = float("inf")
+		self.maximum = float("-inf")
+
+		#Worst case and summed squared rank error added by the compactions
+		self.worstError = 0.0
+		self.squaredError = 0.0
+		self._sorted = None
+
+	def _capacity(self,level):
+		"""
+		Method to calculate the capacity of a compactor, which shrinks by 2/3 per level below the top
+
+		Args:
+			level(int): Level of the compactor
+
+		Returns:
+			capacity(int): Number of items the compactor holds before compacting
+		"""
+		depth = len(self.levels) - 1 - level
+		return max(8,int(math.ceil(self.k * (2 / 3) ** depth)))
+
+	def _compress(self):
+		"""
+		Method to compact every compactor holding more items than its capacity
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		level = 0
+		while level < len(self.levels):
+			items = self.levels[level]
+			if items.size > self._capacity(level):
+				if level + 1 == len(self.levels):
+					self.levels.append(np.empty(0))
+
+				items = np.sort(items)
+				#An odd item out stays behind
+				keep = items[items.size - items.size % 2:]
+				promoted = items[int(self.rng.integers(2)):items.size - items.size % 2:2]
+				self.levels[level] = keep
+				self.levels[level + 1] = np.concatenate((self.levels[level + 1],promoted))
+
+				#Any rank moves by at most the weight of one item, with a random sign
+				weight = float(2 ** level)
+				self.worstError += weight
+				self.squaredError += weight * weight
+			level += 1
+
+	def update(self,values):
+		"""
+		Method to add a chunk of values to the sketch
+
+		Args:
+			values(float/array): New values
+
+		Returns:
+			No return value
+		"""
+		values = np.asarray(values,dtype=np.float64).ravel()
+		values = values[~np.isnan(values)]
+		if values.size == 0:
+			return
+
+		self.count, self.average, self.m2 = _combine_moments(self.count,self.average,self.m2,values)
+		self.minimum = min(self.minimum,float(values.min()))
+		self.maximum = max(self.maximum,float(values.max()))
+
+		self.levels[0] = np.concatenate((self.levels[0],values))
+		self._compress()
+		self._sorted = None
+
+	def merge(self,other):
+		"""
+		Method to merge another sketch into this one
+
+		Args:
+			other(KLLSketch): Sketch built on another part of the data
+
+		Returns:
+			self(KLLSketch): The merged sketch
+		"""
+		while len(self.levels) < len(other.levels):
+			self.levels.append(np.empty(0))
+		for level,items in enumerate(other.levels):
+			self.levels[level] = np.concatenate((self.levels[level],items))
+
+		self.count, self.average, self.m2 = _combine_moments(self.count,self.average,self.m2,other=(other.count,other.average,other.m2))
+		self.minimum = min(self.minimum,other.minimum)
+		self.maximum = max(self.maximum,other.maximum)
+		self.worstError += other.worstError
+		self.squaredError += other.squaredError
+
+		self._compress()
+		self._sorted = None
+		return self
+
+	def read_data_file(self,file_name,chunkSize=1 << 20):
+		"""
+		Method to stream numbers from a txt file(file_name) into the sketch
+
+		Args:
+			file_name(string/file): Name of the file (or an open file object) to read data from
+			chunkSize(int): Number of bytes read per chunk
+
+		Returns:
+			No return value
+		"""
+		for chunk in self.read_data_chunks(file_name,chunkSize):
+			self.update(chunk)
+
+	def _weighted(self):
+		"""
+		Method to list the retained items in ascending order with their cumulative weights
+
+		Args:
+			none
+
+		Returns:
+			items(ndarray): Sorted retained items
+			cumulative(ndarray): Total weight of the items up to and including each item
+
+		Raises:
+			ValueError(string): Raised when the sketch has seen no values
+		"""
+		if self.count == 0:
+			raise ValueError("empty sketch")
+		if self._sorted is None:
+			items = np.concatenate(self.levels)
+			weights = np.concatenate([np.full(level.size,2.0 ** h) for h,level in enumerate(self.levels)])
+			order = np.argsort(items,kind="stable")
+			self._sorted = (items[order],np.cumsum(weights[order]))
+		return self._sorted
+
+	def rank_error(self,delta=0.01):
+		"""
+		Method to bound the normalized rank error of a single cdf or ppf query
+
+		Args:
+			delta(float): Probability that the bound fails
+
+		Returns:
+			error(float): |estimated rank - true rank| / count, holding with probability 1 - delta
+		"""
+		if self.count == 0:
+			return 0.0
+		"""
+		Hoeffding: P(|Σ e| > t) ≤ 2 exp(-t^2 / (2 Σ w^2)), every |e| ≤ w
+		"""
+		probable = math.sqrt(2 * self.squaredError * math.log(2 / delta))
+		return min(self.worstError,probable) / self.count
+
+	def calculate_mean(self):
+		"""
+		Method to calculate the exact mean of the values seen
+
+		Args:
+			none
+
+		Returns:
+			self.mean(float): Mean of the values
+		"""
+		self.mean = self.average
+		return self.mean
+
+	def calculate_stdev(self,sample=True):
+		"""
+		Method to calculate the exact standard deviation of the values seen
+
+		Args:
+			sample(bool): Whether the values are a sample or the whole population
+
+		Returns:
+			self.stdev(float): Standard deviation of the values
+		"""
+		n = self.count - 1 if sample else self.count
+		self.calculate_mean()
+		self.stdev = math.sqrt(self.m2 / n)
+		return self.stdev
+
+	def cdf(self,x):
+		"""
+		Method to estimate the cumulative distribution function, P(X ≤ x)
+
+		Args:
+			x(float/array): Points to evaluate
+
+		Returns:
+			probability(float/ndarray): Estimated fraction of values ≤ x
+
+		Raises:
+			ValueError(string): Raised when the sketch has seen no values
+		"""
+		items, cumulative = self._weighted()
+		x = np.asarray(x,dtype=np.float64)
+		index = np.searchsorted(items,x,side="right")
+		probability = np.where(index > 0,cumulative[np.maximum(index - 1,0)],0.0) / cumulative[-1]
+
+		#Exact extremes pin the tails
+		probability = np.where(x < self.minimum,0.0,np.where(x >= self.maximum,1.0,probability))
+		return float(probability) if probability.ndim == 0 else probability
+
+	def ppf(self,q):
+		"""
+		Method to estimate the quantile function (inverse cdf)
+
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			quantile(float/ndarray): Smallest retained value whose estimated cdf reaches q
+
+		Raises:
+			ValueError(string): Raised when the sketch has seen no values
+		"""
+		items, cumulative = self._weighted()
+		q = np.asarray(q,dtype=np.float64)
+		index = np.searchsorted(cumulative,q * cumulative[-1],side="left")
+		quantile = items[np.minimum(index,items.size - 1)]
+		quantile = np.where(q <= 0,self.minimum,np.where(q >= 1,self.maximum,quantile))
+		return float(quantile) if quantile.ndim == 0 else quantile
+
+	def pdf(self,x,spacing=None):
+		"""
+		Method to estimate the probability density function from quantile spacings
+
+		Args:
+			x(float/array): Points to evaluate
+			spacing(float): Probability half width of the spacing, chosen from the rank error when None
+
+		Returns:
+			density(float/ndarray): Estimated density
+
+		Raises:
+			ValueError(string): Raised when the sketch has seen no values
+		"""
+		if self.count == 0:
+			raise ValueError("empty sketch")
+		if spacing is None:
+			#Wide enough for the rank error to be a small part of every spacing
+			spacing = min(0.1,max(4 * self.rank_error(),self.count ** (-1 / 3)))
+		"""
+		f(x) ≈ 2h / (Q(F(x)+h) - Q(F(x)-h))
+		"""
+		x = np.asarray(x,dtype=np.float64)
+		center = np.clip(np.asarray(self.cdf(x)),spacing,1 - spacing)
+		width = np.asarray(self.ppf(center + spacing)) - np.asarray(self.ppf(center - spacing))
+		with np.errstate(divide="ignore"):
+			density = np.where((x >= self.minimum) & (x <= self.maximum),2 * spacing / width,0.0)
+		return float(density) if density.ndim == 0 else density
+
+	def __len__(self):
+		"""
+		Method to count the items retained by the sketch
+
+		Args:
+			none
+
+		Returns:
+			size(int): Number of retained items
+		"""
+		return sum(level.size for level in self.levels)
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the KLL sketch instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the sketch
+		"""
+		return "k: {}, Count: {}, Retained: {}, Minimum: {}, Maximum: {}, Rank error: {}".format(self.k,self.count,len(self),self.minimum,self.maximum,self.rank_error())
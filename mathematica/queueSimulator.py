@@ -0,0 +1,216 @@
+"""
+Queue Simulator
+(Discrete event simulation of M/M/c and M/G/c queues)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import heapq
+import numpy as np
+from .exponentialDistribution import Exponential	#Import exponentialDistribution.py module
+
+class QueueSimulator:
+	"""
+	Queue simulator class for simulating a first come first served queue with c servers
+	Inter-arrival and service times are drawn from the sample() method of distribution instances
+
+	Notation:
+		M/G/c (M/M/c when the service is exponential)
+
+	Attributes:
+		1. arrivals (distribution of the inter-arrival times, Exponential instance by default)
+		2. service (distribution of the service times, eg. Erlang, Weibull or LogLogistic)
+		3. servers (number of servers c)
+		4. chunkSize (number of customers generated in bulk per step)
+
+	Notes:
+		The pending departures are kept in a binary heap of server release times, so
+		each arrival costs one heap replacement. Inter-arrival and service times are
+		drawn chunkSize at a time and every statistic is accumulated in a streaming
+		fashion, so memory stays O(chunkSize + c) whatever the number of events.
+	"""
+	def __init__(self,arrivals=None,service=None,servers=1,chunkSize=65536,seed=None):
+		#Default inter-arrival times ~ Exp(0.5)
+		if arrivals is None:
+			arrivals = Exponential(0.5)
+		#Default service times ~ Exp(1)
+		if service is None:
+			service = Exponential(1)
+
+		self.arrivals = arrivals
+		self.service = service
+		self.servers = int(servers)
+		self.chunkSize = int(chunkSize)
+		self.rng = np.random.default_rng(seed)
+
+		if self.servers < 1:
+			raise ValueError("at least one server is required")
+
+	def _reset(self):
+		"""
+		Method to clear the state and accumulated statistics of the simulator
+
+		Args:
+			none
+
+		Returns:
+			No return value
+		"""
+		#Release times of the c servers, all idle at time 0
+		self.releaseTimes = [0.0] * self.servers
+		self.clock = 0.0
+
+		self.customers = 0
+		self.meanWait = 0.0
+		self.squaredWait = 0.0	#Sum of squared deviations from the mean (M2)
+		self.maxWait = 0.0
+		self.delayed = 0
+		self.totalWait = 0.0
+		self.totalService = 0.0
+		self.startTime = None
+
+	def _simulate_chunk(self,count):
+		"""
+		Method to push count customers through the queue
+
+		Args:
+			count(int): Number of customers in the chunk
+
+		Returns:
+			waits(ndarray): Time spent in queue by each customer
+			services(ndarray): Service times of the customers
+		"""
+		interArrivals = np.asarray(self.arrivals.sample(count,self.rng),dtype=np.float64)
+		services = np.asarray(self.service.sample(count,self.rng),dtype=np.float64)
+		arrivalTimes = np.cumsum(interArrivals)
+		arrivalTimes += self.clock
+		self.clock = float(arrivalTimes[-1])
+
+		waits = [0.0] * count
+		release = self.releaseTimes
+		replace = heapq.heapreplace
+
+		#Each arrival is served by the server that becomes free first
+		for i, (arrival, duration) in enumerate(zip(arrivalTimes.tolist(),services.tolist())):
+			free = release[0]
+			if free > arrival:
+				waits[i] = free - arrival
+				replace(release,free + duration)
+			else:
+				replace(release,arrival + duration)
+
+		return np.array(waits), services
+
+	def _accumulate(self,waits,services):
+		"""
+		Method to merge the statistics of a chunk into the running statistics
+
+		Args:
+			waits(ndarray): Waiting times of the chunk
+			services(ndarray): Service times of the chunk
+
+		Returns:
+			No return value
+		"""
+		count = waits.size
+		if count == 0:
+			return
+
+		chunkMean = float(waits.mean())
+		chunkSquared = float(((waits - chunkMean) ** 2).sum())
+		total = self.customers + count
+		delta = chunkMean - self.meanWait
+
+		#Parallel update of the mean and M2 (Chan et al.)
+		self.meanWait += delta * count / total
+		self.squaredWait += chunkSquared + delta * delta * self.customers * count / total
+		self.customers = total
+
+		self.maxWait = max(self.maxWait,float(waits.max()))
+		self.delayed += int(np.count_nonzero(waits))
+		self.totalWait += float(waits.sum())
+		self.totalService += float(services.sum())
+
+	def run(self,customers=1000000,warmup=0):
+		"""
+		Method to simulate the queue for a number of customers
+
+		Args:
+			customers(int): Number of customers to record (each brings an arrival and a departure event)
+			warmup(int): Number of initial customers simulated but left out of the statistics
+
+		Returns:
+			summary(dict): Waiting time, queue length and utilization statistics
+		"""
+		self._reset()
+		remaining = int(warmup)
+
+		#Customers of the warm up period only drive the queue to steady state
+		while remaining > 0:
+			count = min(self.chunkSize,remaining)
+			self._simulate_chunk(count)
+			remaining -= count
+
+		remaining = int(customers)
+		self.startTime = self.clock
+		while remaining > 0:
+			count = min(self.chunkSize,remaining)
+			waits, services = self._simulate_chunk(count)
+			self._accumulate(waits,services)
+			remaining -= count
+
+		return self.summary()
+
+	def summary(self):
+		"""
+		Method to summarise the statistics of the last run
+
+		Args:
+			none
+
+		Returns:
+			summary(dict): Waiting time, queue length and utilization statistics
+		"""
+		n = self.customers
+		horizon = self.clock - self.startTime if self.startTime is not None else 0.0
+
+		if n > 1:
+			stdevWait = math.sqrt(self.squaredWait / (n - 1))
+		else:
+			stdevWait = 0.0
+
+		if horizon > 0:
+			#Area under the queue length curve equals the total waiting time
+			queueLength = self.totalWait / horizon
+			inSystem = (self.totalWait + self.totalService) / horizon
+			utilization = self.totalService / (self.servers * horizon)
+			throughput = n / horizon
+		else:
+			queueLength = inSystem = utilization = throughput = float("nan")
+
+		return {
+			"customers": n,
+			"events": 2 * n,
+			"mean_wait": self.meanWait,
+			"stdev_wait": stdevWait,
+			"max_wait": self.maxWait,
+			"probability_of_wait": self.delayed / n if n else float("nan"),
+			"mean_queue_length": queueLength,
+			"mean_in_system": inSystem,
+			"utilization": utilization,
+			"throughput": throughput,
+			"simulated_time": horizon,
+		}
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the queue simulator instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the simulator
+		"""
+		return "Servers: {}, Arrivals: ({}), Service: ({})".format(self.servers,self.arrivals,self.service)
@@ -0,0 +1,381 @@
+"""
+Erlang Queueing Model
+(Also known as M/M/c Queue, Erlang B and Erlang C formulas)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import numpy as np
+from .erlangDistribution import Erlang	#Import erlangDistribution.py module
+from .exponentialDistribution import Exponential	#Import exponentialDistribution.py module
+from .poissonDistribution import Poisson	#Import poissonDistribution.py module
+
+class ErlangQueue:
+	"""
+	Erlang queue class for calculating blocking, waiting and staffing of a M/M/c queue
+	Arrivals are described by a Poisson instance and service times by an Erlang instance
+
+	Notation:
+		M/M/c, A = λ E[S] (offered load in erlangs)
+
+	Attributes:
+		1. lamda (arrival rate, scalar or array of arrival rates)
+		2. serviceTime (mean service time, E[S])
+		3. load (offered load A = λ E[S], in erlangs)
+
+	Parameters:
+		λ ≥ 0 (arrivals per unit time)
+		E[S] > 0 (mean service time)
+		c ∈ {1,2,3,...} (number of servers)
+
+	Notes:
+		All formulas are computed with the recurrence 1/B(n) = 1 + (n/A) 1/B(n-1),
+		which never forms a factorial or a power of A and so stays finite for any
+		number of servers. Waiting times are exact for exponential service (k = 1)
+		and the usual M/M/c approximation for Erlang service with k > 1.
+	"""
+	def __init__(self,arrivals=None,service=None,arrivalRates=None):
+		#Default arrivals = Poisson(0.5) per unit time
+		if arrivals is None:
+			arrivals = Poisson()
+		#Default service = Erlang(1,1), that is exponential service with mean 1
+		if service is None:
+			service = Erlang()
+
+		self.arrivals = arrivals
+		self.service = service
+
+		#A grid of arrival rates overrides the rate of the poisson instance
+		if arrivalRates is None:
+			arrivalRates = arrivals.mean
+		self.lamda = np.asarray(arrivalRates,dtype=np.float64)
+		self.serviceTime = float(service.mean)
+
+		#Offered load, A = λ E[S]
+		self.load = self.lamda * self.serviceTime
+
+	def _as_output(self,value):
+		"""
+		Method to return a python float when the computation is on a single scenario
+
+		Args:
+			value(ndarray): Result of a vectorized computation
+
+		Returns:
+			value(float/ndarray): Float for 0-d results, array otherwise
+		"""
+		if np.ndim(value) == 0:
+			return float(value)
+		return value
+
+	def _inverse_blocking(self,servers):
+		"""
+		Method to calculate 1/B(c) for every scenario with the stable recurrence
+
+		Args:
+			servers(int/array): Number of servers c (broadcast against the load)
+
+		Returns:
+			inverse(ndarray): Reciprocal of the Erlang B blocking probability
+		"""
+		servers = np.asarray(servers,dtype=np.int64)
+		load, servers = np.broadcast_arrays(self.load,servers)
+
+		if servers.size and servers.min() < 0:
+			raise ValueError("number of servers must be non negative")
+
+		inverse = np.ones(load.shape)
+		result = np.ones(load.shape)
+		maxServers = int(servers.max()) if servers.size else 0
+
+		with np.errstate(divide="ignore",invalid="ignore",over="ignore"):
+			for n in range(1,maxServers + 1):
+				"""
+				1/B(n) = 1 + (n/A) 1/B(n-1), B(0) = 1
+				"""
+				inverse = 1 + (n / load) * inverse
+
+				hit = servers == n
+				if hit.any():
+					result[hit] = inverse[hit]
+
+		#Without traffic nothing is ever blocked
+		result[load == 0] = np.inf
+		result[servers == 0] = 1.0
+		return result
+
+	def erlang_b(self,servers):
+		"""
+		Method to calculate the blocking probability of a loss system (Erlang B)
+
+		Args:
+			servers(int/array): Number of servers c
+
+		Returns:
+			blocking(float/ndarray): Probability that an arrival finds all servers busy and is lost
+		"""
+		return self._as_output(1.0 / self._inverse_blocking(servers))
+
+	def erlang_c(self,servers):
+		"""
+		Method to calculate the probability that an arrival has to wait (Erlang C)
+
+		Args:
+			servers(int/array): Number of servers c
+
+		Returns:
+			waiting(float/ndarray): Probability of waiting, 1 when the queue is unstable (A ≥ c)
+		"""
+		return self._as_output(self._erlang_c(servers))
+
+	def _erlang_c(self,servers):
+		blocking = 1.0 / self._inverse_blocking(servers)
+		servers = np.asarray(servers,dtype=np.float64)
+
+		with np.errstate(divide="ignore",invalid="ignore"):
+			rho = self.load / servers
+			"""
+					   B(c)
+			C(c) = ------------------
+				1 - ρ (1 - B(c))
+			"""
+			waiting = blocking / (1 - rho * (1 - blocking))
+
+		#The queue grows without bound when the offered load reaches the servers
+		return np.where(rho < 1,waiting,1.0)
+
+	def calculate_utilization(self,servers):
+		"""
+		Method to calculate the server utilization
+
+		Args:
+			servers(int/array): Number of servers c
+
+		Returns:
+			utilization(float/ndarray): ρ = A/c
+		"""
+		return self._as_output(self.load / np.asarray(servers,dtype=np.float64))
+
+	def calculate_waiting_cdf(self,servers,t):
+		"""
+		Method to calculate the probability that the waiting time is at most t
+
+		Args:
+			servers(int/array): Number of servers c
+			t(float/array): Waiting time threshold
+
+		Returns:
+			cdf(float/ndarray): P(W ≤ t) = 1 - C(c) e^(-(c-A) t / E[S])
+		"""
+		waiting = self._erlang_c(servers)
+		servers = np.asarray(servers,dtype=np.float64)
+		decay = np.exp(-(servers - self.load) * np.asarray(t,dtype=np.float64) / self.serviceTime)
+
+		cdf = np.where(self.load < servers,1 - waiting * decay,0.0)
+		return self._as_output(cdf)
+
+	def calculate_service_level(self,servers,targetTime):
+		"""
+		Method to calculate the service level (share of arrivals answered within targetTime)
+
+		Args:
+			servers(int/array): Number of servers c
+			targetTime(float/array): Target answer time
+
+		Returns:
+			serviceLevel(float/ndarray): P(W ≤ targetTime)
+		"""
+		return self.calculate_waiting_cdf(servers,targetTime)
+
+	def calculate_average_wait(self,servers):
+		"""
+		Method to calculate the mean waiting time in queue (average speed of answer)
+
+		Args:
+			servers(int/array): Number of servers c
+
+		Returns:
+			wait(float/ndarray): E[W] = C(c) E[S] / (c - A), ∞ when A ≥ c
+		"""
+		waiting = self._erlang_c(servers)
+		servers = np.asarray(servers,dtype=np.float64)
+
+		with np.errstate(divide="ignore",invalid="ignore"):
+			wait = waiting * self.serviceTime / (servers - self.load)
+		return self._as_output(np.where(self.load < servers,wait,np.inf))
+
+	def calculate_queue_length(self,servers):
+		"""
+		Method to calculate the mean number of arrivals waiting in queue
+
+		Args:
+			servers(int/array): Number of servers c
+
+		Returns:
+			length(float/ndarray): Lq = C(c) A / (c - A), ∞ when A ≥ c
+		"""
+		waiting = self._erlang_c(servers)
+		servers = np.asarray(servers,dtype=np.float64)
+
+		with np.errstate(divide="ignore",invalid="ignore"):
+			length = waiting * self.load / (servers - self.load)
+		return self._as_output(np.where(self.load < servers,length,np.inf))
+
+	def waiting_distribution(self,servers):
+		"""
+		Method to return the distribution of the waiting time of arrivals that have to wait
+
+		Args:
+			servers(int): Number of servers c (single scenario only)
+
+		Returns:
+			result(exponential distribution): Exponential instance with rate (c-A)/E[S]
+
+		Raises:
+			ValueError(string): Raised when the queue is unstable or several scenarios are held
+		"""
+		if np.ndim(self.load) != 0:
+			raise ValueError("waiting distribution is only defined for a single arrival rate")
+		if self.load >= servers:
+			raise ValueError("queue is unstable, offered load must be below the number of servers")
+
+		return Exponential((servers - float(self.load)) / self.serviceTime)
+
+	def required_servers(self,serviceLevel=0.8,targetTime=None,maxWait=None,maxServers=None):
+		"""
+		Method to calculate the least number of servers meeting a service level agreement
+
+		Args:
+			serviceLevel(float): Required P(W ≤ targetTime), or required P(no wait) when targetTime is None
+			targetTime(float): Target answer time, in the time unit of the service distribution
+			maxWait(float): Optional bound on the average waiting time E[W]
+			maxServers(int): Optional upper limit on the search (unmet scenarios report -1)
+
+		Returns:
+			servers(int/ndarray): Least c satisfying every given constraint for each scenario
+		"""
+		load = np.atleast_1d(self.load).astype(np.float64).ravel()
+		if maxServers is None:
+			#The square root staffing rule needs far fewer servers than this
+			maxServers = int(np.ceil(load.max() + 10 * np.sqrt(load.max()) + 50)) if load.size else 0
+
+		result = np.full(load.shape,-1,dtype=np.int64)
+		t = 0.0 if targetTime is None else float(targetTime)
+
+		#The recurrence runs on the unsolved scenarios only, sorted by load, scenario[i] being the position of pending[i]
+		scenario = np.argsort(load,kind="stable")
+		pending = load[scenario]
+		inverse = np.ones(pending.shape)
+		scratch = np.empty(pending.shape)
+		active = np.ones(pending.shape,dtype=bool)
+		remaining = pending.size
+		#Rows before start are solved, so the unsolved stable ones lie in [start,stop)
+		start = 0
+
+		with np.errstate(divide="ignore",invalid="ignore",over="ignore"):
+			for n in range(1,maxServers + 1):
+				if remaining == 0:
+					break
+				"""
+				1/B(n) = 1 + (n/A) 1/B(n-1), in place
+				"""
+				np.divide(n,pending,out=scratch)
+				scratch *= inverse
+				scratch += 1
+				inverse, scratch = scratch, inverse
+
+				#Only stable scenarios (A < n) that are still unsolved need to be checked
+				stop = int(np.searchsorted(pending,n,side="left"))
+				while start < stop and not active[start]:
+					start += 1
+				check = np.flatnonzero(active[start:stop]) + start
+				if not check.size:
+					continue
+
+				a = pending[check]
+				blocking = 1.0 / inverse[check]
+				waiting = blocking / (1 - (a / n) * (1 - blocking))
+				ok = 1 - waiting * np.exp(-(n - a) * t / self.serviceTime) >= serviceLevel
+				if maxWait is not None:
+					ok &= waiting * self.serviceTime / (n - a) <= maxWait
+
+				index = check[ok]
+				result[scenario[index]] = n
+				active[index] = False
+				remaining -= index.size
+
+				#Compacted once half the rows are solved, so every scenario is copied O(log) times
+				if 0 < remaining <= active.size // 2:
+					scenario, pending, inverse = scenario[active], pending[active], inverse[active]
+					scratch = np.empty(remaining)
+					active = np.ones(remaining,dtype=bool)
+					start = 0
+
+		#Scenarios without any traffic need no server at all
+		result[load == 0] = 0
+		if np.ndim(self.load) == 0:
+			return int(result[0])
+		return result.reshape(np.shape(self.load))
+
+	def required_servers_blocking(self,maxBlocking=0.01,maxServers=None):
+		"""
+		Method to calculate the least number of servers of a loss system for a blocking target
+
+		Args:
+			maxBlocking(float): Largest acceptable Erlang B blocking probability
+			maxServers(int): Optional upper limit on the search (unmet scenarios report -1)
+
+		Returns:
+			servers(int/ndarray): Least c with B(c) ≤ maxBlocking for each scenario
+		"""
+		load = np.atleast_1d(self.load).astype(np.float64).ravel()
+		if maxServers is None:
+			maxServers = int(np.ceil(load.max() + 10 * np.sqrt(load.max()) + 50)) if load.size else 0
+
+		result = np.full(load.shape,-1,dtype=np.int64)
+		result[load == 0] = 0
+		threshold = 1.0 / maxBlocking
+
+		#As in required_servers, the recurrence runs on the unsolved scenarios only
+		scenario = np.flatnonzero(load > 0)
+		pending = load[scenario]
+		inverse = np.ones(pending.shape)
+		scratch = np.empty(pending.shape)
+		active = np.ones(pending.shape,dtype=bool)
+		remaining = pending.size
+
+		with np.errstate(divide="ignore",over="ignore"):
+			for n in range(1,maxServers + 1):
+				if remaining == 0:
+					break
+				np.divide(n,pending,out=scratch)
+				scratch *= inverse
+				scratch += 1
+				inverse, scratch = scratch, inverse
+
+				#B(n) ≤ maxBlocking  ⇔  1/B(n) ≥ 1/maxBlocking
+				done = active & (inverse >= threshold)
+				result[scenario[done]] = n
+				active &= ~done
+				remaining -= int(np.count_nonzero(done))
+
+				if 0 < remaining <= active.size // 2:
+					scenario, pending, inverse = scenario[active], pending[active], inverse[active]
+					scratch = np.empty(remaining)
+					active = np.ones(remaining,dtype=bool)
+
+		if np.ndim(self.load) == 0:
+			return int(result[0])
+		return result.reshape(np.shape(self.load))
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the erlang queue instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the queue
+		"""
+		return "Arrival Rate: {}, Mean Service Time: {}, Offered Load: {}".format(self.lamda,self.serviceTime,self.load)
@@ -6,7 +6,8 @@ Reciprocal Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
 
 class Reciprocal(Distribution):
 	"""
@@ -111,30 +112,59 @@ class Reciprocal(Distribution):
 		Method to calculate probability density function for reciprocal distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for reciprocal distribution
-
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			pdf(float/ndarray): Probability density function for reciprocal distribution, 0 outside [a,b]
 		"""
-		try:
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			return 1 / (x * math.log(self.b / self.a)) if self.a <= x <= self.b else 0.0
+		def kernel(x):
 			"""
 					1
 			f(x;a,b) = -----------, for a ≤ x ≤ b and, a > 0
 				    x ln(b/a)
 			"""
-			return 1 / (x * math.log(float(self.b / self.a)))
+			with np.errstate(divide="ignore"):
+				return np.where((x >= self.a) & (x <= self.b),1 / (x * math.log(self.b / self.a)),0.0)
+		return _blockwise(kernel,x)
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for reciprocal distribution
+        
+		Args:
+			x(float/array): Random variable
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for reciprocal distribution
+		"""
+		if isinstance(x,(int,float)):
+			x = min(max(x,self.a),self.b)
+			return math.log(x / self.a) / math.log(self.b / self.a)
+		def kernel(x):
+			#F(x;a,b) = ln(x/a) / ln(b/a), x clipped to [a,b]
+			x = np.clip(x,self.a,self.b)
+			return np.log(x / self.a) / math.log(self.b / self.a)
+		return _blockwise(kernel,x)
+
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for reciprocal distribution
+        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			return self.a * math.exp(q * math.log(self.b / self.a)) if 0 <= q <= 1 else math.nan
+		def kernel(q):
+			#Q(q;a,b) = a (b/a)^q
+			return np.where((q >= 0) & (q <= 1),self.a * np.exp(q * math.log(self.b / self.a)),np.nan)
+		return _blockwise(kernel,q)
 
 	def __repr__(self):
 		"""
@@ -0,0 +1,333 @@
+"""
+Sequential Testing
+(Sequential probability ratio tests for Bernoulli and Binomial streams)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import numpy as np
+from .specialFunctions import log_beta	#Import specialFunctions.py module
+
+def _probability(value):
+	"""
+	Function to read a success probability from a float or a Bernoulli/Binomial instance
+
+	Args:
+		value(float/distribution): Probability or instance holding it in p
+
+	Returns:
+		p(float): Success probability
+	"""
+	return float(getattr(value,"p",value))
+
+def _distinct(streams,total):
+	"""
+	Function to list the distinct streams of a batch in ascending order
+
+	Args:
+		streams(ndarray): Stream of each event
+		total(int): Number of streams held by the test
+
+	Returns:
+		distinct(ndarray): Distinct stream indices
+	"""
+	#Large batches are cheaper to mark in a flag array than to sort
+	if 8 * streams.size >= total:
+		flags = np.zeros(total,dtype=bool)
+		flags[streams] = True
+		return np.flatnonzero(flags)
+	return np.unique(streams)
+
+class SPRT:
+	"""
+	SPRT class for running Wald's sequential probability ratio test on many bernoulli streams
+	Every stream keeps one running log-likelihood ratio, updated in O(1) per event
+
+	Notation:
+		H0: p = p0 against H1: p = p1
+		Λn = Σ log(f1(x)/f0(x)), A = log((1-β)/α), B = log(β/(1-α))
+
+	Attributes:
+		1. p0, p1 (success probabilities under H0 and H1)
+		2. alpha, beta (type I and type II error rates)
+		3. llr (log-likelihood ratio of every stream)
+		4. samples (number of events seen by every stream)
+		5. decision (1 accepts H1, -1 accepts H0, 0 continues sampling)
+	"""
+	def __init__(self,null=0.01,alternative=0.02,alpha=0.05,beta=0.2,streams=1):
+		self.p0 = _probability(null)
+		self.p1 = _probability(alternative)
+		self.alpha = alpha
+		self.beta = beta
+		self.streams = int(streams)
+
+		if not (0 < self.p0 < 1 and 0 < self.p1 < 1) or self.p0 == self.p1:
+			raise ValueError("p0 and p1 must be distinct probabilities in (0,1)")
+
+		#Increments of the log-likelihood ratio for a success and a failure
+		self.successStep = math.log(self.p1 / self.p0)
+		self.failureStep = math.log((1 - self.p1) / (1 - self.p0))
+
+		#Wald's boundaries
+		self.upper = math.log((1 - beta) / alpha)
+		self.lower = math.log(beta / (1 - alpha))
+
+		self.reset()
+
+	def reset(self,streams=None):
+		"""
+		Method to restart the test on some (or all) streams
+
+		Args:
+			streams(int/array): Streams to restart, all streams when None
+
+		Returns:
+			No return value
+		"""
+		if streams is None:
+			self.llr = np.zeros(self.streams)
+			self.samples = np.zeros(self.streams,dtype=np.int64)
+			self.decision = np.zeros(self.streams,dtype=np.int8)
+		else:
+			self.llr[streams] = 0.0
+			self.samples[streams] = 0
+			self.decision[streams] = 0
+
+	def _decide(self,streams):
+		"""
+		Method to compare the log-likelihood ratio of the given streams with the boundaries
+
+		Args:
+			streams(ndarray): Streams that received events
+
+		Returns:
+			No return value
+		"""
+		llr = self.llr[streams]
+		self.decision[streams] = np.where(llr >= self.upper,1,np.where(llr <= self.lower,-1,0))
+
+	def update(self,streams,outcomes):
+		"""
+		Method to add bernoulli events, one (stream, outcome) pair per event
+
+		Args:
+			streams(int/array): Stream of each event
+			outcomes(int/array): 1 for a success and 0 for a failure
+
+		Returns:
+			decision(ndarray): Decision of the streams that received events
+		"""
+		streams = np.atleast_1d(np.asarray(streams,dtype=np.int64))
+		outcomes = np.atleast_1d(np.asarray(outcomes))
+		return self.update_counts(streams,outcomes,np.ones(outcomes.shape,dtype=np.int64))
+
+	def update_counts(self,streams,successes,trials):
+		"""
+		Method to add binomial batches of events, one (stream, successes, trials) triple per batch
+
+		Args:
+			streams(int/array): Stream of each batch
+			successes(int/array): Number of successes in each batch
+			trials(int/array): Number of trials in each batch
+
+		Returns:
+			decision(ndarray): Decision of the streams that received events
+		"""
+		streams = np.atleast_1d(np.asarray(streams,dtype=np.int64))
+		successes = np.atleast_1d(np.asarray(successes,dtype=np.float64))
+		trials = np.atleast_1d(np.asarray(trials,dtype=np.int64))
+
+		#Streams that already reached a decision stop sampling
+		pending = self.decision[streams] == 0
+		streams, successes, trials = streams[pending], successes[pending], trials[pending]
+
+		"""
+		Λ += S log(p1/p0) + (n - S) log((1-p1)/(1-p0))
+		"""
+		step = successes * self.successStep + (trials - successes) * self.failureStep
+		np.add.at(self.llr,streams,step)
+		np.add.at(self.samples,streams,trials)
+
+		touched = _distinct(streams,self.streams)
+		self._decide(touched)
+		return self.decision[touched]
+
+	def expected_sample_size(self):
+		"""
+		Method to calculate Wald's approximation of the average sample number under H0 and H1
+
+		Args:
+			none
+
+		Returns:
+			sizes(tuple): Expected number of events before a decision under H0 and under H1
+		"""
+		"""
+		E[z] = p log(p1/p0) + (1-p) log((1-p1)/(1-p0))
+			  (1-α) B + α A			 β B + (1-β) A
+		E0[N] = ----------------,	E1[N] = ----------------
+			     E0[z]				 E1[z]
+		"""
+		driftNull = self.p0 * self.successStep + (1 - self.p0) * self.failureStep
+		driftAlternative = self.p1 * self.successStep + (1 - self.p1) * self.failureStep
+
+		sizeNull = ((1 - self.alpha) * self.lower + self.alpha * self.upper) / driftNull
+		sizeAlternative = (self.beta * self.lower + (1 - self.beta) * self.upper) / driftAlternative
+		return sizeNull, sizeAlternative
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the SPRT instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the test
+		"""
+		return "p0: {}, p1: {}, α: {}, β: {}, Streams: {}, Accepted H1: {}, Accepted H0: {}".format(self.p0,self.p1,self.alpha,self.beta,self.streams,int((self.decision == 1).sum()),int((self.decision == -1).sum()))
+
+class MixtureSPRT:
+	"""
+	Mixture SPRT class for always valid testing of H0: p = p0 on many bernoulli streams
+	The alternative is a Beta(a,b) mixture over p, so no single effect size has to be chosen
+
+	Notation:
+		Λn = B(a+S, b+n-S) / (B(a,b) p0^S (1-p0)^(n-S)), reject H0 when Λn ≥ 1/α
+
+	Attributes:
+		1. p0 (success probability under H0)
+		2. alpha (type I error rate)
+		3. priorAlpha, priorBeta (mixing Beta distribution)
+		4. successes, samples (running counts of every stream)
+		5. llr (log mixture likelihood ratio of every stream)
+		6. pvalue (always valid p-value of every stream)
+		7. decision (1 rejects H0, 0 continues sampling)
+	"""
+	def __init__(self,null=0.01,alpha=0.05,priorAlpha=1,priorBeta=1,streams=1):
+		self.p0 = _probability(null)
+		self.alpha = alpha
+		self.priorAlpha = priorAlpha
+		self.priorBeta = priorBeta
+		self.streams = int(streams)
+
+		if not 0 < self.p0 < 1:
+			raise ValueError("p0 must be a probability in (0,1)")
+
+		self.upper = math.log(1 / alpha)
+		self.logPrior = log_beta(priorAlpha,priorBeta)
+		self.reset()
+
+	def reset(self,streams=None):
+		"""
+		Method to restart the test on some (or all) streams
+
+		Args:
+			streams(int/array): Streams to restart, all streams when None
+
+		Returns:
+			No return value
+		"""
+		if streams is None:
+			self.successes = np.zeros(self.streams)
+			self.samples = np.zeros(self.streams)
+			self.llr = np.zeros(self.streams)
+			self.pvalue = np.ones(self.streams)
+			self.decision = np.zeros(self.streams,dtype=np.int8)
+		else:
+			self.successes[streams] = 0.0
+			self.samples[streams] = 0.0
+			self.llr[streams] = 0.0
+			self.pvalue[streams] = 1.0
+			self.decision[streams] = 0
+
+	def update(self,streams,outcomes):
+		"""
+		Method to add bernoulli events, one (stream, outcome) pair per event
+
+		Args:
+			streams(int/array): Stream of each event
+			outcomes(int/array): 1 for a success and 0 for a failure
+
+		Returns:
+			decision(ndarray): Decision of the streams that received events
+		"""
+		outcomes = np.atleast_1d(np.asarray(outcomes,dtype=np.float64))
+		return self.update_counts(streams,outcomes,np.ones(outcomes.shape))
+
+	def update_counts(self,streams,successes,trials):
+		"""
+		Method to add binomial batches of events, one (stream, successes, trials) triple per batch
+
+		Args:
+			streams(int/array): Stream of each batch
+			successes(int/array): Number of successes in each batch
+			trials(int/array): Number of trials in each batch
+
+		Returns:
+			decision(ndarray): Decision of the streams that received events
+		"""
+		streams = np.atleast_1d(np.asarray(streams,dtype=np.int64))
+		successes = np.atleast_1d(np.asarray(successes,dtype=np.float64))
+		trials = np.atleast_1d(np.asarray(trials,dtype=np.float64))
+
+		#Streams that already rejected H0 stop sampling
+		pending = self.decision[streams] == 0
+		streams, successes, trials = streams[pending], successes[pending], trials[pending]
+		np.add.at(self.successes,streams,successes)
+		np.add.at(self.samples,streams,trials)
+
+		touched = _distinct(streams,self.streams)
+		s = self.successes[touched]
+		failures = self.samples[touched] - s
+		"""
+		log Λ = log B(a+S, b+n-S) - log B(a,b) - S log p0 - (n-S) log(1-p0)
+		"""
+		llr = np.asarray(log_beta(self.priorAlpha + s,self.priorBeta + failures)) - self.logPrior - s * math.log(self.p0) - failures * math.log1p(-self.p0)
+		self.llr[touched] = llr
+
+		#The always valid p-value never increases
+		self.pvalue[touched] = np.minimum(self.pvalue[touched],np.exp(-np.maximum(llr,0)))
+		self.decision[touched] = llr >= self.upper
+		return self.decision[touched]
+
+	def expected_sample_size(self,trueProb):
+		"""
+		Method to approximate the expected number of events to reject H0 when p = trueProb
+
+		Args:
+			trueProb(float/distribution): Success probability generating the stream
+
+		Returns:
+			size(float): Approximate expected sample size (∞ when trueProb = p0)
+		"""
+		p = _probability(trueProb)
+		"""
+		Laplace approximation of the mixture,
+		log Λn ≈ n KL(p||p0) + log π(p) + (1/2) log(2π p(1-p)) - (1/2) log n
+		solved for log Λn = log(1/α)
+		"""
+		divergence = p * math.log(p / self.p0) + (1 - p) * math.log((1 - p) / (1 - self.p0))
+		if divergence <= 0:
+			return float("inf")
+
+		logPrior = (self.priorAlpha - 1) * math.log(p) + (self.priorBeta - 1) * math.log1p(-p) - self.logPrior
+		constant = logPrior + 0.5 * math.log(2 * math.pi * p * (1 - p))
+
+		size = max(self.upper / divergence,1.0)
+		for i in range(50):
+			size = max((self.upper - constant + 0.5 * math.log(size)) / divergence,1.0)
+		return size
+
+	def __repr__(self):
+		"""
+		Method to output the characteristics of the mixture SPRT instance
+
+		Args:
+			none
+
+		Returns:
+			output(string): Characteristics of the test
+		"""
+		return "p0: {}, α: {}, Prior: Beta({}, {}), Streams: {}, Rejected H0: {}".format(self.p0,self.alpha,self.priorAlpha,self.priorBeta,self.streams,int(self.decision.sum()))
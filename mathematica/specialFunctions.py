@@ -0,0 +1,286 @@
+"""
+Special Functions
+(Vectorized gamma, beta, incomplete beta and error functions)
+"""
+# Author: Ashwin Raj <rajashwin733@gmail.com>
+# License: GNU General Public License v3.0
+
+import math
+import numpy as np
+
+#Coefficients of the Stirling series, B(2k) / (2k (2k-1))
+STIRLING_COEFFICIENTS = (1 / 12, -1 / 360, 1 / 1260, -1 / 1680, 1 / 1188, -691 / 360360)
+HALF_LOG_TWO_PI = 0.5 * math.log(2 * math.pi)
+#Coefficients of the asymptotic series of the digamma and trigamma functions, B(2k) / 2k and B(2k)
+DIGAMMA_COEFFICIENTS = (1 / 12, -1 / 120, 1 / 252, -1 / 240, 1 / 132, -691 / 32760)
+TRIGAMMA_COEFFICIENTS = (1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730)
+
+def _as_output(value):
+	"""
+	Function to return a python float for 0-d results and the array otherwise
+
+	Args:
+		value(ndarray): Result of a vectorized computation
+
+	Returns:
+		value(float/ndarray): Float for 0-d results, array otherwise
+	"""
+	if np.ndim(value) == 0:
+		return float(value)
+	return value
+
+def log_gamma(x):
+	"""
+	Function to calculate the natural logarithm of the gamma function for x > 0
+
+	Args:
+		x(float/array): Positive arguments
+
+	Returns:
+		lgamma(float/ndarray): ln Γ(x)
+	"""
+	x = np.array(x,dtype=np.float64)
+	shift = np.zeros_like(x)
+	z = x.copy()
+
+	#Raise small arguments above 15 with Γ(z+1) = z Γ(z), where the series is exact to double precision
+	small = z < 15
+	while small.any():
+		shift[small] += np.log(z[small])
+		z[small] += 1
+		small = z < 15
+
+	"""
+	ln Γ(z) = (z - 1/2) ln z - z + ln √(2π) + Σ B(2k) / (2k (2k-1) z^(2k-1))
+	"""
+	inverse = 1 / z
+	inverseSquared = inverse * inverse
+	series = np.zeros_like(z)
+	for coefficient in reversed(STIRLING_COEFFICIENTS):
+		series = series * inverseSquared + coefficient
+	series *= inverse
+
+	result = (z - 0.5) * np.log(z) - z + HALF_LOG_TWO_PI + series - shift
+	return _as_output(result)
+
+#Elementwise math.erf, exact to double precision
+_ERF = np.frompyfunc(math.erf,1,1)
+
+def erf(x):
+	"""
+	Function to calculate the error function elementwise
+
+	Args:
+		x(float/array): Arguments
+
+	Returns:
+		erf(float/ndarray): erf(x) = 2/√π ∫[0,x] e^(-t²) dt
+
+	Notes:
+		This is not a vectorized kernel: np.frompyfunc calls math.erf once per element in a
+		Python loop over an object array, costing about as much as a list comprehension.
+	"""
+	return _as_output(np.asarray(_ERF(np.asarray(x,dtype=np.float64)),dtype=np.float64))
+
+#Elementwise math.erfc, keeps its relative accuracy in the upper tail
+_ERFC = np.frompyfunc(math.erfc,1,1)
+
+def erfc(x):
+	"""
+	Function to calculate the complementary error function elementwise
+
+	Args:
+		x(float/array): Arguments
+
+	Returns:
+		erfc(float/ndarray): erfc(x) = 1 - erf(x)
+
+	Notes:
+		Like erf, a Python loop of math.erfc calls through np.frompyfunc over an object array,
+		not a vectorized kernel.
+	"""
+	return _as_output(np.asarray(_ERFC(np.asarray(x,dtype=np.float64)),dtype=np.float64))
+
+def log_beta(a,b):
+	"""
+	Function to calculate the natural logarithm of the beta function
+
+	Args:
+		a(float/array): First shape parameter, a > 0
+		b(float/array): Second shape parameter, b > 0
+
+	Returns:
+		lbeta(float/ndarray): ln B(a,b) = ln Γ(a) + ln Γ(b) - ln Γ(a+b)
+	"""
+	a = np.asarray(a,dtype=np.float64)
+	b = np.asarray(b,dtype=np.float64)
+	return _as_output(np.asarray(log_gamma(a)) + np.asarray(log_gamma(b)) - np.asarray(log_gamma(a + b)))
+
+def _shifted(x):
+	"""
+	Function to raise arguments above 15 with unit steps, keeping the steps taken
+
+	Args:
+		x(float/array): Positive arguments
+
+	Returns:
+		z(ndarray): Shifted arguments, z ≥ 15
+		steps(list): Arguments and masks of every step, as (z, mask) pairs
+	"""
+	z = np.array(x,dtype=np.float64)
+	steps = []
+	small = z < 15
+	while small.any():
+		steps.append((z.copy(),small))
+		z[small] += 1
+		small = z < 15
+	return z, steps
+
+def digamma(x):
+	"""
+	Function to calculate the digamma function ψ(x) = d/dx ln Γ(x) for x > 0
+
+	Args:
+		x(float/array): Positive arguments
+
+	Returns:
+		psi(float/ndarray): ψ(x)
+	"""
+	z, steps = _shifted(x)
+	correction = np.zeros_like(z)
+	for value, small in steps:
+		correction[small] += 1 / value[small]
+	"""
+	ψ(z) = ln z - 1/(2z) - Σ B(2k) / (2k z^(2k)), with ψ(z) = ψ(z+1) - 1/z
+	"""
+	inverseSquared = 1 / (z * z)
+	series = np.zeros_like(z)
+	for coefficient in reversed(DIGAMMA_COEFFICIENTS):
+		series = series * inverseSquared + coefficient
+	result = np.log(z) - 0.5 / z - series * inverseSquared - correction
+	return _as_output(result)
+
+def trigamma(x):
+	"""
+	Function to calculate the trigamma function ψ'(x) for x > 0
+
+	Args:
+		x(float/array): Positive arguments
+
+	Returns:
+		psi1(float/ndarray): ψ'(x)
+	"""
+	z, steps = _shifted(x)
+	correction = np.zeros_like(z)
+	for value, small in steps:
+		correction[small] += 1 / (value[small] * value[small])
+	"""
+	ψ'(z) = 1/z + 1/(2z^2) + Σ B(2k) / z^(2k+1), with ψ'(z) = ψ'(z+1) + 1/z^2
+	"""
+	inverse = 1 / z
+	inverseSquared = inverse * inverse
+	series = np.zeros_like(z)
+	for coefficient in reversed(TRIGAMMA_COEFFICIENTS):
+		series = series * inverseSquared + coefficient
+	result = inverse + 0.5 * inverseSquared + series * inverseSquared * inverse + correction
+	return _as_output(result)
+
+def _beta_continued_fraction(a,b,x,tolerance=1e-15,maxIterations=10000):
+	"""
+	Function to evaluate the continued fraction of the incomplete beta function (modified Lentz)
+
+	Args:
+		a(ndarray): First shape parameter
+		b(ndarray): Second shape parameter
+		x(ndarray): Points, x < (a+1)/(a+b+2) for fast convergence
+		tolerance(float): Relative convergence tolerance
+		maxIterations(int): Largest number of iterations
+
+	Returns:
+		fraction(ndarray): Value of the continued fraction
+	"""
+	tiny = 1e-300
+	qab = a + b
+	qap = a + 1
+	qam = a - 1
+
+	c = np.ones_like(x)
+	d = 1 - qab * x / qap
+	d[np.abs(d) < tiny] = tiny
+	d = 1 / d
+	fraction = d.copy()
+
+	#Converged entries are dropped, so the cost follows the slowest entries only
+	active = np.arange(x.size)
+	for m in range(1,maxIterations + 1):
+		if active.size == 0:
+			break
+		aa, bb, xx = a[active], b[active], x[active]
+		cc, dd = c[active], d[active]
+		m2 = 2 * m
+
+		#Even step of the recurrence
+		numerator = m * (bb - m) * xx / ((qam[active] + m2) * (aa + m2))
+		dd = 1 + numerator * dd
+		dd[np.abs(dd) < tiny] = tiny
+		cc = 1 + numerator / cc
+		cc[np.abs(cc) < tiny] = tiny
+		dd = 1 / dd
+		update = dd * cc
+
+		#Odd step of the recurrence
+		numerator = -(aa + m) * (qab[active] + m) * xx / ((aa + m2) * (qap[active] + m2))
+		dd = 1 + numerator * dd
+		dd[np.abs(dd) < tiny] = tiny
+		cc = 1 + numerator / cc
+		cc[np.abs(cc) < tiny] = tiny
+		dd = 1 / dd
+		delta = dd * cc
+
+		fraction[active] *= update * delta
+		c[active] = cc
+		d[active] = dd
+		active = active[np.abs(delta - 1) > tolerance]
+
+	return fraction
+
+def regularized_incomplete_beta(a,b,x):
+	"""
+	Function to calculate the regularized incomplete beta function for arrays of a, b and x
+
+	Args:
+		a(float/array): First shape parameter, a > 0
+		b(float/array): Second shape parameter, b > 0
+		x(float/array): Upper limit of integration, 0 ≤ x ≤ 1
+
+	Returns:
+		ratio(float/ndarray): I_x(a,b) = B(x;a,b) / B(a,b)
+	"""
+	a, b, x = np.broadcast_arrays(np.asarray(a,dtype=np.float64),np.asarray(b,dtype=np.float64),np.asarray(x,dtype=np.float64))
+	shape = x.shape
+	a, b, x = a.ravel(), b.ravel(), x.ravel()
+	result = np.full(x.shape,np.nan)
+
+	result[x <= 0] = 0.0
+	result[x >= 1] = 1.0
+	inside = (x > 0) & (x < 1) & (a > 0) & (b > 0)
+
+	if inside.any():
+		a, b, x = a[inside], b[inside], x[inside]
+
+		#Use I_x(a,b) = 1 - I_(1-x)(b,a) where the continued fraction converges slowly
+		swap = x > (a + 1) / (a + b + 2)
+		aa = np.where(swap,b,a)
+		bb = np.where(swap,a,b)
+		xx = np.where(swap,1 - x,x)
+
+		"""
+				x^a (1-x)^b
+		I_x(a,b) = -------------- CF(a,b,x)
+				 a B(a,b)
+		"""
+		logFront = aa * np.log(xx) + bb * np.log1p(-xx) - np.asarray(log_beta(aa,bb))
+		value = np.exp(logFront) * _beta_continued_fraction(aa,bb,xx) / aa
+		result[inside] = np.where(swap,1 - value,value)
+
+	return _as_output(result.reshape(shape))
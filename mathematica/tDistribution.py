@@ -6,7 +6,9 @@ T Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .specialFunctions import regularized_incomplete_beta	#Import specialFunctions.py module
 
 class T(Distribution):
 	"""
@@ -118,6 +120,40 @@ class T(Distribution):
 		except ValueError as error:
 			raise
 
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for T distribution
+
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for T distribution
+		"""
+		x = np.asarray(x,dtype=np.float64)
+		"""
+					 1		   v
+		F(x;v) = 1 - --- I_t(v/2, 1/2), t = ---------, for x > 0
+					 2		 v + x^(2)
+		"""
+		tail = 0.5 * np.asarray(regularized_incomplete_beta(self.v / 2,0.5,self.v / (self.v + x ** 2)))
+		cdf = np.where(x > 0,1 - tail,tail)
+		return float(cdf) if cdf.ndim == 0 else cdf
+
+	def sf(self,x):
+		"""
+		Method to calculate survival function (1 - cdf) for T distribution
+
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			sf(float/ndarray): Survival function for T distribution
+		"""
+		x = np.asarray(x,dtype=np.float64)
+		#By symmetry, P(X > x) = P(X < -x)
+		return self.cdf(-x)
+
 	def __repr__(self):
 		"""
 		Method to output the characteristics of the F instance
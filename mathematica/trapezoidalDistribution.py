@@ -5,7 +5,8 @@ Trapezoidal Distribution
 # License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise	#Import generalDistribution.py module
 
 class Trapezoidal(Distribution):
 	"""
@@ -121,57 +122,109 @@ class Trapezoidal(Distribution):
 		Method to calculate probability density function for trapezoidal distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for trapezoidal distribution
+			pdf(float/ndarray): Probability density function for trapezoidal distribution, 0 outside [a,d]
+		"""
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			if not self.a <= x <= self.d:
+				return 0.0
+			if x < self.b:
+				return mu * (x - self.a) / (self.b - self.a)
+			return mu if x <= self.c else mu * (self.d - x) / (self.d - self.c)
+		def kernel(x):
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			"""
+					2
+			μ = ---------, a ≤ b ≤ c ≤ d
+				 d+c-a-b
 
-		Raises:
-			ZeroDivisionError(string): Raised when division by zero
-			ValueError(string): Raised when value error occurs
+			f(x;a,b,c,d) = μ (x-a)/(b-a), a ≤ x < b
+				     = μ, b ≤ x < c
+				     = μ (d-x)/(d-c), c ≤ x ≤ d
+
+			The three pieces are the smallest of the two ramps and 1, and negative outside [a,d].
+			fmin skips the 0/0 of a ramp with zero width, fmax turns a nan input into 0
+			""" 
+			with np.errstate(divide="ignore",invalid="ignore"):
+				rising = (x - self.a) / (self.b - self.a)
+				falling = (self.d - x) / (self.d - self.c)
+			return mu * np.fmax(np.minimum(np.fmin(rising,falling),1.0),0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
 		"""
-		mu = 2 / (self.d + self.c - self.a - self.b)
+		Method to calculate cumulative distribution function for trapezoidal distribution
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for trapezoidal distribution
 		"""
-				2
-		μ = ---------, a ≤ b ≤ c ≤ d
-			 d+c-a-b
-		""" 
-		try:
-			if(self.a <= x and self.b > x):
-				"""
-						  x-a
-				f(x;a,b,c,d) = μ -----, a ≤ x < b
-						  b-a
-				"""
-				pdf = mu * ((x - self.a) / (self.b - self.a))
-
-			elif(self.b <= x and self.c > x):
-				"""
-				f(x;a,b,c,d) = μ, b ≤ x < c
-				"""
-				pdf = mu
-
-			elif(self.c <= x and self.d >= x):
-				"""
-						  d-a
-				f(x;a,b,c,d) = μ -----, c ≤ x < d
-						  d-c
-				"""
-				pdf = mu * ((self.d - x) / (self.d - self.c))
-
-			else:
-				#Value of pdf is undefined for x > d
-				pdf = "Undefined"
-
-			return pdf
+		if isinstance(x,(int,float)):
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			cdf = 2 * (min(max(x,self.b),self.c) - self.b)
+			if self.b > self.a:
+				cdf += (min(max(x,self.a),self.b) - self.a) ** 2 / (self.b - self.a)
+			if self.d > self.c:
+				cdf += (self.d - self.c) - (self.d - min(max(x,self.c),self.d)) ** 2 / (self.d - self.c)
+			return cdf * mu / 2
+		def kernel(x):
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			"""
+			F(x) = μ/2 [(x₁-a)²/(b-a) + 2(x₂-b) + ((d-c)² - (d-x₃)²)/(d-c)]
 
-		#If division by zero occurs, raise an error
-		except ZeroDivisionError as error:	
-			raise
+			where x₁, x₂ and x₃ are x clipped to [a,b], [b,c] and [c,d]
+			"""
+			cdf = 2 * (np.clip(x,self.b,self.c) - self.b)
+			if self.b > self.a:
+				cdf += (np.clip(x,self.a,self.b) - self.a) ** 2 / (self.b - self.a)
+			if self.d > self.c:
+				cdf += (self.d - self.c) - (self.d - np.clip(x,self.c,self.d)) ** 2 / (self.d - self.c)
+			cdf *= mu / 2
+			return cdf
+		return _blockwise(kernel,x)
+
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for trapezoidal distribution
+        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
 
-		#If value error occurs, raise an error
-		except ValueError as error:
-			raise
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			if not 0 <= q <= 1:
+				return math.nan
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			if q < mu * (self.b - self.a) / 2:
+				return self.a + math.sqrt(2 * q * (self.b - self.a) / mu)
+			if q > 1 - mu * (self.d - self.c) / 2:
+				return self.d - math.sqrt(2 * (1 - q) * (self.d - self.c) / mu)
+			return q / mu + (self.a + self.b) / 2
+		def kernel(q):
+			mu = 2 / (self.d + self.c - self.a - self.b)
+			#Probabilities at the ends of the level
+			lower = mu * (self.b - self.a) / 2
+			upper = 1 - mu * (self.d - self.c) / 2
+			"""
+			Q(q) = a + √(2q(b-a)/μ), q < F(b)
+			     = q/μ + (a+b)/2, F(b) ≤ q ≤ F(c)
+			     = d - √(2(1-q)(d-c)/μ), q > F(c)
+			"""
+			#One square root serves both ramps
+			below = q < lower
+			with np.errstate(invalid="ignore"):
+				root = np.sqrt(np.where(below,q * (self.b - self.a),(1 - q) * (self.d - self.c)) * (2 / mu))
+			ppf = np.where(below,self.a + root,np.where(q > upper,self.d - root,q / mu + (self.a + self.b) / 2))
+			return np.where((q >= 0) & (q <= 1),ppf,np.nan)
+		return _blockwise(kernel,q)
 
 	def __repr__(self):
 		"""
@@ -6,7 +6,8 @@ Uniform Distribution
 #License: GNU General Public License v3.0
 
 import math
-from .generalDistribution import Distribution 	#Import generalDistribution.py module
+import numpy as np
+from .generalDistribution import Distribution, _blockwise 	#Import generalDistribution.py module
 
 class Uniform(Distribution):
 	"""
@@ -95,23 +96,56 @@ class Uniform(Distribution):
 		Method to calculate probability density function for uniform distribution
         
 		Args:
-			x(float): Random variable
+			x(float/array): Random variable
 
 		Returns:
-			pdf(float): Probability density function for uniform distribution
+			pdf(float/ndarray): Probability density function for uniform distribution, 0 outside [a,b]
 		"""
-		#For random variable ranging between a and b
-		if(x < self.a or x > self.b):
-			return 0
-
-		#Otherwise
-		else:
+		if isinstance(x,(int,float)):
+			#Scalars take the math path, the numpy kernel costs microseconds per call
+			return 1 / (self.b - self.a) if self.a <= x <= self.b else 0.0
+		def kernel(x):
 			"""
 				      1
-			f(x;a,b) = -------
+			f(x;a,b) = -------, a ≤ x ≤ b
 				    b - a
 			"""
-			return 1 / (self.b - self.a)
+			return np.where((x >= self.a) & (x <= self.b),1 / (self.b - self.a),0.0)
+		return _blockwise(kernel,x)
+
+	def cdf(self,x):
+		"""
+		Method to calculate cumulative distribution function for uniform distribution
+        
+		Args:
+			x(float/array): Random variable
+
+		Returns:
+			cdf(float/ndarray): Cumulative distribution function for uniform distribution
+		"""
+		if isinstance(x,(int,float)):
+			return min(max((x - self.a) / (self.b - self.a),0.0),1.0)
+		def kernel(x):
+			#F(x;a,b) = (x-a)/(b-a), clipped to [0,1] outside the support
+			return np.clip((x - self.a) / (self.b - self.a),0.0,1.0)
+		return _blockwise(kernel,x)
+
+	def ppf(self,q):
+		"""
+		Method to calculate the quantile function (inverse cdf) for uniform distribution
+        
+		Args:
+			q(float/array): Probabilities, 0 ≤ q ≤ 1
+
+		Returns:
+			ppf(float/ndarray): Quantiles, nan for q outside [0,1]
+		"""
+		if isinstance(q,(int,float)):
+			return self.a + q * (self.b - self.a) if 0 <= q <= 1 else math.nan
+		def kernel(q):
+			#Q(q;a,b) = a + q(b-a)
+			return np.where((q >= 0) & (q <= 1),self.a + q * (self.b - self.a),np.nan)
+		return _blockwise(kernel,q)
 
 	def __add__(self,other):
 		"""
@@ -6,7 +6,9 @@ Weibull Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .precision import get_dtype	#Import precision.py module
 
 class Weibull(Distribution):
 	"""
@@ -143,6 +145,21 @@ class Weibull(Distribution):
 		except ValueError as error:
 			raise
 
+	def sample(self,size=1,seed=None):
+		"""
+		Method to draw random variates from the weibull distribution, in the dtype of the precision policy
+
+		Args:
+			size(int/tuple): Number (or shape) of variates to draw
+			seed(int/Generator): Seed or numpy random generator, for reproducible draws
+
+		Returns:
+			samples(ndarray): Array of weibull random variates
+		"""
+		rng = np.random.default_rng(seed)
+		#Scale the standard weibull variates, X = λ E^(1/k) for a standard exponential E
+		return float(self.lamda) * rng.standard_exponential(size,dtype=get_dtype()) ** (1.0 / float(self.k))
+
 	def __repr__(self):
 		"""
 		Method to output the characteristics of the weibull instance
@@ -6,7 +6,9 @@ Yule Simon Distribution
 # License: GNU General Public License v3.0
 
 import math
+import numpy as np
 from .generalDistribution import Distribution	#Import generalDistribution.py module
+from .specialFunctions import digamma, log_gamma, trigamma	#Import specialFunctions.py module
 
 class YuleSimon(Distribution):
 	"""
@@ -82,6 +84,65 @@ class YuleSimon(Distribution):
 			self.stdev = "Undefined"
 		return self.stdev
 
+	def replace_stats_with_counts(self,values=None,counts=None,tolerance=1e-12,maxIterations=100):
+		"""
+		Method to calculate the maximum likelihood estimate of ρ from counted (or weighted) data
+		
+		Args:
+			values(array): Distinct values, the counted data of the instance when None
+			counts(array): Number of occurrences (or weight) of every value
+			tolerance(float): Relative change of ρ at which the Newton iteration stops
+			maxIterations(int): Largest number of Newton iterations
+
+		Returns:
+			self.rho(float): Value of ρ
+
+		Raises:
+			ValueError(string): Raised when every value is 1, where the likelihood grows without bound
+		"""
+		values, counts = self._weighted_data(values,counts)
+		if np.all(values[counts > 0] == 1):
+			raise ValueError("the maximum likelihood estimate of ρ is unbounded when every value is 1")
+
+		observations = counts.sum()
+		#Start from the method of moments, mean = ρ/(ρ-1)
+		mean = np.dot(values,counts) / observations
+		rho = mean / (mean - 1)
+		"""
+		Score: Σ c (1/ρ + ψ(ρ+1) - ψ(k+ρ+1)) = 0, solved by Newton's method in ln ρ
+		"""
+		for i in range(maxIterations):
+			score = observations / rho + np.dot(counts,digamma(rho + 1) - np.asarray(digamma(values + rho + 1)))
+			slope = -observations / rho ** 2 + np.dot(counts,trigamma(rho + 1) - np.asarray(trigamma(values + rho + 1)))
+			step = min(max(score / (rho * slope),-2.0),2.0)
+			rho *= math.exp(-step)
+			if abs(step) < tolerance:
+				break
+		self.rho = float(rho)
+
+		#Calculate mean and standard deviation
+		self.calculate_mean()
+		self.calculate_stdev()
+		return self.rho
+
+	def calculate_log_likelihood(self,values=None,counts=None):
+		"""
+		Method to calculate the log-likelihood of counted data
+		
+		Args:
+			values(array): Distinct values, the counted data of the instance when None
+			counts(array): Number of occurrences of every value
+
+		Returns:
+			loglikelihood(float): Log-likelihood of the data
+		"""
+		values, counts = self._weighted_data(values,counts)
+		"""
+		ℓ(ρ) = Σ c (ln ρ + ln Γ(k) + ln Γ(ρ+1) - ln Γ(k+ρ+1))
+		"""
+		logPmf = math.log(self.rho) + np.asarray(log_gamma(values)) + log_gamma(self.rho + 1) - np.asarray(log_gamma(values + self.rho + 1))
+		return float(np.dot(counts,logPmf))
+
 	def pdf(self,x):
 		"""
 		Method to calculate probability density function for yule simon distribution
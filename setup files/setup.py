@@ -17,6 +17,7 @@ setup(name='mathematica',
         "Operating System :: OS Independent",
     ],
       packages=['mathematica'],
+      install_requires=['numpy'],
       author= 'Ashwin Raj',
       author_email= 'rajashwin733@gmail.com',
       zip_safe=False)